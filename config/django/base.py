@@ -42,6 +42,7 @@ LOCAL_APPS = [
     "promise_tracker.classifiers.apps.ClassifiersConfig",
     "promise_tracker.promises.apps.PromisesConfig",
     "promise_tracker.home.apps.HomeConfig",
+    "promise_tracker.notifications.apps.NotificationsConfig",
 ]
 
 THIRD_PARTY_APPS = [
@@ -65,6 +66,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "promise_tracker.common.middleware.RequestTracingMiddleware",
+    "promise_tracker.common.middleware.RequestTelemetryMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
@@ -73,7 +76,10 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "promise_tracker.common.middleware.RequestProfilerMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
+    "promise_tracker.common.middleware.SessionFreeMiddleware",
+    "promise_tracker.common.middleware.ReplicaPinningMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
@@ -81,7 +87,8 @@ ROOT_URLCONF = "config.urls"
 
 TEMPLATES = [
     {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "BACKEND": "promise_tracker.core.telemetry.TimedDjangoTemplates",
+        "NAME": "django",
         "DIRS": [os.path.join(APPS_DIR, "templates")],
         "APP_DIRS": True,
         "OPTIONS": {
@@ -102,13 +109,45 @@ WSGI_APPLICATION = "config.wsgi.application"
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
 DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": str(BASE_DIR.path("db.sqlite3")),
-    }
+    "default": env.db("DATABASE_URL", default=f"sqlite:///{BASE_DIR.path('db.sqlite3')}"),
 }
 DATABASES["default"]["ATOMIC_REQUESTS"] = True
 
+if DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql":
+    # https://docs.djangoproject.com/en/5.2/ref/databases/#connection-pool
+    DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+
+    if env.bool("DATABASE_POOL_ENABLED", default=True):
+        DATABASES["default"]["CONN_MAX_AGE"] = 0
+        DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+            "min_size": env.int("DATABASE_POOL_MIN_SIZE", default=2),
+            "max_size": env.int("DATABASE_POOL_MAX_SIZE", default=10),
+            "timeout": env.int("DATABASE_POOL_TIMEOUT", default=10),
+        }
+    else:
+        DATABASES["default"]["CONN_MAX_AGE"] = env.int("DATABASE_CONN_MAX_AGE", default=60)
+
+# SQLite allows a single writer, so instead of holding a write transaction for the whole request, requests run
+# in autocommit and services write through short BEGIN IMMEDIATE transactions serialized per process
+SQLITE_WRITE_SERIALIZATION_ENABLED = env.bool("SQLITE_WRITE_SERIALIZATION_ENABLED", default=False)
+
+if DATABASES["default"]["ENGINE"] == "django.db.backends.sqlite3" and SQLITE_WRITE_SERIALIZATION_ENABLED:
+    DATABASES["default"]["ATOMIC_REQUESTS"] = False
+    DATABASES["default"].setdefault("OPTIONS", {})["transaction_mode"] = "IMMEDIATE"
+
+# Reads of promises and classifiers in safe requests go to the replica, see promise_tracker.core.routers
+if env.str("DATABASE_REPLICA_URL", default=""):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        **env.db("DATABASE_REPLICA_URL"),
+        "ATOMIC_REQUESTS": False,
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_ROUTERS = ["promise_tracker.core.routers.ReplicaRouter"]
+
+DATABASE_REPLICA_PIN_SECONDS = env.int("DATABASE_REPLICA_PIN_SECONDS", default=10)
+DATABASE_REPLICA_PIN_COOKIE_NAME = "replica_pinned"
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -188,9 +227,17 @@ LoggersSetup.setup_loguru()
 
 # Extra settings imports
 
+from config.settings.caches import *  # noqa
 from config.settings.celery import *  # noqa
 from config.settings.cors import *  # noqa
 from config.settings.email_sending import *  # noqa
 from config.settings.files_and_storages import *  # noqa
+from config.settings.notifications import *  # noqa
+from config.settings.passwords import *  # noqa
+from config.settings.profiling import *  # noqa
+from config.settings.review_queue import *  # noqa
 from config.settings.sessions import *  # noqa
+from config.settings.sqlite import *  # noqa
+from config.settings.telemetry import *  # noqa
+from config.settings.tracing import *  # noqa
 from config.settings.users import *  # noqa
@@ -0,0 +1,6 @@
+from config.env import env
+
+# Accepts any django-environ cache URL, e.g. locmemcache://, dbcache://cache_table or redis://redis:6379/0
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://"),
+}
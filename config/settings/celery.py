@@ -1,4 +1,6 @@
 from config.env import env
+from config.settings.email_sending import EMAIL_BATCH_INTERVAL_SECONDS
+from config.settings.notifications import NOTIFICATION_DIGEST_INTERVAL_MINUTES
 
 # https://docs.celeryproject.org/en/stable/userguide/configuration.html
 
@@ -15,3 +17,31 @@ CELERY_TASK_SOFT_TIME_LIMIT = env.int("CELERY_TASK_SOFT_TIME_LIMIT", default=20)
 CELERY_TASK_TIME_LIMIT = env.int("CELERY_TASK_TIME_LIMIT", default=30)
 CELERY_TASK_MAX_RETRIES = env.int("CELERY_TASK_MAX_RETRIES", default=3)
 CELERY_TASK_DEFAULT_RETRY_DELAY = env.int("CELERY_TASK_DEFAULT_RETRY_DELAY", default=5)
+
+OUTBOX_RELAY_BATCH_SIZE = env.int("OUTBOX_RELAY_BATCH_SIZE", default=100)
+OUTBOX_RELAY_INTERVAL_SECONDS = env.int("OUTBOX_RELAY_INTERVAL_SECONDS", default=5)
+OUTBOX_MAX_ATTEMPTS = env.int("OUTBOX_MAX_ATTEMPTS", default=5)
+OUTBOX_RETENTION_DAYS = env.int("OUTBOX_RETENTION_DAYS", default=7)
+
+CELERY_BEAT_SCHEDULE = {
+    "relay-outbox": {
+        "task": "relay_outbox_task",
+        "schedule": OUTBOX_RELAY_INTERVAL_SECONDS,
+    },
+    "send-email-batch": {
+        "task": "send_email_batch_task",
+        "schedule": EMAIL_BATCH_INTERVAL_SECONDS,
+    },
+    "send-review-digests": {
+        "task": "send_review_digests_task",
+        "schedule": NOTIFICATION_DIGEST_INTERVAL_MINUTES * 60,
+    },
+    "purge-outbox": {
+        "task": "purge_outbox_task",
+        "schedule": 60 * 60 * 24,
+    },
+    "clear-expired-sessions": {
+        "task": "clear_expired_sessions_task",
+        "schedule": 60 * 60 * 24,
+    },
+}
@@ -11,3 +11,10 @@ EMAIL_SENDER = env.str("EMAIL_SENDER", default=EMAIL_HOST_USER)
 EMAIL_USE_TLS = env.bool("EMAIL_USE_TLS", default=False)
 EMAIL_USE_SSL = env.bool("EMAIL_USE_SSL", default=True)
 EMAIL_SENDING_DELAY_MINUTES = env.int("EMAIL_SENDING_DELAY_MINUTES", default=2)
+
+EMAIL_BATCH_SIZE = env.int("EMAIL_BATCH_SIZE", default=50)
+EMAIL_BATCH_INTERVAL_SECONDS = env.int("EMAIL_BATCH_INTERVAL_SECONDS", default=10)
+EMAIL_MAX_PER_SECOND = env.int("EMAIL_MAX_PER_SECOND", default=10)
+EMAIL_MAX_ATTEMPTS = env.int("EMAIL_MAX_ATTEMPTS", default=5)
+EMAIL_RETRY_DELAY_SECONDS = env.int("EMAIL_RETRY_DELAY_SECONDS", default=60)
+EMAIL_CLAIM_TIMEOUT_SECONDS = env.int("EMAIL_CLAIM_TIMEOUT_SECONDS", default=300)
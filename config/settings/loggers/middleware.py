@@ -1,24 +0,0 @@
-import time
-
-from loguru import logger
-
-
-class LoguruMiddleware:
-    def __init__(self, get_response):
-        self.get_response = get_response
-
-    def __call__(self, request):
-        start = time.time()
-        response = self.get_response(request)
-        duration = round((time.time() - start) * 1000, 2)
-
-        logger.info(
-            "request",
-            method=request.method,
-            path=request.path,
-            status=response.status_code,
-            duration_ms=duration,
-            user=str(request.user) if request.user.is_authenticated else "anonymous",
-        )
-
-        return response
\ No newline at end of file
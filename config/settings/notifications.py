@@ -0,0 +1,4 @@
+from config.env import env
+
+NOTIFICATION_DIGEST_BATCH_SIZE = env.int("NOTIFICATION_DIGEST_BATCH_SIZE", default=5000)
+NOTIFICATION_DIGEST_INTERVAL_MINUTES = env.int("NOTIFICATION_DIGEST_INTERVAL_MINUTES", default=60)
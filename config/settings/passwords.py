@@ -0,0 +1,16 @@
+from config.env import env
+
+# PBKDF2 keeps a core busy for the whole hash, so a burst of logins or signups can take every worker. Each process
+# hashes at most this many passwords at once (0 disables the limit), the remaining threads keep serving pages.
+PASSWORD_HASHING_MAX_CONCURRENCY = env.int("PASSWORD_HASHING_MAX_CONCURRENCY", default=1)
+
+# How long a request waits for a free hashing slot before it is turned away
+PASSWORD_HASHING_WAIT_SECONDS = env.float("PASSWORD_HASHING_WAIT_SECONDS", default=2.0)
+
+PASSWORD_HASHERS = [
+    "promise_tracker.authentication.hashers.BoundedPBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
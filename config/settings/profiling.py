@@ -0,0 +1,10 @@
+import os
+
+from config.env import BASE_DIR, env
+
+# Administrators can profile a request with ?profile=1 or an "X-Profile: 1" header, see /core/profiles/
+REQUEST_PROFILING_ENABLED = env.bool("REQUEST_PROFILING_ENABLED", default=False)
+
+REQUEST_PROFILING_DIR = env.str("REQUEST_PROFILING_DIR", default=os.path.join(BASE_DIR, "profiles"))
+REQUEST_PROFILING_MAX_PER_HOUR = env.int("REQUEST_PROFILING_MAX_PER_HOUR", default=30)
+REQUEST_PROFILING_MAX_STORED = env.int("REQUEST_PROFILING_MAX_STORED", default=100)
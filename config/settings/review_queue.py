@@ -0,0 +1,4 @@
+from config.env import env
+
+REVIEW_QUEUE_BATCH_SIZE = env.int("REVIEW_QUEUE_BATCH_SIZE", default=10)
+REVIEW_QUEUE_LEASE_MINUTES = env.int("REVIEW_QUEUE_LEASE_MINUTES", default=15)
@@ -1,9 +1,13 @@
 from config.env import env
 
+SESSION_ENGINE = env.str("SESSION_ENGINE", default="django.contrib.sessions.backends.cached_db")
+
 SESSION_COOKIE_AGE = env.int("SESSION_COOKIE_AGE", default=1209600)  # Default - 2 weeks in seconds
 SESSION_COOKIE_HTTPONLY = env.bool("SESSION_COOKIE_HTTPONLY", default=True)
 SESSION_COOKIE_NAME = env("SESSION_COOKIE_NAME", default="sessionid")
 SESSION_COOKIE_SAMESITE = env("SESSION_COOKIE_SAMESITE", default="Lax")
 SESSION_COOKIE_SECURE = env.bool("SESSION_COOKIE_SECURE", default=False)
 
-CSRF_USE_SESSIONS = env.bool("CSRF_USE_SESSIONS", default=True)
\ No newline at end of file
+CSRF_USE_SESSIONS = env.bool("CSRF_USE_SESSIONS", default=True)
+
+SESSION_FREE_CACHE_MAX_AGE = env.int("SESSION_FREE_CACHE_MAX_AGE", default=60)
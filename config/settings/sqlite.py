@@ -0,0 +1,15 @@
+from config.env import env
+
+# Opt-in tuning for SQLite deployments with concurrent readers and writers, see https://sqlite.org/pragma.html
+SQLITE_TUNING_ENABLED = env.bool("SQLITE_TUNING_ENABLED", default=False)
+
+SQLITE_JOURNAL_MODE = env.str("SQLITE_JOURNAL_MODE", default="WAL")
+SQLITE_SYNCHRONOUS = env.str("SQLITE_SYNCHRONOUS", default="NORMAL")
+SQLITE_BUSY_TIMEOUT_MS = env.int("SQLITE_BUSY_TIMEOUT_MS", default=5000)
+SQLITE_MMAP_SIZE = env.int("SQLITE_MMAP_SIZE", default=268435456)  # 256 MB
+SQLITE_CACHE_SIZE = env.int("SQLITE_CACHE_SIZE", default=-64000)  # Negative values are in KiB, i.e. 64 MB
+SQLITE_TEMP_STORE = env.str("SQLITE_TEMP_STORE", default="MEMORY")
+
+# BEGIN IMMEDIATE avoids "database is locked" when a read transaction is upgraded to a write, but with
+# ATOMIC_REQUESTS it also serializes read-only requests, so it is left to the deployment to decide
+SQLITE_TRANSACTION_MODE = env.str("SQLITE_TRANSACTION_MODE", default="")
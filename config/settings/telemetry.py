@@ -0,0 +1,17 @@
+from config.env import env
+
+# Per-request query counts and timings for the request log, the Server-Timing header of administrators and /metrics
+REQUEST_TELEMETRY_ENABLED = env.bool("REQUEST_TELEMETRY_ENABLED", default=True)
+
+# /metrics is only served when a token is set, Prometheus sends it as "Authorization: Bearer <token>"
+REQUEST_METRICS_TOKEN = env.str("REQUEST_METRICS_TOKEN", default="")
+
+# With several worker processes each keeps its own metrics, set a directory shared by the workers (and emptied on
+# deploys) so a scrape that lands on any of them reports the totals of all
+REQUEST_METRICS_DIR = env.str("REQUEST_METRICS_DIR", default="")
+REQUEST_METRICS_FLUSH_SECONDS = env.float("REQUEST_METRICS_FLUSH_SECONDS", default=5.0)
+
+# Queries slower than the threshold are logged with their caller, a sample of them also with their query plan
+SLOW_QUERY_LOG_ENABLED = env.bool("SLOW_QUERY_LOG_ENABLED", default=True)
+SLOW_QUERY_THRESHOLD_MS = env.float("SLOW_QUERY_THRESHOLD_MS", default=200)
+SLOW_QUERY_EXPLAIN_SAMPLE_RATE = env.float("SLOW_QUERY_EXPLAIN_SAMPLE_RATE", default=0.1)
@@ -0,0 +1,18 @@
+from config.env import env
+
+# Spans of requests, service and selector calls, queries and Celery tasks, linked across the broker by the W3C
+# traceparent header. Off by default, a sampled request costs a span per query.
+TRACING_ENABLED = env.bool("TRACING_ENABLED", default=False)
+
+# Share of the traces started here that are recorded, tasks with a traceparent keep the decision of their publisher
+TRACING_SAMPLE_RATE = env.float("TRACING_SAMPLE_RATE", default=0.05)
+
+# Requests keep the sampling decision of their traceparent header only when it comes from a trusted upstream, such
+# as a proxy that replaces the header of clients. Otherwise they join the trace but are sampled at TRACING_SAMPLE_RATE.
+TRACING_TRUSTED_PARENT = env.bool("TRACING_TRUSTED_PARENT", default=False)
+
+# "console" logs every span as a structured "span" line, "file" appends them as JSON lines to TRACING_FILE_PATH
+TRACING_EXPORTER = env.str("TRACING_EXPORTER", default="console")
+TRACING_FILE_PATH = env.str("TRACING_FILE_PATH", default="traces/spans.jsonl")
+
+TRACING_MAX_SPANS_PER_TRACE = env.int("TRACING_MAX_SPANS_PER_TRACE", default=500)
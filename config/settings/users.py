@@ -2,3 +2,10 @@ from config.env import env
 
 VERIFICATION_CODE_EXPIRY_MINUTES = env.int("VERIFICATION_CODE_EXPIRY_MINUTES", default=30)
 VERIFICATION_CODE_LENGTH = env.int("VERIFICATION_CODE_LENGTH", default=6)
+
+# Bulk moderation jobs update this many users per transaction
+USER_MODERATION_CHUNK_SIZE = env.int("USER_MODERATION_CHUNK_SIZE", default=500)
+USER_MODERATION_JOB_MAX_USERS = env.int("USER_MODERATION_JOB_MAX_USERS", default=10000)
+# A job moderates up to USER_MODERATION_JOB_MAX_USERS users, far longer than the default task limits allow
+USER_MODERATION_JOB_SOFT_TIME_LIMIT = env.int("USER_MODERATION_JOB_SOFT_TIME_LIMIT", default=300)
+USER_MODERATION_JOB_TIME_LIMIT = env.int("USER_MODERATION_JOB_TIME_LIMIT", default=330)
@@ -22,6 +22,8 @@ from django.urls import include, path
 
 from promise_tracker.authentication import urls as authentication_urls
 from promise_tracker.classifiers import urls as classifiers_urls
+from promise_tracker.core import urls as core_urls
+from promise_tracker.core.views import metrics
 from promise_tracker.home import urls as home_urls
 from promise_tracker.promises import urls as promises_urls
 from promise_tracker.users import urls as users_urls
@@ -36,5 +38,9 @@ urlpatterns = i18n_patterns(
     path("users/", include(users_urls)),
     path("promises/", include((promises_urls))),
     path("classifiers/", include(classifiers_urls)),
+    path("core/", include(core_urls)),
     path("i18n/", include("django.conf.urls.i18n")),
 ) + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+
+# Scraped by Prometheus, so it is not language prefixed
+urlpatterns += [path("metrics", metrics, name="metrics")]
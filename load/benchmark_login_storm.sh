@@ -0,0 +1,95 @@
+#!/usr/bin/env bash
+# Measures page latency while a login storm keeps the password hasher busy: sync workers hashing without a limit
+# against gthread workers with PASSWORD_HASHING_MAX_CONCURRENCY. Each profile runs the page viewers alone first
+# and then together with the storm, and the results are printed side by side.
+#
+# Usage: load/benchmark_login_storm.sh
+
+set -euo pipefail
+
+cd "$(dirname "$0")/.."
+
+SQLITE_PATH="${SQLITE_PATH:-/tmp/promise_tracker_login_storm.sqlite3}"
+
+USERS="${USERS:-20}"
+SPAWN_RATE="${SPAWN_RATE:-10}"
+RUN_TIME="${RUN_TIME:-30s}"
+WORKERS="${WORKERS:-4}"
+THREADS="${THREADS:-4}"
+PROMISES="${PROMISES:-500}"
+PORT="${PORT:-8767}"
+RESULTS_DIR="${RESULTS_DIR:-load/results}"
+
+export DJANGO_DEBUG=False
+export DATABASE_URL="sqlite:///${SQLITE_PATH}"
+export SQLITE_TUNING_ENABLED=True
+
+mkdir -p "$RESULTS_DIR"
+
+rm -f "$SQLITE_PATH" "${SQLITE_PATH}-wal" "${SQLITE_PATH}-shm"
+
+python manage.py collectstatic --noinput >/dev/null
+python manage.py migrate --noinput >/dev/null
+python manage.py seed_database --promises "$PROMISES" --seed 1 >/dev/null 2>&1
+python manage.py shell -c "
+from promise_tracker.users.tests.factories import AdminUserFactory
+AdminUserFactory.create(email='bench-admin-0@example.com')
+" >/dev/null
+
+run_profile() {
+    local name="$1"
+    local max_concurrency="$2"
+    shift 2
+
+    echo "==> ${name}: PASSWORD_HASHING_MAX_CONCURRENCY=${max_concurrency} gunicorn $*"
+
+    export PASSWORD_HASHING_MAX_CONCURRENCY="$max_concurrency"
+
+    if curl --silent --output /dev/null "http://127.0.0.1:${PORT}/"; then
+        echo "Port ${PORT} is already in use" >&2
+        exit 1
+    fi
+
+    gunicorn config.wsgi:application --workers "$WORKERS" --bind "127.0.0.1:${PORT}" --log-level warning "$@" \
+        >"${RESULTS_DIR}/${name}_server.log" 2>&1 &
+    local server_pid=$!
+    trap 'kill "$server_pid" 2>/dev/null || true; wait "$server_pid" 2>/dev/null || true' RETURN
+
+    until curl --silent --output /dev/null "http://127.0.0.1:${PORT}/"; do
+        sleep 0.5
+    done
+
+    # Page viewers alone, then the same number of page viewers next to as many login stormers
+    locust -f load/login_storm_locustfile.py --headless --only-summary \
+        --users "$USERS" --spawn-rate "$SPAWN_RATE" --run-time "$RUN_TIME" \
+        --host "http://127.0.0.1:${PORT}" --csv "${RESULTS_DIR}/${name}_calm" PageViewer \
+        >/dev/null 2>&1 || true
+
+    locust -f load/login_storm_locustfile.py --headless --only-summary \
+        --users "$((USERS * 2))" --spawn-rate "$SPAWN_RATE" --run-time "$RUN_TIME" \
+        --host "http://127.0.0.1:${PORT}" --csv "${RESULTS_DIR}/${name}_storm" PageViewer LoginStormer \
+        >/dev/null 2>&1 || true
+}
+
+run_profile login_sync_unbounded 0 --worker-class sync
+run_profile login_gthread_bounded 1 --worker-class gthread --threads "$THREADS"
+
+python - "$RESULTS_DIR" <<'PY'
+import csv
+import sys
+from pathlib import Path
+
+results_dir = Path(sys.argv[1])
+columns = ["Request Count", "Failure Count", "Requests/s", "50%", "95%", "99%"]
+
+print(f"\n{'profile':<30}{'endpoint':<28}" + "".join(f"{column:>15}" for column in columns))
+
+for profile in ("login_sync_unbounded", "login_gthread_bounded"):
+    for phase in ("calm", "storm"):
+        with open(results_dir / f"{profile}_{phase}_stats.csv") as stats_file:
+            for row in csv.DictReader(stats_file):
+                print(
+                    f"{profile + ' ' + phase:<30}{row['Name'][:27]:<28}"
+                    + "".join(f"{float(row[column]):>15.1f}" for column in columns)
+                )
+PY
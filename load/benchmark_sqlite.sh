@@ -0,0 +1,92 @@
+#!/usr/bin/env bash
+# Runs guest readers and reviewers against SQLite with the default settings, with SQLITE_TUNING_ENABLED,
+# with BEGIN IMMEDIATE transactions and with serialized service writes on top, then prints the aggregated
+# results side by side.
+#
+# Usage: load/benchmark_sqlite.sh
+
+set -euo pipefail
+
+cd "$(dirname "$0")/.."
+
+SQLITE_PATH="${SQLITE_PATH:-/tmp/promise_tracker_sqlite_bench.sqlite3}"
+
+USERS="${USERS:-40}"
+SPAWN_RATE="${SPAWN_RATE:-10}"
+RUN_TIME="${RUN_TIME:-1m}"
+WORKERS="${WORKERS:-4}"
+PROMISES="${PROMISES:-1000}"
+PORT="${PORT:-8766}"
+RESULTS_DIR="${RESULTS_DIR:-load/results}"
+
+export DJANGO_DEBUG=False
+export DATABASE_URL="sqlite:///${SQLITE_PATH}"
+
+mkdir -p "$RESULTS_DIR"
+
+run_profile() {
+    local name="$1"
+    local tuning_enabled="$2"
+    local transaction_mode="$3"
+    local write_serialization_enabled="$4"
+
+    echo "==> ${name}: SQLITE_TUNING_ENABLED=${tuning_enabled} SQLITE_TRANSACTION_MODE=${transaction_mode}" \
+        "SQLITE_WRITE_SERIALIZATION_ENABLED=${write_serialization_enabled}"
+
+    export SQLITE_TUNING_ENABLED="$tuning_enabled"
+    export SQLITE_TRANSACTION_MODE="$transaction_mode"
+    export SQLITE_WRITE_SERIALIZATION_ENABLED="$write_serialization_enabled"
+
+    # WAL mode is persisted in the database file, so every profile starts from a fresh one
+    rm -f "$SQLITE_PATH" "${SQLITE_PATH}-wal" "${SQLITE_PATH}-shm"
+
+    python manage.py migrate --noinput >/dev/null
+    python manage.py seed_database --promises "$PROMISES" --seed 1 >/dev/null 2>&1
+    python manage.py shell -c "
+from promise_tracker.users.tests.factories import AdminUserFactory
+for i in range(${USERS}):
+    AdminUserFactory.create(email=f'bench-admin-{i}@example.com')
+" >/dev/null
+
+    if curl --silent --output /dev/null "http://127.0.0.1:${PORT}/"; then
+        echo "Port ${PORT} is already in use" >&2
+        exit 1
+    fi
+
+    gunicorn config.wsgi:application --workers "$WORKERS" --bind "127.0.0.1:${PORT}" --log-level warning \
+        >"${RESULTS_DIR}/${name}_server.log" 2>&1 &
+    local server_pid=$!
+    trap 'kill "$server_pid" 2>/dev/null || true; wait "$server_pid" 2>/dev/null || true' RETURN
+
+    until curl --silent --output /dev/null "http://127.0.0.1:${PORT}/"; do
+        sleep 0.5
+    done
+
+    locust -f load/review_locustfile.py --headless --only-summary \
+        --users "$USERS" --spawn-rate "$SPAWN_RATE" --run-time "$RUN_TIME" \
+        --host "http://127.0.0.1:${PORT}" --csv "${RESULTS_DIR}/${name}" \
+        || echo "Locust reported failed requests for ${name}"
+}
+
+python manage.py collectstatic --noinput >/dev/null
+
+run_profile sqlite_default False "" False
+run_profile sqlite_tuned True "" False
+run_profile sqlite_immediate True IMMEDIATE False
+run_profile sqlite_serialized True "" True
+
+python - "$RESULTS_DIR" <<'PY'
+import csv
+import sys
+from pathlib import Path
+
+results_dir = Path(sys.argv[1])
+columns = ["Request Count", "Failure Count", "Requests/s", "50%", "95%", "99%"]
+
+print(f"\n{'profile':<19}{'endpoint':<32}" + "".join(f"{column:>15}" for column in columns))
+
+for profile in ("sqlite_default", "sqlite_tuned", "sqlite_immediate", "sqlite_serialized"):
+    with open(results_dir / f"{profile}_stats.csv") as stats_file:
+        for row in csv.DictReader(stats_file):
+            print(f"{profile:<19}{row['Name'][:31]:<32}" + "".join(f"{float(row[column]):>15.1f}" for column in columns))
+PY
@@ -0,0 +1,107 @@
+# Compares random (v4) and time-ordered (v7) UUID primary keys: insert throughput while the table grows
+# and the size of the primary key index afterwards. Runs against the database from DATABASE_URL.
+#
+# Usage: DATABASE_URL=sqlite:////tmp/uuid_bench.sqlite3 python load/benchmark_uuid_keys.py [--rows 2000000]
+
+import argparse
+import os
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import django
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.django.base")
+django.setup()
+
+from django.db import connection, models, transaction  # noqa: E402
+from django.db.models import Field  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+from promise_tracker.common.uuids import uuid7  # noqa: E402
+
+GENERATORS = {"uuid4": uuid.uuid4, "uuid7": uuid7}
+
+
+class BenchmarkRow(models.Model):
+    id: Field = models.UUIDField(primary_key=True)
+    created_at: Field = models.DateTimeField()
+    payload: Field = models.CharField(max_length=64)
+
+    class Meta:
+        app_label = "benchmarks"
+        db_table = "benchmark_uuid_keys"
+
+
+def get_index_size_bytes() -> int:
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute(
+                "SELECT pg_relation_size(indexrelid) FROM pg_index WHERE indrelid = %s::regclass AND indisprimary",
+                [BenchmarkRow._meta.db_table],
+            )
+        else:
+            cursor.execute(
+                "SELECT SUM(pgsize) FROM dbstat WHERE name = %s",
+                [f"sqlite_autoindex_{BenchmarkRow._meta.db_table}_1"],
+            )
+
+        return cursor.fetchone()[0]
+
+
+def run(name: str, rows: int, batch_size: int) -> dict[str, float]:
+    generate_id = GENERATORS[name]
+
+    with connection.schema_editor() as schema_editor:
+        schema_editor.create_model(BenchmarkRow)
+
+    try:
+        started_at = time.perf_counter()
+        last_batch_seconds = 0.0
+
+        for offset in range(0, rows, batch_size):
+            batch = [
+                BenchmarkRow(id=generate_id(), created_at=timezone.now(), payload=f"row {offset + i}")
+                for i in range(min(batch_size, rows - offset))
+            ]
+
+            batch_started_at = time.perf_counter()
+
+            with transaction.atomic():
+                BenchmarkRow.objects.bulk_create(batch)
+
+            last_batch_seconds = time.perf_counter() - batch_started_at
+
+        total_seconds = time.perf_counter() - started_at
+
+        return {
+            "rows/s": rows / total_seconds,
+            "last batch rows/s": len(batch) / last_batch_seconds,
+            "pk index MB": get_index_size_bytes() / 1024 / 1024,
+        }
+    finally:
+        with connection.schema_editor() as schema_editor:
+            schema_editor.delete_model(BenchmarkRow)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(f"{connection.vendor}, {args.rows} rows in batches of {args.batch_size}")
+
+    results = {name: run(name, args.rows, args.batch_size) for name in GENERATORS}
+    columns = list(next(iter(results.values())))
+
+    print(f"{'generator':<12}" + "".join(f"{column:>20}" for column in columns))
+
+    for name, result in results.items():
+        print(f"{name:<12}" + "".join(f"{result[column]:>20.1f}" for column in columns))
+
+
+if __name__ == "__main__":
+    main()
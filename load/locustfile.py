@@ -1,13 +1,340 @@
-from locust import HttpUser, between, task
+# Load test of the main flows of guests, registered users and administrators, run in the traffic mix of the request
+# logs. Meant for a dataset from `seed_database --bulk`, whose users log in with the shared bulk password.
+#
+# Usage: locust -f load/locustfile.py --headless --users 50 --spawn-rate 10 --run-time 5m --host http://localhost:8000
+#
+# The role and task weights are read from load/traffic_mix.json (or TRAFFIC_MIX), which load/traffic_mix.py derives
+# from the request logs. A headless run exits with 1 when a request name breaches the p95 SLO or the share of failed
+# requests breaches the error rate SLO.
 
+import json
+import logging
+import os
+import random
+import re
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from itertools import count
+from pathlib import Path
+from uuid import uuid4
 
-class PromiseListUser(HttpUser):
-    wait_time = between(0.5, 2)
+from locust import HttpUser, between, events
+from locust.exception import StopUser
 
-    @task(5)
-    def list_promises(self):
-        self.client.get("/promises/promises/")
+PROMISES_URL = "/lv/promises/promises/"
+LOGIN_URL = "/lv/auth/login/"
+REVIEW_QUEUE_URL = "/lv/promises/reviews/"
 
-    @task(1)
-    def list_promises_page(self):
-        self.client.get("/promises/promises/?page=2")
+CSRF_TOKEN_RE = re.compile(r'name="csrfmiddlewaretoken" value="([^"]+)"')
+PROMISE_LINK_RE = re.compile(r'href="/lv/promises/promises/([0-9a-f-]{36})/"')
+ADD_RESULT_LINK_RE = re.compile(r'href="(/lv/promises/promises/[0-9a-f-]{36}/add/)"')
+APPROVE_ACTION_RE = re.compile(r'action="([^"]+/reviews/(?:promises|results)/[^"]+/approve/)"')
+OPTION_RE = re.compile(r'<option value="([0-9a-f-]{36})"')
+
+USER_EMAIL_TEMPLATE = os.environ.get("LOAD_USER_EMAIL_TEMPLATE", "user{}@example.com")
+USER_COUNT = int(os.environ.get("LOAD_USER_COUNT", 100))
+ADMIN_EMAIL_TEMPLATE = os.environ.get("LOAD_ADMIN_EMAIL_TEMPLATE", "admin{}@example.com")
+ADMIN_COUNT = int(os.environ.get("LOAD_ADMIN_COUNT", 3))
+PASSWORD = os.environ.get("LOAD_PASSWORD", "Benchmark-Password-1")
+LOGIN_ATTEMPTS = 3
+
+SLO_P95_MS = float(os.environ.get("SLO_P95_MS", 1000))
+SLO_ERROR_RATE = float(os.environ.get("SLO_ERROR_RATE", 0.01))
+
+TRAFFIC_MIX_PATH = Path(os.environ.get("TRAFFIC_MIX", Path(__file__).with_name("traffic_mix.json")))
+
+# Used until a traffic mix is derived from the logs: a read-mostly public site, where few visitors log in
+DEFAULT_TRAFFIC_MIX: dict = {
+    "roles": {
+        "guest": {
+            "weight": 85,
+            "tasks": {"promise_list": 40, "promise_list_htmx": 25, "promise_detail": 25, "analytics": 10},
+        },
+        "registered": {
+            "weight": 12,
+            "tasks": {
+                "promise_list": 30,
+                "promise_detail": 25,
+                "my_promises": 15,
+                "my_results": 10,
+                "create_promise": 10,
+                "create_result": 10,
+            },
+        },
+        "admin": {
+            "weight": 3,
+            "tasks": {"review_queue": 50, "result_list": 20, "promise_list": 20, "promise_detail": 10},
+        },
+    }
+}
+
+user_numbers = count()
+admin_numbers = count()
+
+# Yesterday, so a server in an earlier time zone does not see a date in the future
+ENTRY_DATE = (date.today() - timedelta(days=1)).isoformat()
+
+# Kept per account, since logged in users also see promises of theirs that nobody else may open yet
+promise_ids: dict[str, list[str]] = defaultdict(list)
+party_ids: list[str] = []
+# Party and convocation pairs of listed promises, which the services accept for new promises
+elected_pairs: list[tuple[str, str]] = []
+
+
+def _csrf_token(html: str) -> str:
+    match = CSRF_TOKEN_RE.search(html)
+    return match.group(1) if match else ""
+
+
+def _select_options(html: str, name: str) -> list[str]:
+    match = re.search(rf'<select name="{name}"[^>]*>(.*?)</select>', html, re.S)
+    return OPTION_RE.findall(match.group(1)) if match else []
+
+
+def _remember_promises(account: str, html: str) -> None:
+    known_ids = promise_ids[account]
+
+    for promise_id in PROMISE_LINK_RE.findall(html):
+        if len(known_ids) < 1000:
+            known_ids.append(promise_id)
+        else:
+            known_ids[random.randrange(len(known_ids))] = promise_id
+
+
+class ReaderTasks(HttpUser):
+    abstract = True
+    wait_time = between(1, 5)
+    role: str
+    account = "guest"
+
+    def promise_list(self):
+        response = self.client.get(PROMISES_URL)
+        _remember_promises(self.account, response.text)
+
+        if not party_ids:
+            party_ids.extend(_select_options(response.text, "party"))
+
+    def promise_list_htmx(self):
+        # Filtering and paging swap in the cards only
+        params = {"page": random.randint(1, 3)}
+
+        if party_ids:
+            params["party"] = random.choice(party_ids)
+
+        response = self.client.get(
+            PROMISES_URL, params=params, headers={"HX-Request": "true"}, name=f"{PROMISES_URL} [htmx]"
+        )
+        _remember_promises(self.account, response.text)
+
+    def promise_detail(self):
+        if not promise_ids[self.account]:
+            self.promise_list()
+            return
+
+        self.client.get(f"{PROMISES_URL}{random.choice(promise_ids[self.account])}/", name=f"{PROMISES_URL}[id]/")
+
+    def analytics(self):
+        self.client.get("/lv/promises/analytics/")
+
+    def result_list(self):
+        self.client.get("/lv/promises/results/")
+
+
+class LoggedInTasks(ReaderTasks):
+    abstract = True
+    email_template: str
+    account_count: int
+    account_numbers: count
+
+    def on_start(self):
+        email = self.email_template.format(next(self.account_numbers) % self.account_count)
+        self.account = email
+
+        for _ in range(LOGIN_ATTEMPTS):
+            login_page = self.client.get(LOGIN_URL)
+
+            with self.client.post(
+                LOGIN_URL,
+                {"email": email, "password": PASSWORD, "csrfmiddlewaretoken": _csrf_token(login_page.text)},
+                catch_response=True,
+            ) as response:
+                # A failed login renders the form again instead of redirecting, also when no hashing slot was free
+                if not response.url.endswith(LOGIN_URL):
+                    return
+
+                response.failure(f"{email} could not log in")
+
+            time.sleep(random.uniform(1, 3))
+
+        # The tasks of a user that is not logged in would only add 403 responses
+        raise StopUser()
+
+
+class GuestUser(ReaderTasks):
+    role = "guest"
+
+
+class RegisteredUser(LoggedInTasks):
+    role = "registered"
+    email_template = USER_EMAIL_TEMPLATE
+    account_count = USER_COUNT
+    account_numbers = user_numbers
+
+    def my_promises(self):
+        self.client.get(PROMISES_URL, params={"is_mine": "true"}, name=f"{PROMISES_URL}?is_mine")
+
+    def my_results(self):
+        self.client.get("/lv/promises/results/mine/")
+
+    def _find_elected_pair(self, form_html: str) -> tuple[str, str] | None:
+        if len(elected_pairs) >= 10:
+            return random.choice(elected_pairs)
+
+        parties = _select_options(form_html, "party")
+        convocations = _select_options(form_html, "convocation")
+
+        if not parties or not convocations:
+            return None
+
+        for _ in range(5):
+            pair = (random.choice(parties), random.choice(convocations))
+            response = self.client.get(
+                PROMISES_URL,
+                params={"party": pair[0], "convocation": pair[1]},
+                headers={"HX-Request": "true"},
+                name=f"{PROMISES_URL} [htmx]",
+            )
+
+            if PROMISE_LINK_RE.search(response.text):
+                elected_pairs.append(pair)
+                return pair
+
+        return random.choice(elected_pairs) if elected_pairs else None
+
+    def create_promise(self):
+        form = self.client.get(f"{PROMISES_URL}create/")
+        pair = self._find_elected_pair(form.text)
+
+        if pair is None:
+            return
+
+        with self.client.post(
+            f"{PROMISES_URL}create/",
+            {
+                "name": f"Load test promise {uuid4()}",
+                "description": "Created by the load test",
+                "sources": "https://example.com/load-test",
+                "date": ENTRY_DATE,
+                "party": pair[0],
+                "convocation": pair[1],
+                "csrfmiddlewaretoken": _csrf_token(form.text),
+            },
+            catch_response=True,
+        ) as response:
+            # A rejected form renders again instead of redirecting to the new promise
+            if response.url.endswith(f"{PROMISES_URL}create/"):
+                response.failure("the promise was not created")
+
+    def create_result(self):
+        if not promise_ids[self.account]:
+            self.promise_list()
+            return
+
+        detail = self.client.get(
+            f"{PROMISES_URL}{random.choice(promise_ids[self.account])}/", name=f"{PROMISES_URL}[id]/"
+        )
+        match = ADD_RESULT_LINK_RE.search(detail.text)
+
+        # Promises with a final result take no more results
+        if match is None:
+            return
+
+        form = self.client.get(match.group(1), name=f"{PROMISES_URL}[id]/add/")
+
+        with self.client.post(
+            match.group(1),
+            {
+                "name": f"Load test result {uuid4()}",
+                "description": "Created by the load test",
+                "sources": "https://example.com/load-test",
+                "date": ENTRY_DATE,
+                "csrfmiddlewaretoken": _csrf_token(form.text),
+            },
+            name=f"{PROMISES_URL}[id]/add/",
+            catch_response=True,
+        ) as response:
+            if response.url.endswith("/add/"):
+                response.failure("the result was not created")
+
+
+class AdminUser(LoggedInTasks):
+    role = "admin"
+    email_template = ADMIN_EMAIL_TEMPLATE
+    account_count = ADMIN_COUNT
+    account_numbers = admin_numbers
+
+    def review_queue(self):
+        queue = self.client.get(REVIEW_QUEUE_URL)
+        token = _csrf_token(queue.text)
+        actions = APPROVE_ACTION_RE.findall(queue.text)
+
+        if not actions:
+            self.client.post(f"{REVIEW_QUEUE_URL}claim/", {"csrfmiddlewaretoken": token})
+            return
+
+        for action in actions:
+            self.client.post(action, {"csrfmiddlewaretoken": token}, name=f"{REVIEW_QUEUE_URL}[approve]")
+
+
+def _apply_traffic_mix() -> None:
+    mix = json.loads(TRAFFIC_MIX_PATH.read_text()) if TRAFFIC_MIX_PATH.exists() else DEFAULT_TRAFFIC_MIX
+
+    for user_class in (GuestUser, RegisteredUser, AdminUser):
+        role = mix["roles"].get(user_class.role)
+
+        if not role:
+            # Locust leaves out abstract classes, roles without traffic get no users
+            user_class.abstract = True
+            continue
+
+        user_class.weight = role["weight"]
+        total = sum(role["tasks"].values())
+        tasks = []
+
+        for name, weight in role["tasks"].items():
+            method = getattr(user_class, name, None)
+
+            if method is None:
+                logging.warning("%s users have no %s task, its weight is left out", user_class.role, name)
+                continue
+
+            # Locust picks tasks from a list with each task repeated by its weight, the log counts are scaled down
+            tasks.extend([method] * max(1, round(weight * 1000 / total)))
+
+        user_class.tasks = tasks
+
+
+_apply_traffic_mix()
+
+
+@events.quitting.add_listener
+def check_slos(environment, **kwargs):
+    breaches = []
+
+    for entry in environment.stats.entries.values():
+        p95 = entry.get_response_time_percentile(0.95)
+
+        if p95 > SLO_P95_MS:
+            breaches.append(f"{entry.method} {entry.name}: p95 {p95} ms > {SLO_P95_MS:g} ms")
+
+    total = environment.stats.total
+
+    if total.num_requests and total.fail_ratio > SLO_ERROR_RATE:
+        breaches.append(f"error rate {total.fail_ratio:.2%} > {SLO_ERROR_RATE:.2%}")
+
+    for breach in breaches:
+        logging.error("SLO breached: %s", breach)
+
+    if breaches:
+        environment.process_exit_code = 1
@@ -0,0 +1,44 @@
+import os
+import re
+
+from locust import HttpUser, between, task
+
+CSRF_TOKEN_RE = re.compile(r'name="csrfmiddlewaretoken" value="([^"]+)"')
+
+STORM_EMAIL = os.environ.get("STORM_EMAIL", "bench-admin-0@example.com")
+# The rejection message shown when no password hashing slot is free, with and without compiled translations
+BUSY_MARKERS = ("Serviss šobrīd ir noslogots", "The service is busy right now")
+
+
+class PageViewer(HttpUser):
+    weight = 1
+    wait_time = between(0.1, 0.5)
+
+    @task(5)
+    def list_promises(self):
+        self.client.get("/lv/promises/promises/")
+
+    @task(1)
+    def home(self):
+        self.client.get("/lv/")
+
+
+class LoginStormer(HttpUser):
+    weight = 1
+    wait_time = between(0.05, 0.1)
+
+    def on_start(self):
+        login_page = self.client.get("/lv/auth/login/")
+        match = CSRF_TOKEN_RE.search(login_page.text)
+        self.csrf_token = match.group(1) if match else ""
+
+    @task
+    def failed_login(self):
+        with self.client.post(
+            "/lv/auth/login/",
+            {"email": STORM_EMAIL, "password": "wrong-password", "csrfmiddlewaretoken": self.csrf_token},
+            name="/lv/auth/login/ [storm]",
+            catch_response=True,
+        ) as response:
+            if any(marker in response.text for marker in BUSY_MARKERS):
+                response.failure("rejected, no free hashing slot")
@@ -0,0 +1,57 @@
+import os
+import re
+from itertools import count
+
+from locust import HttpUser, between, task
+
+CSRF_TOKEN_RE = re.compile(r'name="csrfmiddlewaretoken" value="([^"]+)"')
+APPROVE_ACTION_RE = re.compile(r'action="([^"]+/reviews/(?:promises|results)/[^"]+/approve/)"')
+
+REVIEWER_EMAIL_TEMPLATE = os.environ.get("REVIEWER_EMAIL_TEMPLATE", "bench-admin-{}@example.com")
+REVIEWER_PASSWORD = os.environ.get("REVIEWER_PASSWORD", "some2233SSPassword!")
+
+reviewer_ids = count()
+
+
+class GuestReader(HttpUser):
+    weight = 4
+    wait_time = between(0.1, 0.5)
+
+    @task(5)
+    def list_promises(self):
+        self.client.get("/lv/promises/promises/")
+
+    @task(1)
+    def list_promises_page(self):
+        self.client.get("/lv/promises/promises/?page=2")
+
+
+class Reviewer(HttpUser):
+    weight = 1
+    wait_time = between(0.1, 0.5)
+
+    def _csrf_token(self, html: str) -> str:
+        match = CSRF_TOKEN_RE.search(html)
+        return match.group(1) if match else ""
+
+    def on_start(self):
+        email = REVIEWER_EMAIL_TEMPLATE.format(next(reviewer_ids))
+        login_page = self.client.get("/lv/auth/login/")
+
+        self.client.post(
+            "/lv/auth/login/",
+            {"email": email, "password": REVIEWER_PASSWORD, "csrfmiddlewaretoken": self._csrf_token(login_page.text)},
+        )
+
+    @task
+    def review_batch(self):
+        queue = self.client.get("/lv/promises/reviews/", name="/lv/promises/reviews/")
+        token = self._csrf_token(queue.text)
+        actions = APPROVE_ACTION_RE.findall(queue.text)
+
+        if not actions:
+            self.client.post("/lv/promises/reviews/claim/", {"csrfmiddlewaretoken": token})
+            return
+
+        for action in actions:
+            self.client.post(action, {"csrfmiddlewaretoken": token}, name="/lv/promises/reviews/[approve]")
@@ -0,0 +1,24 @@
+#!/usr/bin/env bash
+# Runs load/locustfile.py headless and exits with 1 when an SLO is breached, so it can gate a deploy.
+#
+# Against the local docker-compose stack, seed it first and run locust inside the stack network:
+#   docker compose -f docker-compose.dev.yaml exec django python manage.py seed_database --bulk --promises 100000 --seed 1
+#   docker compose -f docker-compose.dev.yaml run --rm locust load/run_load_test.sh http://django:8000
+#
+# Usage: load/run_load_test.sh [host]
+
+set -euo pipefail
+
+cd "$(dirname "$0")/.."
+
+HOST="${1:-${HOST:-http://localhost:8000}}"
+USERS="${USERS:-50}"
+SPAWN_RATE="${SPAWN_RATE:-2}"
+RUN_TIME="${RUN_TIME:-5m}"
+RESULTS_DIR="${RESULTS_DIR:-load/results}"
+
+mkdir -p "$RESULTS_DIR"
+
+locust -f load/locustfile.py --headless --only-summary \
+    --users "$USERS" --spawn-rate "$SPAWN_RATE" --run-time "$RUN_TIME" \
+    --host "$HOST" --csv "${RESULTS_DIR}/load_test" --html "${RESULTS_DIR}/load_test.html"
@@ -0,0 +1,96 @@
+# Derives the role and task weights of load/locustfile.py from the request logs of production, so a load test runs
+# the traffic mix of real users.
+#
+# Usage: python load/traffic_mix.py logs/*.log [--output load/traffic_mix.json]
+
+import argparse
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+from urllib.parse import parse_qs
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from promise_tracker.core.access_logs import read_requests  # noqa: E402
+
+ROLES = ("guest", "registered", "admin")
+
+
+# Maps a logged request to the locust task that makes it. The forms are counted by their submissions, since the task
+# that opens a form always submits it.
+def classify(request: dict) -> str | None:
+    view = request.get("view", "")
+    method = request.get("method")
+    query = parse_qs(request.get("query", ""))
+
+    if view == "promises:promises:list":
+        if "is_mine" in query:
+            return "my_promises"
+
+        return "promise_list_htmx" if request.get("htmx") else "promise_list"
+
+    if method == "POST":
+        return {
+            "promises:promises:create": "create_promise",
+            "promises:promises:create_result": "create_result",
+        }.get(view)
+
+    return {
+        "promises:promises:details": "promise_detail",
+        "promises:promise_analytics:analytics": "analytics",
+        "promises:promise_results:list": "result_list",
+        "promises:promise_results:mine": "my_results",
+        "promises:review_queue:queue": "review_queue",
+    }.get(view)
+
+
+def build_traffic_mix(requests) -> dict:
+    counts: dict[str, Counter[str]] = {role: Counter() for role in ROLES}
+    total = 0
+    unmapped: Counter[str] = Counter()
+
+    for request in requests:
+        total += 1
+        role = request.get("role")
+        task = classify(request)
+
+        if role not in counts or task is None:
+            unmapped[request.get("view", "unknown")] += 1
+            continue
+
+        counts[role][task] += 1
+
+    return {
+        "requests": total,
+        "roles": {
+            role: {"weight": sum(tasks.values()), "tasks": dict(sorted(tasks.items()))}
+            for role, tasks in counts.items()
+            if tasks
+        },
+        "unmapped": dict(unmapped.most_common()),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Derives the locust task weights from request logs")
+    parser.add_argument("logs", nargs="+", help="JSON request logs")
+    parser.add_argument("--output", default=str(Path(__file__).with_name("traffic_mix.json")))
+    args = parser.parse_args()
+
+    mix = build_traffic_mix(read_requests(args.logs))
+
+    if not mix["roles"]:
+        sys.exit("No request lines with a role were found, the logs predate the role field")
+
+    Path(args.output).write_text(json.dumps(mix, indent=2) + "\n")
+
+    mapped = sum(role["weight"] for role in mix["roles"].values())
+    print(f"{mapped} of {mix['requests']} requests map to locust tasks, wrote {args.output}")
+
+    for view, count in list(mix["unmapped"].items())[:10]:
+        print(f"  unmapped: {view} ({count})")
+
+
+if __name__ == "__main__":
+    main()
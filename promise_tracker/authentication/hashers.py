@@ -0,0 +1,38 @@
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from loguru import logger
+
+from promise_tracker.core.exceptions import PasswordHashingBusyError
+
+
+class BoundedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    # Same algorithm name as the stock hasher, so existing password hashes keep verifying.
+    # hashlib releases the GIL while hashing, so other threads of the worker keep serving requests meanwhile.
+
+    def __init__(self) -> None:
+        max_concurrency = settings.PASSWORD_HASHING_MAX_CONCURRENCY
+
+        self.slots = threading.BoundedSemaphore(max_concurrency) if max_concurrency > 0 else None
+
+    @contextmanager
+    def _hashing_slot(self):
+        if self.slots is None:
+            yield
+            return
+
+        if not self.slots.acquire(timeout=settings.PASSWORD_HASHING_WAIT_SECONDS):
+            logger.warning("No free password hashing slot, rejecting the request.")
+            raise PasswordHashingBusyError()
+
+        try:
+            yield
+        finally:
+            self.slots.release()
+
+    def encode(self, password, salt, iterations=None):
+        # Verifying, upgrading and timing-hardening all hash through encode
+        with self._hashing_slot():
+            return super().encode(password, salt, iterations)
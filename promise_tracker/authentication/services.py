@@ -4,25 +4,19 @@ from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from loguru import logger
 
-from promise_tracker.common.utils import get_object_or_raise
-from promise_tracker.core.exceptions import ApplicationError, AuthenticationError
+from promise_tracker.core.exceptions import AuthenticationError
+from promise_tracker.core.tracing import traced
 from promise_tracker.users.models import BaseUser
 from promise_tracker.users.services import UserService
 
 
+@traced
 class AuthService:
     def __init__(self, request: HttpRequest):
         self.request = request
 
-    USER_IS_DELETED = _("User has been deleted.")
     USER_IS_INACTIVE = _("User account is inactive.")
     INCORRECT_CREDENTIALS = _("Incorrect email or password.")
-    USER_NOT_FOUND = _("User not found.")
-
-    def _verify_user_not_deleted(self, user: BaseUser):
-        if user.is_deleted:
-            logger.warning(f"Deleted user {user.id} attempted to log in.")
-            raise ApplicationError(self.INCORRECT_CREDENTIALS)
 
     def _verify_user_is_active(self, user: BaseUser):
         if not user.is_active:
@@ -37,15 +31,13 @@ class AuthService:
     def login(self, email: str, password: str) -> bool:
         logger.debug(f"Attempting login for email: {email}")
 
-        abstract_user = authenticate(username=email, password=password)
+        # The default user manager leaves out deleted users, so they cannot authenticate
+        user = authenticate(username=email, password=password)
 
-        if not abstract_user:
+        if not isinstance(user, BaseUser):
             logger.warning(f"Failed login attempt for email: {email}")
             raise AuthenticationError(self.INCORRECT_CREDENTIALS)
 
-        user = get_object_or_raise(BaseUser, self.USER_NOT_FOUND, pk=abstract_user.pk)
-
-        self._verify_user_not_deleted(user)
         self._verify_user_is_active(user)
 
         login(self.request, user)
@@ -0,0 +1,17 @@
+from importlib import import_module
+
+from celery import shared_task
+from django.conf import settings
+from loguru import logger
+
+from promise_tracker.tasks.models import BaseTask
+
+
+@shared_task(bind=True, base=BaseTask, name="clear_expired_sessions_task")
+def clear_expired_sessions_task(self) -> None:
+    logger.info(f"Starting task {self.name} (id: {self.request.id})")
+
+    engine = import_module(settings.SESSION_ENGINE)
+    engine.SessionStore.clear_expired()
+
+    logger.info(f"Completed task {self.name} (id: {self.request.id})")
@@ -0,0 +1,32 @@
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from django.test import SimpleTestCase, override_settings
+
+from promise_tracker.authentication.hashers import BoundedPBKDF2PasswordHasher
+from promise_tracker.core.exceptions import PasswordHashingBusyError
+
+
+class BoundedPBKDF2PasswordHasherUnitTests(SimpleTestCase):
+    def test_verifies_hashes_of_stock_hasher(self):
+        encoded = PBKDF2PasswordHasher().encode("some2233SSPassword!", "somesalt", iterations=1000)
+
+        self.assertTrue(BoundedPBKDF2PasswordHasher().verify("some2233SSPassword!", encoded))
+        self.assertFalse(BoundedPBKDF2PasswordHasher().verify("wrong", encoded))
+
+    @override_settings(PASSWORD_HASHING_MAX_CONCURRENCY=1, PASSWORD_HASHING_WAIT_SECONDS=0)
+    def test_rejects_hashing_when_all_slots_are_taken(self):
+        hasher = BoundedPBKDF2PasswordHasher()
+        hasher.slots.acquire()
+
+        with self.assertRaises(PasswordHashingBusyError):
+            hasher.encode("some2233SSPassword!", "somesalt", iterations=1000)
+
+        hasher.slots.release()
+
+        self.assertTrue(hasher.encode("some2233SSPassword!", "somesalt", iterations=1000))
+
+    @override_settings(PASSWORD_HASHING_MAX_CONCURRENCY=0)
+    def test_zero_concurrency_disables_limit(self):
+        hasher = BoundedPBKDF2PasswordHasher()
+
+        self.assertIsNone(hasher.slots)
+        self.assertTrue(hasher.encode("some2233SSPassword!", "somesalt", iterations=1000))
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-19 00:17
+
+import promise_tracker.common.uuids
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('classifiers', '0002_initial'),
+    ]
+
+    operations = [
+        # The default is only applied in Python, so existing rows and the table itself are left as they are
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='convocation',
+                    name='id',
+                    field=models.UUIDField(default=promise_tracker.common.uuids.uuid7, editable=False, help_text='The unique identifier for the record.', primary_key=True, serialize=False, verbose_name='ID'),
+                ),
+                migrations.AlterField(
+                    model_name='politicalparty',
+                    name='id',
+                    field=models.UUIDField(default=promise_tracker.common.uuids.uuid7, editable=False, help_text='The unique identifier for the record.', primary_key=True, serialize=False, verbose_name='ID'),
+                ),
+            ],
+        ),
+    ]
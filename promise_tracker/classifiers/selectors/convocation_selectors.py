@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from django.db.models import QuerySet
+from django.db.models import Prefetch, QuerySet
 from django.utils.translation import gettext_lazy as _
 from django_filters import FilterSet, ModelMultipleChoiceFilter
 
@@ -34,7 +34,9 @@ class ConvocationFilterSet(FilterSet):
 def get_convocations(filters: dict | None = None) -> QuerySet[Convocation]:
     filters = filters or {}
 
-    qs = Convocation.objects.all()
+    qs = Convocation.objects.prefetch_related(
+        Prefetch("political_parties", queryset=PoliticalParty.objects.only("id", "name").order_by("name"))
+    )
 
     return ConvocationFilterSet(filters, queryset=qs).qs.order_by("-created_at")
 
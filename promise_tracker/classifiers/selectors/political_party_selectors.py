@@ -1,16 +1,25 @@
 from uuid import UUID
 
-from django.db.models import Q, QuerySet
+from django.db.models import Count, F, FloatField, IntegerField, OuterRef, Q, QuerySet, Subquery
+from django.db.models.functions import Cast, Coalesce, NullIf
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django_filters import BooleanFilter, FilterSet
 
-from promise_tracker.classifiers.models import PoliticalParty
+from promise_tracker.classifiers.models import Convocation, PoliticalParty
 from promise_tracker.common.utils import get_object_or_none
 from promise_tracker.core.exceptions import NotFoundError
+from promise_tracker.promises.models import Promise, PromiseResult
 
 NOT_FOUND_MESSAGE = _("Political party not found.")
 
+FINAL_APPROVED_RESULT = Q(
+    promise__review_status=Promise.ReviewStatus.APPROVED,
+    is_final=True,
+    review_status=PromiseResult.ReviewStatus.APPROVED,
+)
+COMPLETED_RESULT = Q(status=PromiseResult.CompletionStatus.COMPLETED)
+
 
 class PoliticalPartyFilerSet(FilterSet):
     is_active = BooleanFilter(method="filter_is_active", label=_("Is active"))
@@ -30,10 +39,32 @@ class PoliticalPartyFilerSet(FilterSet):
         return queryset
 
 
+def _count_per_party(qs: QuerySet, party_field: str) -> Coalesce:
+    # Counted in a subquery per relation, joining all of them would multiply the rows of one with the others
+    counts = (
+        qs.filter(**{party_field: OuterRef("pk")})
+        .order_by()
+        .values(party_field)
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
 def get_political_parties(filters: dict | None = None) -> QuerySet[PoliticalParty]:
     filters = filters or {}
 
-    qs = PoliticalParty.objects.all()
+    qs = PoliticalParty.objects.annotate(
+        promise_count=_count_per_party(Promise.objects.all(), "party"),
+        convocation_count=_count_per_party(Convocation.objects.all(), "political_parties"),
+        completed_count=_count_per_party(
+            PromiseResult.objects.filter(FINAL_APPROVED_RESULT & COMPLETED_RESULT), "promise__party"
+        ),
+        final_count=_count_per_party(PromiseResult.objects.filter(FINAL_APPROVED_RESULT), "promise__party"),
+    ).annotate(
+        completion_ratio=Cast(F("completed_count"), FloatField()) / NullIf(F("final_count"), 0),
+    )
 
     return PoliticalPartyFilerSet(data=filters, queryset=qs).qs.order_by("-created_at")
 
@@ -1,7 +1,6 @@
 from datetime import date
 from uuid import UUID
 
-from django.db import transaction
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from loguru import logger
@@ -13,10 +12,13 @@ from promise_tracker.classifiers.models import (
 from promise_tracker.common.services import BaseService
 from promise_tracker.common.utils import get_object_or_raise
 from promise_tracker.common.wrappers import handle_unique_error
+from promise_tracker.core.database import write_transaction
 from promise_tracker.core.exceptions import ApplicationError
+from promise_tracker.core.tracing import traced
 from promise_tracker.users.models import BaseUser
 
 
+@traced
 class ConvocationService:
     def __init__(
         self,
@@ -80,7 +82,7 @@ class ConvocationService:
             raise ApplicationError(self.END_DATE_SMALLER_THAN_START)
 
     @handle_unique_error(str(UNIQUE_CONSTRAINT_MESSAGE))
-    @transaction.atomic
+    @write_transaction()
     def create_convocation(
         self,
         name: str,
@@ -112,7 +114,7 @@ class ConvocationService:
         return convocation
 
     @handle_unique_error(str(UNIQUE_CONSTRAINT_MESSAGE))
-    @transaction.atomic
+    @write_transaction()
     def edit_convocation(
         self,
         id: UUID,
@@ -144,7 +146,7 @@ class ConvocationService:
         return convocation
 
     @handle_unique_error(str(UNIQUE_CONSTRAINT_MESSAGE))
-    @transaction.atomic
+    @write_transaction()
     def delete_convocation(self, id: UUID) -> None:
         convocation = get_object_or_raise(Convocation, self.NOT_FOUND_MESSAGE, id=id)
 
@@ -1,7 +1,6 @@
 from datetime import date
 from uuid import UUID
 
-from django.db import transaction
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from loguru import logger
@@ -10,10 +9,13 @@ from promise_tracker.classifiers.models import PoliticalParty
 from promise_tracker.common.services import BaseService
 from promise_tracker.common.utils import get_object_or_raise
 from promise_tracker.common.wrappers import handle_unique_error
+from promise_tracker.core.database import write_transaction
 from promise_tracker.core.exceptions import ApplicationError
+from promise_tracker.core.tracing import traced
 from promise_tracker.users.models import BaseUser
 
 
+@traced
 class PoliticalPartyService:
     def __init__(
         self,
@@ -58,7 +60,7 @@ class PoliticalPartyService:
             raise ApplicationError(self.LIQUIDATED_DATE_SMALLER_THAN_ESTABLISHED_DATE)
 
     @handle_unique_error(str(UNIQUE_CONSTRAINT_MESSAGE))
-    @transaction.atomic
+    @write_transaction()
     def create_political_party(
         self,
         name: str,
@@ -82,7 +84,7 @@ class PoliticalPartyService:
         return political_party
 
     @handle_unique_error(str(UNIQUE_CONSTRAINT_MESSAGE))
-    @transaction.atomic
+    @write_transaction()
     def edit_political_party(
         self,
         id: UUID,
@@ -107,7 +109,7 @@ class PoliticalPartyService:
         return political_party
 
     @handle_unique_error(str(UNIQUE_CONSTRAINT_MESSAGE))
-    @transaction.atomic
+    @write_transaction()
     def delete_political_party(self, id: UUID) -> None:
         political_party = get_object_or_raise(PoliticalParty, self.NOT_FOUND_MESSAGE, id=id)
 
@@ -66,6 +66,15 @@ class ConvocationSelectorsUnitTests(TestCase):
         self.assertEqual(convocations.count(), 1)
         self.assertEqual(convocations.first().id, convocation.id)
 
+    def test_view_all_prefetches_political_parties(self):
+        ValidConvocationFactory.create_batch(3)
+
+        with self.assertNumQueries(2):
+            convocations = list(get_convocations())
+
+            for convocation in convocations:
+                self.assertEqual(len(convocation.political_parties.all()), 1)
+
     def test_view_by_id_returns_convocation_when_exists(self):
         convocation = ValidConvocationFactory.create()
 
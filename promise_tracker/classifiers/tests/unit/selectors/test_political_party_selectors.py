@@ -10,6 +10,8 @@ from promise_tracker.classifiers.selectors.political_party_selectors import (
 from promise_tracker.classifiers.services.political_party_services import PoliticalPartyService
 from promise_tracker.classifiers.tests.factories import ValidPoliticalPartyFactory
 from promise_tracker.core.exceptions import NotFoundError
+from promise_tracker.promises.models import Promise, PromiseResult
+from promise_tracker.promises.tests.factories import ValidPromiseFactory, ValidPromiseResultFactory
 from promise_tracker.users.models import BaseUser
 
 faker = Faker()
@@ -69,6 +71,38 @@ class PoliticalPartySelectorsUnitTests(TestCase):
         self.assertEqual(political_parties.count(), 1)
         self.assertEqual(political_parties.first().id, party.id)
 
+    def test_view_all_annotates_counts_and_completion_ratio(self):
+        promise = ValidPromiseFactory.create(review_status=Promise.ReviewStatus.APPROVED, review_date=faker.date_time())
+        ValidPromiseFactory.create(
+            convocation=promise.convocation,
+            review_status=Promise.ReviewStatus.APPROVED,
+            review_date=faker.date_time(),
+        )
+        ValidPromiseResultFactory.create(
+            promise=promise,
+            is_final=True,
+            status=PromiseResult.CompletionStatus.COMPLETED,
+            review_status=PromiseResult.ReviewStatus.APPROVED,
+            review_date=faker.date_time(),
+        )
+
+        with self.assertNumQueries(1):
+            party = get_political_parties().get(id=promise.party.id)
+
+        self.assertEqual(party.promise_count, 2)
+        self.assertEqual(party.convocation_count, 1)
+        self.assertEqual(party.completed_count, 1)
+        self.assertEqual(party.final_count, 1)
+        self.assertEqual(party.completion_ratio, 1.0)
+
+    def test_view_all_completion_ratio_is_none_without_final_results(self):
+        party = ValidPoliticalPartyFactory.create()
+
+        fetched_party = get_political_parties().get(id=party.id)
+
+        self.assertEqual(fetched_party.promise_count, 0)
+        self.assertIsNone(fetched_party.completion_ratio)
+
     def test_view_by_id_returns_political_party_when_exists(self):
         party = ValidPoliticalPartyFactory.create()
 
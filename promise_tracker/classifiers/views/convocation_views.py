@@ -13,6 +13,7 @@ from promise_tracker.classifiers.selectors.convocation_selectors import (
 from promise_tracker.classifiers.services.convocation_services import ConvocationService
 from promise_tracker.common.mixins import (
     HandleErrorsMixin,
+    NonAtomicReadMixin,
     RoleBasedAccessMixin,
     VerifiedLoginRequiredMixin,
 )
@@ -67,7 +68,9 @@ class ConvocationEditView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, Base
         return redirect("classifiers:convocations:detail", id=kwargs["id"])
 
 
-class ConvocationDetailView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View):
+class ConvocationDetailView(
+    NonAtomicReadMixin, VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View
+):
     template_name = "classifiers/convocation/details.html"
     required_roles = [Administrator]
 
@@ -79,7 +82,9 @@ class ConvocationDetailView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, Ha
         return render(request, self.template_name, context)
 
 
-class ConvocationListView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View):
+class ConvocationListView(
+    NonAtomicReadMixin, VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View
+):
     template_name = "classifiers/convocation/list.html"
     required_roles = [Administrator]
 
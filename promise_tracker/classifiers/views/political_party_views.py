@@ -16,6 +16,7 @@ from promise_tracker.classifiers.selectors.political_party_selectors import (
 from promise_tracker.classifiers.services.political_party_services import PoliticalPartyService
 from promise_tracker.common.mixins import (
     HandleErrorsMixin,
+    NonAtomicReadMixin,
     RoleBasedAccessMixin,
     VerifiedLoginRequiredMixin,
 )
@@ -73,7 +74,9 @@ class PoliticalPartyEditView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, B
         return redirect("classifiers:political_parties:detail", id=kwargs["id"])
 
 
-class PoliticalPartyDetailView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View):
+class PoliticalPartyDetailView(
+    NonAtomicReadMixin, VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View
+):
     template_name = "classifiers/political_party/details.html"
     required_roles = [Administrator]
 
@@ -85,7 +88,9 @@ class PoliticalPartyDetailView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin,
         return render(request, self.template_name, context)
 
 
-class PoliticalPartyListView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View):
+class PoliticalPartyListView(
+    NonAtomicReadMixin, VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View
+):
     template_name = "classifiers/political_party/list.html"
     required_roles = [Administrator]
 
@@ -0,0 +1,268 @@
+import cProfile
+import time
+
+from django.conf import settings
+from django.urls import reverse
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from loguru import logger
+from rolepermissions.checkers import has_role
+
+from promise_tracker.core.metrics import flush_metrics, registry
+from promise_tracker.core.profiling import profiler_lock, save_profile, take_profiling_slot
+from promise_tracker.core.roles import Administrator
+from promise_tracker.core.routers import REPLICA_DB_ALIAS, replica_reads
+from promise_tracker.core.telemetry import RequestMetrics, collect_request_metrics
+from promise_tracker.core.tracing import SPAN_KIND_SERVER, TRACEPARENT_HEADER, get_current_span, start_trace
+
+SESSION_FREE_METHODS = ("GET", "HEAD")
+REPLICA_READ_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+# Serves anonymous reads of views marked with SessionFreeMixin without writing to the session store.
+# Must be placed after CsrfViewMiddleware, so the CSRF secret is dropped before it is stored in the session.
+class SessionFreeMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.session_free = False
+
+        response = self.get_response(request)
+
+        if not request.session_free:
+            return response
+
+        # Guests cannot submit the protected forms on these pages, so their token never has to be stored
+        request.META["CSRF_COOKIE_NEEDS_UPDATE"] = False
+
+        if response.status_code == 200 and not response.cookies:
+            patch_cache_control(response, public=True, max_age=settings.SESSION_FREE_CACHE_MAX_AGE)
+            patch_vary_headers(response, ("Cookie",))
+
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, "view_class", None)
+
+        request.session_free = (
+            request.method in SESSION_FREE_METHODS
+            and getattr(view_class, "session_free", False)
+            and settings.SESSION_COOKIE_NAME not in request.COOKIES
+        )
+
+
+# Lets safe requests read from the replica, except for clients that wrote within the last
+# DATABASE_REPLICA_PIN_SECONDS, so they see their own changes while the replica catches up.
+class ReplicaPinningMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if REPLICA_DB_ALIAS not in settings.DATABASES:
+            return self.get_response(request)
+
+        if request.method not in REPLICA_READ_METHODS:
+            response = self.get_response(request)
+            response.set_cookie(
+                settings.DATABASE_REPLICA_PIN_COOKIE_NAME,
+                "1",
+                max_age=settings.DATABASE_REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+            return response
+
+        if settings.DATABASE_REPLICA_PIN_COOKIE_NAME in request.COOKIES:
+            return self.get_response(request)
+
+        with replica_reads():
+            return self.get_response(request)
+
+
+# Starts the trace of a sampled request, or joins the one of an incoming traceparent header. The request span is named
+# after the resolved view, the spans of services, selectors and queries nest under it. Must be placed first, so the
+# request span covers the other middleware, telemetry included.
+class RequestTracingMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        attributes = {"http.request.method": request.method, "url.path": request.path}
+
+        with start_trace(
+            f"{request.method} unresolved",
+            SPAN_KIND_SERVER,
+            request.headers.get(TRACEPARENT_HEADER),
+            attributes,
+            trust_sampled=settings.TRACING_TRUSTED_PARENT,
+        ) as span:
+            response = self.get_response(request)
+
+            if span is not None:
+                resolver_match = getattr(request, "resolver_match", None)
+                view = resolver_match.view_name if resolver_match else "unresolved"
+                user = getattr(request, "user", None)
+
+                span.name = f"{request.method} {view}"
+                span.attributes["http.route"] = view
+                span.attributes["http.response.status_code"] = response.status_code
+                span.attributes["enduser.id"] = str(user.pk) if user and user.is_authenticated else "anonymous"
+
+                if response.status_code >= 500:
+                    span.status = "error"
+
+                response["traceresponse"] = span.traceparent
+
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        span = get_current_span()
+
+        if span is not None:
+            view_class = getattr(view_func, "view_class", view_func)
+            span.attributes["code.function"] = f"{view_class.__module__}.{view_class.__qualname__}"
+
+
+# Records how the time of each request splits between the database, templates and the rest. The figures go to the
+# request log line and to the /metrics histograms, administrators also get them as a Server-Timing header.
+# Must be placed right after RequestTracingMiddleware, so the time of the other middleware is included.
+class RequestTelemetryMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def _get_response_size(self, response) -> int:
+        if response.streaming:
+            return int(response.get("Content-Length", 0))
+
+        return len(response.content)
+
+    def _get_role(self, user) -> str:
+        if not user or not user.is_authenticated:
+            return "guest"
+
+        return "admin" if user.is_admin else "registered"
+
+    def _get_server_timing(self, metrics: RequestMetrics, duration: float) -> str:
+        return ", ".join(
+            [
+                f'db;dur={metrics.db_seconds * 1000:.1f};desc="{metrics.db_queries} queries"',
+                f"render;dur={metrics.render_seconds * 1000:.1f}",
+                f'cache;desc="{metrics.cache_hits} hits, {metrics.cache_misses} misses"',
+                f"total;dur={duration * 1000:.1f}",
+            ]
+        )
+
+    def __call__(self, request):
+        if not settings.REQUEST_TELEMETRY_ENABLED:
+            return self.get_response(request)
+
+        started_at = time.perf_counter()
+
+        with collect_request_metrics() as metrics:
+            response = self.get_response(request)
+
+        duration = time.perf_counter() - started_at
+        response_size = self._get_response_size(response)
+
+        resolver_match = getattr(request, "resolver_match", None)
+        view = resolver_match.view_name if resolver_match else "unresolved"
+        user = getattr(request, "user", None)
+        labels = {"view": view, "method": request.method}
+
+        registry.observe("http_request_duration_seconds", labels, duration)
+        registry.observe("http_request_db_seconds", labels, metrics.db_seconds)
+        registry.observe("http_request_db_queries", labels, metrics.db_queries)
+        registry.observe("http_request_render_seconds", labels, metrics.render_seconds)
+        registry.observe("http_response_size_bytes", labels, response_size)
+        registry.inc("http_requests_total", {**labels, "status": str(response.status_code)})
+        registry.inc("http_cache_requests_total", {"view": view, "result": "hit"}, metrics.cache_hits)
+        registry.inc("http_cache_requests_total", {"view": view, "result": "miss"}, metrics.cache_misses)
+        flush_metrics()
+
+        logger.info(
+            "request",
+            method=request.method,
+            path=request.path,
+            query=request.META.get("QUERY_STRING", ""),
+            htmx=request.headers.get("HX-Request") == "true",
+            view=view,
+            status=response.status_code,
+            duration_ms=round(duration * 1000, 2),
+            db_queries=metrics.db_queries,
+            db_ms=round(metrics.db_seconds * 1000, 2),
+            render_ms=round(metrics.render_seconds * 1000, 2),
+            cache_hits=metrics.cache_hits,
+            cache_misses=metrics.cache_misses,
+            response_bytes=response_size,
+            user=str(user.pk) if user and user.is_authenticated else "anonymous",
+            role=self._get_role(user),
+        )
+
+        # The is_admin flag mirrors the Administrator role and needs no extra query
+        if user and user.is_authenticated and user.is_admin:
+            response["Server-Timing"] = self._get_server_timing(metrics, duration)
+
+        return response
+
+
+# Profiles a request of an administrator that asks for it with ?profile=1 or an "X-Profile: 1" header and stores the
+# profile for the profile pages. Must be placed after AuthenticationMiddleware.
+class RequestProfilerMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def _wants_profile(self, request) -> bool:
+        return settings.REQUEST_PROFILING_ENABLED and (
+            request.GET.get("profile") == "1" or request.headers.get("X-Profile") == "1"
+        )
+
+    def _profile(self, request):
+        profiler = cProfile.Profile()
+        started_at = time.perf_counter()
+
+        profiler.enable()
+
+        try:
+            response = self.get_response(request)
+        finally:
+            profiler.disable()
+
+        resolver_match = getattr(request, "resolver_match", None)
+
+        profile_id = save_profile(
+            profiler,
+            {
+                "method": request.method,
+                "path": request.get_full_path(),
+                "view": resolver_match.view_name if resolver_match else "unresolved",
+                "status": response.status_code,
+                "duration_ms": round((time.perf_counter() - started_at) * 1000, 2),
+                "user": str(request.user.pk),
+            },
+        )
+
+        response["X-Profile-Url"] = reverse("core:profile_detail", kwargs={"id": profile_id})
+
+        return response
+
+    def __call__(self, request):
+        if not self._wants_profile(request) or not request.user.is_authenticated:
+            return self.get_response(request)
+
+        if not has_role(request.user, Administrator):
+            return self.get_response(request)
+
+        if not take_profiling_slot(request.user.pk):
+            response = self.get_response(request)
+            response["X-Profile-Skipped"] = "rate-limited"
+            return response
+
+        if not profiler_lock.acquire(blocking=False):
+            response = self.get_response(request)
+            response["X-Profile-Skipped"] = "busy"
+            return response
+
+        try:
+            return self._profile(request)
+        finally:
+            profiler_lock.release()
@@ -1,5 +1,6 @@
 from django.contrib import messages
 from django.contrib.auth.mixins import AccessMixin, LoginRequiredMixin
+from django.db import transaction
 from django.http import Http404, HttpResponseRedirect
 from django.shortcuts import redirect, render
 from django.utils.translation import gettext as _
@@ -19,6 +20,17 @@ class VerifiedLoginRequiredMixin(LoginRequiredMixin):
         return super().dispatch(request, *args, **kwargs)
 
 
+class SessionFreeMixin:
+    session_free: bool = True
+
+
+# Read-only views skip the ATOMIC_REQUESTS transaction, services wrap their own writes in transactions
+class NonAtomicReadMixin:
+    @classmethod
+    def as_view(cls, **initkwargs):
+        return transaction.non_atomic_requests(super().as_view(**initkwargs))
+
+
 class RoleBasedAccessMixin(AccessMixin):
     required_roles: list[type[AbstractUserRole]] = []
     allow_guests: bool = False
@@ -1,15 +1,15 @@
-import uuid
-
 from django.conf import settings
 from django.db import models
 from django.db.models.fields import Field
 from django.utils.translation import gettext_lazy as _
 
+from promise_tracker.common.uuids import uuid7
+
 
 class BaseModel(models.Model):
     id: Field = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         verbose_name=_("ID"),
         help_text=_("The unique identifier for the record."),
@@ -1,6 +1,7 @@
 from typing import Generic, Optional
 
 from promise_tracker.common.types import BaseModelType
+from promise_tracker.core.database import write_transaction
 from promise_tracker.users.models import BaseUser
 
 
@@ -10,7 +11,9 @@ class BaseService(Generic[BaseModelType]):
         instance.updated_by = performed_by
 
         instance.full_clean()
-        instance.save()
+
+        with write_transaction():
+            instance.save()
 
         return instance
 
@@ -18,9 +21,12 @@ class BaseService(Generic[BaseModelType]):
         instance.updated_by = updated_by
 
         instance.full_clean()
-        instance.save()
+
+        with write_transaction():
+            instance.save()
 
         return instance
 
     def delete_base(self, instance: BaseModelType) -> None:
-        instance.delete()
+        with write_transaction():
+            instance.delete()
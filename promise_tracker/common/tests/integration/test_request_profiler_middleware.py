@@ -0,0 +1,105 @@
+import tempfile
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from promise_tracker.core.profiling import get_profiles, profiler_lock
+from promise_tracker.users.tests.factories import AdminUserFactory, VerifiedUserFactory
+
+
+class RequestProfilerMiddlewareIntegrationTests(TestCase):
+    def setUp(self) -> None:
+        self.client.raise_request_exception = True
+
+        profiles_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(profiles_dir.cleanup)
+
+        settings_override = override_settings(REQUEST_PROFILING_ENABLED=True, REQUEST_PROFILING_DIR=profiles_dir.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        cache.clear()
+
+        self.admin = AdminUserFactory.create()
+        self.url = reverse("promises:promises:list")
+
+    def test_admin_can_profile_request_and_browse_profile(self):
+        self.client.force_login(self.admin)
+
+        response = self.client.get(self.url, {"profile": "1"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertListEqual([profile["view"] for profile in get_profiles()], ["promises:promises:list"])
+
+        detail_response = self.client.get(response["X-Profile-Url"], {"sort": "tottime"})
+
+        self.assertEqual(detail_response.status_code, 200)
+        self.assertContains(detail_response, "function calls")
+        self.assertContains(self.client.get(reverse("core:profile_list")), response["X-Profile-Url"])
+
+        download_response = self.client.get(response["X-Profile-Url"] + "download/")
+
+        self.assertEqual(download_response.status_code, 200)
+        self.assertTrue(download_response["Content-Disposition"].startswith("attachment"))
+
+    def test_profile_header_triggers_profiling(self):
+        self.client.force_login(self.admin)
+
+        response = self.client.get(self.url, headers={"X-Profile": "1"})
+
+        self.assertIn("X-Profile-Url", response)
+
+    def test_other_users_are_not_profiled(self):
+        self.client.force_login(VerifiedUserFactory.create())
+
+        response = self.client.get(self.url, {"profile": "1"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("X-Profile-Url", response)
+        self.assertListEqual(get_profiles(), [])
+
+    def test_other_users_cannot_browse_profiles(self):
+        self.client.force_login(VerifiedUserFactory.create())
+
+        response = self.client.get(reverse("core:profile_list"))
+
+        self.assertEqual(response.status_code, 403)
+
+    @override_settings(REQUEST_PROFILING_MAX_PER_HOUR=1)
+    def test_profiles_are_rate_limited_per_user(self):
+        self.client.force_login(self.admin)
+
+        self.client.get(self.url, {"profile": "1"})
+        response = self.client.get(self.url, {"profile": "1"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Profile-Skipped"], "rate-limited")
+        self.assertEqual(len(get_profiles()), 1)
+
+    def test_concurrent_profile_is_skipped(self):
+        self.client.force_login(self.admin)
+
+        with profiler_lock:
+            response = self.client.get(self.url, {"profile": "1"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Profile-Skipped"], "busy")
+
+    @override_settings(REQUEST_PROFILING_MAX_STORED=1)
+    def test_only_latest_profiles_are_kept(self):
+        self.client.force_login(self.admin)
+
+        self.client.get(self.url, {"profile": "1"})
+        response = self.client.get(reverse("home:index"), {"profile": "1"})
+
+        self.assertListEqual([profile["view"] for profile in get_profiles()], ["home:index"])
+        self.assertIn(get_profiles()[0]["id"], response["X-Profile-Url"])
+
+    @override_settings(REQUEST_PROFILING_ENABLED=False)
+    def test_profiling_is_off_unless_enabled(self):
+        self.client.force_login(self.admin)
+
+        response = self.client.get(self.url, {"profile": "1"})
+
+        self.assertNotIn("X-Profile-Url", response)
@@ -0,0 +1,69 @@
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from loguru import logger
+
+from promise_tracker.core.metrics import registry
+from promise_tracker.users.tests.factories import AdminUserFactory, VerifiedUserFactory
+
+
+class RequestTelemetryMiddlewareIntegrationTests(TestCase):
+    def setUp(self) -> None:
+        self.client.raise_request_exception = True
+        self.addCleanup(registry.reset)
+
+    def test_admin_receives_server_timing(self):
+        self.client.force_login(AdminUserFactory.create())
+
+        response = self.client.get(reverse("users:list"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertRegex(response["Server-Timing"], r'^db;dur=[\d.]+;desc="\d+ queries", render;dur=[\d.]+, ')
+
+    def test_other_users_do_not_receive_server_timing(self):
+        self.client.force_login(VerifiedUserFactory.create())
+
+        response = self.client.get(reverse("home:index"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Server-Timing", response)
+
+    def test_request_is_logged_with_query_and_role(self):
+        records = []
+        # The test settings silence loguru
+        logger.enable("")
+        self.addCleanup(logger.disable, "")
+        handler_id = logger.add(
+            lambda message: records.append(message.record), filter=lambda r: r["message"] == "request"
+        )
+        self.addCleanup(logger.remove, handler_id)
+        self.client.force_login(VerifiedUserFactory.create())
+
+        self.client.get(reverse("promises:promises:list"), {"page": 2}, headers={"HX-Request": "true"})
+
+        self.assertEqual(len(records), 1)
+        extra = records[0]["extra"]
+        self.assertEqual(
+            (extra["method"], extra["query"], extra["htmx"], extra["view"], extra["role"]),
+            ("GET", "page=2", True, "promises:promises:list", "registered"),
+        )
+
+    @override_settings(REQUEST_METRICS_TOKEN="secret")
+    def test_metrics_endpoint_reports_requests_per_view(self):
+        self.client.get(reverse("home:index"))
+
+        response = self.client.get(reverse("metrics"), headers={"Authorization": "Bearer secret"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('http_requests_total{method="GET",status="200",view="home:index"} 1', response.content.decode())
+        self.assertIn('http_request_db_queries_count{method="GET",view="home:index"} 1', response.content.decode())
+
+    @override_settings(REQUEST_METRICS_TOKEN="secret")
+    def test_metrics_endpoint_requires_token(self):
+        response = self.client.get(reverse("metrics"), headers={"Authorization": "Bearer wrong"})
+
+        self.assertEqual(response.status_code, 401)
+
+    def test_metrics_endpoint_is_disabled_without_token(self):
+        response = self.client.get(reverse("metrics"))
+
+        self.assertEqual(response.status_code, 404)
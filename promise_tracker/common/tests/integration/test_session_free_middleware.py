@@ -0,0 +1,72 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.sessions.models import Session
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone, translation
+
+from promise_tracker.authentication.tasks import clear_expired_sessions_task
+from promise_tracker.promises.models import Promise
+from promise_tracker.promises.tests.factories import ValidPromiseFactory
+from promise_tracker.users.tests.factories import VerifiedUserFactory
+
+
+class SessionFreeMiddlewareIntegrationTests(TestCase):
+    def setUp(self) -> None:
+        self.client.raise_request_exception = True
+        self.promise = ValidPromiseFactory.create(
+            results=[], review_status=Promise.ReviewStatus.APPROVED, review_date=timezone.now()
+        )
+
+    def test_guest_promise_list_does_not_create_session(self):
+        response = self.client.get(reverse("promises:promises:list"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn(settings.SESSION_COOKIE_NAME, response.cookies)
+        self.assertFalse(Session.objects.exists())
+
+    def test_guest_promise_details_is_publicly_cacheable(self):
+        response = self.client.get(reverse("promises:promises:details", kwargs={"id": self.promise.id}))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("public", response["Cache-Control"])
+        self.assertIn("Cookie", response["Vary"])
+        self.assertFalse(Session.objects.exists())
+
+    def test_authenticated_user_is_not_served_public_response(self):
+        self.client.force_login(VerifiedUserFactory.create())
+
+        response = self.client.get(reverse("promises:promises:list"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("public", response.get("Cache-Control", ""))
+
+    def test_login_page_still_stores_csrf_secret_in_session(self):
+        response = self.client.get(reverse("authentication:login"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(Session.objects.exists())
+
+    def test_guest_switches_language_through_link(self):
+        with translation.override("lv"):
+            response = self.client.get(reverse("promises:promises:list"))
+
+        with translation.override("en"):
+            self.assertContains(response, f'href="{reverse("promises:promises:list")}"')
+        self.assertFalse(Session.objects.exists())
+
+    def test_set_language_still_checks_csrf_token(self):
+        self.client.handler.enforce_csrf_checks = True
+
+        response = self.client.post(reverse("set_language"), {"language": "lv", "next": "/"})
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_clear_expired_sessions_task_deletes_expired_sessions(self):
+        Session.objects.create(session_key="expired", session_data="", expire_date=timezone.now() - timedelta(days=1))
+        Session.objects.create(session_key="active", session_data="", expire_date=timezone.now() + timedelta(days=1))
+
+        clear_expired_sessions_task()
+
+        self.assertListEqual(list(Session.objects.values_list("session_key", flat=True)), ["active"])
@@ -0,0 +1,219 @@
+import re
+from collections import Counter
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from django.utils import timezone
+
+from promise_tracker.classifiers.models import Convocation, PoliticalParty
+from promise_tracker.classifiers.tests.factories import ValidConvocationFactory, ValidPoliticalPartyFactory
+from promise_tracker.promises.models import Promise, PromiseResult
+from promise_tracker.promises.tests.factories import ValidPromiseFactory, ValidPromiseResultFactory
+from promise_tracker.users.models import BaseUser, UserModerationJob
+from promise_tracker.users.tests.factories import AdminUserFactory, VerifiedUserFactory
+
+GUEST = "guest"
+REGISTERED = "registered"
+ADMIN = "admin"
+
+SMALL_PAGE_SIZE = 2
+LARGE_PAGE_SIZE = 20
+ROWS_PER_LIST = LARGE_PAGE_SIZE + 5
+
+BUDGETED_NAMESPACES = ("home", "promises", "classifiers", "users")
+
+# The URLs of these views only accept POST, their queries are covered by the tests of the services they call
+POST_ONLY_URL_NAMES = {
+    "promises:promises:approve",
+    "promises:promises:reject",
+    "promises:promises:delete",
+    "promises:promises:approve_result",
+    "promises:promises:reject_result",
+    "promises:promises:delete_result",
+    "promises:review_queue:claim",
+    "promises:review_queue:release",
+    "promises:review_queue:approve_promise",
+    "promises:review_queue:reject_promise",
+    "promises:review_queue:approve_result",
+    "promises:review_queue:reject_result",
+    "classifiers:political_parties:delete",
+    "classifiers:convocations:delete",
+    "users:delete",
+    "users:resend_verification",
+    "users:block",
+    "users:unblock",
+    "users:moderate",
+}
+
+# Query budgets per URL name and role. A budget holds for both page sizes, so a query per listed row fails the test
+# even while the total stays under it. Roles a view turns away are budgeted too, rejecting them must stay cheap.
+QUERY_BUDGETS = {
+    "home:index": {GUEST: 0, REGISTERED: 2, ADMIN: 2},
+    "promises:promises:list": {GUEST: 5, REGISTERED: 14, ADMIN: 12},
+    "promises:promises:create": {GUEST: 3, REGISTERED: 8, ADMIN: 7},
+    "promises:promises:details": {GUEST: 11, REGISTERED: 20, ADMIN: 19},
+    "promises:promises:edit": {GUEST: 3, REGISTERED: 10, ADMIN: 9},
+    "promises:promises:create_result": {GUEST: 3, REGISTERED: 6, ADMIN: 5},
+    "promises:promises:edit_result": {GUEST: 3, REGISTERED: 8, ADMIN: 7},
+    "promises:promise_results:list": {GUEST: 0, REGISTERED: 3, ADMIN: 10},
+    "promises:promise_results:mine": {GUEST: 0, REGISTERED: 11, ADMIN: 8},
+    "promises:promise_analytics:analytics": {GUEST: 2, REGISTERED: 4, ADMIN: 4},
+    "promises:review_queue:queue": {GUEST: 0, REGISTERED: 3, ADMIN: 7},
+    "classifiers:political_parties:list": {GUEST: 0, REGISTERED: 3, ADMIN: 5},
+    "classifiers:political_parties:create": {GUEST: 3, REGISTERED: 6, ADMIN: 5},
+    "classifiers:political_parties:detail": {GUEST: 0, REGISTERED: 3, ADMIN: 5},
+    "classifiers:political_parties:edit": {GUEST: 3, REGISTERED: 6, ADMIN: 6},
+    "classifiers:convocations:list": {GUEST: 0, REGISTERED: 3, ADMIN: 7},
+    "classifiers:convocations:create": {GUEST: 3, REGISTERED: 6, ADMIN: 6},
+    "classifiers:convocations:detail": {GUEST: 0, REGISTERED: 3, ADMIN: 6},
+    "classifiers:convocations:edit": {GUEST: 3, REGISTERED: 6, ADMIN: 8},
+    "users:list": {GUEST: 0, REGISTERED: 3, ADMIN: 5},
+    "users:create": {GUEST: 2, REGISTERED: 6, ADMIN: 6},
+    "users:detail": {GUEST: 0, REGISTERED: 7, ADMIN: 6},
+    "users:edit": {GUEST: 3, REGISTERED: 10, ADMIN: 9},
+    "users:verify": {GUEST: 3, REGISTERED: 5, ADMIN: 5},
+    "users:moderation_job": {GUEST: 0, REGISTERED: 3, ADMIN: 5},
+}
+
+# Numbers and quoted literals are replaced, so queries that only differ in the row they load count as duplicates
+SQL_LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+
+
+def _collect_url_names(patterns, prefix: str = "") -> list[str]:
+    names = []
+
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            namespace = f"{prefix}{pattern.namespace}:" if pattern.namespace else prefix
+            names += _collect_url_names(pattern.url_patterns, namespace)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            names.append(f"{prefix}{pattern.name}")
+
+    return names
+
+
+def _format_duplicates(queries: list[dict]) -> str:
+    counts = Counter(SQL_LITERAL_PATTERN.sub("?", query["sql"]) for query in queries)
+    duplicates = [f"  {count}x {sql}" for sql, count in counts.most_common() if count > 1]
+
+    return "\n".join(duplicates) or "  none"
+
+
+class QueryBudgetTests(TestCase):
+    admin: BaseUser
+    registered: BaseUser
+    promise: Promise
+    result: PromiseResult
+    party: PoliticalParty
+    convocation: Convocation
+    moderation_job: UserModerationJob
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = AdminUserFactory.create()
+        cls.registered = VerifiedUserFactory.create()
+
+        VerifiedUserFactory.create_batch(ROWS_PER_LIST)
+        ValidPoliticalPartyFactory.create_batch(ROWS_PER_LIST)
+        ValidConvocationFactory.create_batch(ROWS_PER_LIST)
+
+        promises = ValidPromiseFactory.create_batch(ROWS_PER_LIST, created_by=cls.registered, results=[])
+
+        # The detail page lists the results of its promise, so the first one gets a page of them
+        ValidPromiseResultFactory.create_batch(ROWS_PER_LIST, promise=promises[0], created_by=cls.registered)
+
+        for promise in promises[1:]:
+            ValidPromiseResultFactory.create_batch(2, promise=promise, created_by=cls.registered)
+
+        # Half of the rows are reviewed, so guests, owners and the review queue all get full pages
+        reviewed_ids = [promise.id for promise in promises[::2]]
+        now = timezone.now()
+
+        Promise.objects.filter(id__in=reviewed_ids).update(
+            review_status=Promise.ReviewStatus.APPROVED, review_date=now, reviewer=cls.admin
+        )
+        PromiseResult.objects.filter(promise_id__in=reviewed_ids).update(
+            review_status=PromiseResult.ReviewStatus.APPROVED, review_date=now, reviewer=cls.admin
+        )
+
+        cls.promise = promises[0]
+        cls.result = cls.promise.results.first()
+        cls.party = cls.promise.party
+        cls.convocation = cls.promise.convocation
+        cls.moderation_job = UserModerationJob.objects.create(
+            action=UserModerationJob.Action.BAN,
+            user_ids=[str(cls.registered.id)],
+            created_by=cls.admin,
+        )
+
+    def _get_url(self, url_name: str) -> str:
+        url_kwargs = {
+            "promises:promises:details": {"id": self.promise.id},
+            "promises:promises:edit": {"id": self.promise.id},
+            "promises:promises:create_result": {"promise_id": self.promise.id},
+            "promises:promises:edit_result": {"promise_id": self.promise.id, "id": self.result.id},
+            "classifiers:political_parties:detail": {"id": self.party.id},
+            "classifiers:political_parties:edit": {"id": self.party.id},
+            "classifiers:convocations:detail": {"id": self.convocation.id},
+            "classifiers:convocations:edit": {"id": self.convocation.id},
+            "users:detail": {"id": self.registered.id},
+            "users:edit": {"id": self.registered.id},
+            "users:moderation_job": {"id": self.moderation_job.id},
+        }
+
+        return reverse(url_name, kwargs=url_kwargs.get(url_name))
+
+    def _login(self, role: str) -> None:
+        self.client.logout()
+
+        if role == REGISTERED:
+            self.client.force_login(self.registered)
+        elif role == ADMIN:
+            self.client.force_login(self.admin)
+
+    def _count_queries(self, url: str, page_size: int) -> tuple[int, CaptureQueriesContext]:
+        with override_settings(PAGINATE_BY_DEFAULT=page_size), CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+
+        self.assertLess(response.status_code, 500, url)
+
+        return len(context), context
+
+    def test_every_url_has_a_budget(self):
+        url_names = [
+            name for name in _collect_url_names(get_resolver().url_patterns) if name.startswith(BUDGETED_NAMESPACES)
+        ]
+
+        unbudgeted = set(url_names) - set(QUERY_BUDGETS) - POST_ONLY_URL_NAMES
+
+        self.assertSetEqual(unbudgeted, set(), "Add the new URLs to QUERY_BUDGETS or POST_ONLY_URL_NAMES")
+
+    def test_views_stay_within_query_budget(self):
+        for url_name, budgets in QUERY_BUDGETS.items():
+            url = self._get_url(url_name)
+
+            for role, budget in budgets.items():
+                with self.subTest(url=url_name, role=role):
+                    self._login(role)
+
+                    # The first request warms the per-process caches, such as the role checks
+                    self.client.get(url)
+
+                    small_count, _ = self._count_queries(url, SMALL_PAGE_SIZE)
+                    large_count, large_context = self._count_queries(url, LARGE_PAGE_SIZE)
+
+                    self.assertEqual(
+                        small_count,
+                        large_count,
+                        f"{url_name} as {role} runs {small_count} queries for {SMALL_PAGE_SIZE} rows and {large_count} "
+                        f"for {LARGE_PAGE_SIZE} rows. Repeated queries:\n"
+                        f"{_format_duplicates(large_context.captured_queries)}",
+                    )
+                    self.assertLessEqual(
+                        large_count,
+                        budget,
+                        f"{url_name} as {role} runs {large_count} queries, its budget is {budget}. Repeated queries:\n"
+                        f"{_format_duplicates(large_context.captured_queries)}",
+                    )
@@ -0,0 +1,199 @@
+import random
+import re
+from datetime import date, timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from promise_tracker.classifiers.models import Convocation, PoliticalParty
+from promise_tracker.core.slow_queries import capture_query_plan
+from promise_tracker.promises.models import Promise, PromiseResult
+from promise_tracker.promises.selectors.analytics_selectors import AnalyticsSelectors
+from promise_tracker.promises.selectors.promise_result_selectors import PromiseResultSelectors
+from promise_tracker.promises.selectors.promise_selectors import PromiseSelectors
+from promise_tracker.users.models import BaseUser
+from promise_tracker.users.tests.factories import AdminUserFactory, VerifiedUserFactory
+
+USER_COUNT = 1_000
+PARTY_COUNT = 20
+CONVOCATION_COUNT = 10
+PROMISE_COUNT = 5_000
+RESULTS_PER_PROMISE = 4
+PAGE_SIZE = 10
+
+# Plan lines that mean a table is read row by row, or that rows are sorted after they were read
+FULL_SCAN_PATTERNS = {
+    "sqlite": r"^SCAN {table}(?! USING)",
+    "postgresql": r"Seq Scan on {table}\b",
+}
+SORT_PATTERNS = {
+    "sqlite": r"USE TEMP B-TREE",
+    "postgresql": r"^\s*(->\s*)?(Incremental )?Sort\b",
+}
+PLANNED_TABLES = ("promises_promise", "promises_promiseresult")
+
+
+def _bulk_create_dataset(owner) -> None:
+    rng = random.Random(0)
+    now = timezone.now()
+
+    parties = PoliticalParty.objects.bulk_create(
+        PoliticalParty(name=f"Party {index}", established_date=date(2000, 1, 1)) for index in range(PARTY_COUNT)
+    )
+    convocations = Convocation.objects.bulk_create(
+        Convocation(name=f"Convocation {index}", start_date=date(2010, 1, 1), end_date=date(2030, 1, 1))
+        for index in range(CONVOCATION_COUNT)
+    )
+
+    for convocation in convocations:
+        convocation.political_parties.set(parties)
+
+    promises = []
+
+    for index in range(PROMISE_COUNT):
+        # Mostly approved, as in production, the review queue and rejections are a small share
+        review_status = rng.choices(
+            [Promise.ReviewStatus.APPROVED, Promise.ReviewStatus.PENDING, Promise.ReviewStatus.REJECTED], [8, 1, 1]
+        )[0]
+
+        promises.append(
+            Promise(
+                name=f"Promise {index}",
+                description="Description",
+                date=date(2010, 1, 1) + timedelta(days=rng.randrange(5_000)),
+                party=rng.choice(parties),
+                convocation=rng.choice(convocations),
+                review_status=review_status,
+                review_date=None if review_status == Promise.ReviewStatus.PENDING else now,
+                # A registered user owns a small share of the promises
+                created_by=owner if index % 100 == 0 else None,
+            )
+        )
+
+    Promise.objects.bulk_create(promises, batch_size=1_000)
+
+    results = []
+
+    for promise in promises:
+        for index in range(RESULTS_PER_PROMISE):
+            # Only the last result of a promise can be final, and most results are approved
+            is_final = index == RESULTS_PER_PROMISE - 1 and rng.random() < 0.5
+            result_review_status = rng.choices(
+                [PromiseResult.ReviewStatus.APPROVED, PromiseResult.ReviewStatus.PENDING], [4, 1]
+            )[0]
+
+            results.append(
+                PromiseResult(
+                    name=f"Result {index}",
+                    description="Description",
+                    date=promise.date + timedelta(days=index),
+                    promise=promise,
+                    is_final=is_final,
+                    status=rng.choice(PromiseResult.CompletionStatus.values) if is_final else None,
+                    review_status=result_review_status,
+                    review_date=None if result_review_status == PromiseResult.ReviewStatus.PENDING else now,
+                )
+            )
+
+    PromiseResult.objects.bulk_create(results, batch_size=1_000)
+
+
+class QueryPlanTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = AdminUserFactory.create()
+        cls.registered = VerifiedUserFactory.create()
+
+        # With a handful of users the planners would rather scan the users table than look authors up by id
+        BaseUser.objects.bulk_create(
+            BaseUser(email=f"user{index}@example.com", username=f"user{index}", name="User", surname="User")
+            for index in range(USER_COUNT)
+        )
+
+        _bulk_create_dataset(cls.registered)
+
+        cls.promise = Promise.objects.filter(review_status=Promise.ReviewStatus.APPROVED).first()
+
+        # Both planners pick indexes from table statistics, which only exist after the data is analyzed
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+    def _capture_plans(self, run) -> list[tuple[str, str]]:
+        with CaptureQueriesContext(connection) as context:
+            run()
+
+        # The captured statements have their parameters inlined, which both backends can explain as they are
+        return [(query["sql"], capture_query_plan(connection.alias, query["sql"], None)) for query in context]
+
+    def _assert_plans(self, run, indexes: list[str], allow_group_by_sort: bool = False) -> None:
+        vendor = connection.vendor
+        # The role checks read the small auth tables, only the queries of the app itself are asserted
+        plans = [(sql, plan) for sql, plan in self._capture_plans(run) if "promises_" in sql]
+
+        self.assertTrue(plans, "No queries of the promises tables were captured")
+
+        combined_plan = "\n".join(plan for _, plan in plans)
+
+        for index in indexes:
+            self.assertIn(index, combined_plan, f"The plans do not use {index}:\n{combined_plan}")
+
+        for sql, plan in plans:
+            lines = plan.splitlines()
+
+            for table in PLANNED_TABLES:
+                pattern = re.compile(FULL_SCAN_PATTERNS[vendor].format(table=table))
+                self.assertFalse(
+                    any(pattern.search(line) for line in lines), f"{table} is scanned in full:\n{sql}\n{plan}"
+                )
+
+            # Grouping the aggregated rows needs a sort or hash on either backend, ordering the rows does not
+            if allow_group_by_sort:
+                if vendor != "sqlite":
+                    continue
+
+                lines = [line for line in lines if "FOR GROUP BY" not in line]
+
+            sort_pattern = re.compile(SORT_PATTERNS[vendor])
+            self.assertFalse(any(sort_pattern.search(line) for line in lines), f"Rows are sorted:\n{sql}\n{plan}")
+
+    def test_guest_promise_list(self):
+        selectors = PromiseSelectors(request=None, performed_by=None)
+        self._assert_plans(
+            lambda: list(selectors.get_promises({})[:PAGE_SIZE]),
+            ["promise_status_date_idx", "result_final_approved_idx"],
+        )
+
+    def test_registered_user_promise_list(self):
+        selectors = PromiseSelectors(request=None, performed_by=self.registered)
+        self._assert_plans(lambda: list(selectors.get_promises({})[:PAGE_SIZE]), ["promise_date_idx"])
+
+    def test_admin_promise_list(self):
+        selectors = PromiseSelectors(request=None, performed_by=self.admin)
+        self._assert_plans(lambda: list(selectors.get_promises({})[:PAGE_SIZE]), ["promise_date_idx"])
+
+    def test_admin_pending_promises(self):
+        selectors = PromiseSelectors(request=None, performed_by=self.admin)
+        self._assert_plans(
+            lambda: list(selectors.get_promises({"is_unreviewed": True})[:PAGE_SIZE]), ["promise_status_date_idx"]
+        )
+
+    def test_admin_pending_results(self):
+        selectors = PromiseResultSelectors(performed_by=self.admin)
+        self._assert_plans(
+            lambda: list(selectors.get_results({"is_unreviewed": True})[:PAGE_SIZE]), ["result_status_date_idx"]
+        )
+
+    def test_analytics(self):
+        # Most results are approved, yet the planners still prefer the status index over a scan of the final ones
+        self._assert_plans(
+            lambda: AnalyticsSelectors().get_analytics({}), ["result_status_date_idx"], allow_group_by_sort=True
+        )
+
+    def test_results_by_promise(self):
+        selectors = PromiseResultSelectors(performed_by=None)
+        self._assert_plans(
+            lambda: list(selectors.get_promise_results_by_promise_id(self.promise.id)[:PAGE_SIZE]),
+            ["result_promise_date_idx"],
+        )
@@ -2,6 +2,7 @@ from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
 from django.contrib.messages.storage.fallback import FallbackStorage
 from django.core.exceptions import PermissionDenied
+from django.db import DEFAULT_DB_ALIAS
 from django.http import HttpResponse
 from django.test import RequestFactory, TestCase
 from django.urls import reverse
@@ -9,7 +10,7 @@ from django.utils.translation import gettext as _
 from django.views import View
 from rolepermissions.roles import remove_role
 
-from promise_tracker.common.mixins import RoleBasedAccessMixin, VerifiedLoginRequiredMixin
+from promise_tracker.common.mixins import NonAtomicReadMixin, RoleBasedAccessMixin, VerifiedLoginRequiredMixin
 from promise_tracker.core.roles import RegisteredUser
 from promise_tracker.users.tests.factories import UnverifiedUserFactory, VerifiedUserFactory
 
@@ -42,6 +43,11 @@ class DummyRoleUnverifiedView(RoleBasedAccessMixin, View):
         return HttpResponse("OK")
 
 
+class DummyReadView(NonAtomicReadMixin, View):
+    def get(self, request, *args, **kwargs):
+        return HttpResponse("OK")
+
+
 class VerifiedLoginRequiredMixinUnitTests(TestCase):
     def setUp(self):
         self.factory = RequestFactory()
@@ -166,3 +172,10 @@ class RoleBasedAccessMixinUnitTests(TestCase):
             DummyRoleView.as_view()(request)
 
         self.assertIn(_("Access denied!"), [m.message for m in request._messages])
+
+
+class NonAtomicReadMixinUnitTests(TestCase):
+    def test_view_is_excluded_from_atomic_requests(self):
+        view = DummyReadView.as_view()
+
+        self.assertSetEqual(view._non_atomic_requests, {DEFAULT_DB_ALIAS})
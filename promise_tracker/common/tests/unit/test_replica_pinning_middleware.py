@@ -0,0 +1,55 @@
+from unittest.mock import patch
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+
+from promise_tracker.common.middleware import ReplicaPinningMiddleware
+from promise_tracker.core.routers import REPLICA_DB_ALIAS, _replica_reads_allowed
+
+
+class ReplicaPinningMiddlewareUnitTests(TestCase):
+    def setUp(self) -> None:
+        self.factory = RequestFactory()
+        self.replica_reads_allowed: bool | None = None
+
+        self.middleware = ReplicaPinningMiddleware(self._get_response)
+
+        databases_patcher = patch.dict(settings.DATABASES, {REPLICA_DB_ALIAS: settings.DATABASES["default"]})
+        databases_patcher.start()
+        self.addCleanup(databases_patcher.stop)
+
+    def _get_response(self, request) -> HttpResponse:
+        self.replica_reads_allowed = _replica_reads_allowed.get()
+        return HttpResponse("OK")
+
+    def test_get_reads_from_replica(self):
+        response = self.middleware(self.factory.get("/"))
+
+        self.assertTrue(self.replica_reads_allowed)
+        self.assertNotIn(settings.DATABASE_REPLICA_PIN_COOKIE_NAME, response.cookies)
+        self.assertFalse(_replica_reads_allowed.get())
+
+    def test_post_reads_from_primary_and_pins_client(self):
+        response = self.middleware(self.factory.post("/"))
+
+        self.assertFalse(self.replica_reads_allowed)
+        self.assertEqual(
+            response.cookies[settings.DATABASE_REPLICA_PIN_COOKIE_NAME]["max-age"],
+            settings.DATABASE_REPLICA_PIN_SECONDS,
+        )
+
+    def test_pinned_client_reads_from_primary(self):
+        request = self.factory.get("/")
+        request.COOKIES[settings.DATABASE_REPLICA_PIN_COOKIE_NAME] = "1"
+
+        self.middleware(request)
+
+        self.assertFalse(self.replica_reads_allowed)
+
+    def test_replica_is_not_used_when_not_configured(self):
+        del settings.DATABASES[REPLICA_DB_ALIAS]
+
+        self.middleware(self.factory.get("/"))
+
+        self.assertFalse(self.replica_reads_allowed)
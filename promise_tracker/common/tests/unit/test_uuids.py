@@ -0,0 +1,31 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from promise_tracker.common.uuids import uuid7
+
+
+class Uuid7UnitTests(SimpleTestCase):
+    def test_uuid7_sets_version_and_variant(self):
+        value = uuid7()
+
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, "specified in RFC 4122")
+
+    def test_uuid7_encodes_unix_time_in_milliseconds(self):
+        with patch("promise_tracker.common.uuids.time.time_ns", return_value=1_700_000_000_123_456_789):
+            value = uuid7()
+
+        self.assertEqual(value.int >> 80, 1_700_000_000_123)
+
+    def test_uuid7_sorts_by_creation_time(self):
+        with patch("promise_tracker.common.uuids.time.time_ns", side_effect=[2_000_000, 1_000_000, 1_500_000]):
+            values = [uuid7() for _ in range(3)]
+
+        self.assertListEqual(sorted(values), [values[1], values[2], values[0]])
+
+    def test_uuid7_is_unique_within_the_same_instant(self):
+        with patch("promise_tracker.common.uuids.time.time_ns", return_value=1_000_000):
+            values = {uuid7() for _ in range(1000)}
+
+        self.assertEqual(len(values), 1000)
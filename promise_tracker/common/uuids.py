@@ -0,0 +1,22 @@
+import os
+import time
+import uuid
+
+
+# UUID version 7 (RFC 9562) until the standard library provides uuid.uuid7 (Python 3.14).
+# The first 48 bits hold the Unix time in milliseconds and the next 12 bits its sub-millisecond fraction,
+# so ids created later sort after earlier ones and new rows are appended to the end of the primary key index.
+def uuid7() -> uuid.UUID:
+    timestamp_ns = time.time_ns()
+    timestamp_ms, remainder_ns = divmod(timestamp_ns, 1_000_000)
+    sub_ms = remainder_ns * 4096 // 1_000_000
+
+    rand_b = int.from_bytes(os.urandom(8)) & 0x3FFF_FFFF_FFFF_FFFF
+
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76
+    value |= sub_ms << 64
+    value |= 0b10 << 62
+    value |= rand_b
+
+    return uuid.UUID(int=value)
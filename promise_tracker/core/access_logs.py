@@ -0,0 +1,30 @@
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+
+# Reads the "request" lines of the JSON logs that loguru writes with LOGGING_FORMAT=prod. Lines that were shipped
+# elsewhere and exported with the request fields at the top level are read as well.
+def read_requests(paths: list[str]) -> Iterator[dict]:
+    for path in paths:
+        with Path(path).open(encoding="utf-8") as log_file:
+            for line in log_file:
+                line = line.strip()
+
+                if not line:
+                    continue
+
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+                record = entry.get("record")
+
+                if record is not None:
+                    if record.get("message") != "request":
+                        continue
+
+                    yield {**record["extra"], "timestamp": record["time"]["timestamp"]}
+                elif "method" in entry and "path" in entry:
+                    yield entry
@@ -1,6 +1,33 @@
+from celery.signals import before_task_publish, task_failure, task_postrun, task_prerun
 from django.apps import AppConfig
+from django.conf import settings
+from django.db.backends.signals import connection_created
 
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'promise_tracker.core'
+
+    def ready(self):
+        from promise_tracker.core.database import apply_sqlite_pragmas
+        from promise_tracker.core.slow_queries import install_slow_query_log
+        from promise_tracker.core.telemetry import instrument_cache_backends
+        from promise_tracker.core.tracing import (
+            end_task_span,
+            inject_task_traceparent,
+            install_query_tracing,
+            record_task_failure,
+            start_task_span,
+        )
+
+        connection_created.connect(apply_sqlite_pragmas, dispatch_uid="apply_sqlite_pragmas")
+        connection_created.connect(install_slow_query_log, dispatch_uid="install_slow_query_log")
+        connection_created.connect(install_query_tracing, dispatch_uid="install_query_tracing")
+
+        before_task_publish.connect(inject_task_traceparent, weak=False, dispatch_uid="inject_task_traceparent")
+        task_prerun.connect(start_task_span, weak=False, dispatch_uid="start_task_span")
+        task_failure.connect(record_task_failure, weak=False, dispatch_uid="record_task_failure")
+        task_postrun.connect(end_task_span, weak=False, dispatch_uid="end_task_span")
+
+        if settings.REQUEST_TELEMETRY_ENABLED:
+            instrument_cache_backends()
@@ -0,0 +1,290 @@
+import json
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TypeVar
+
+import django
+from django.db import connection, transaction
+from django.test import Client
+from django.urls import reverse
+
+from promise_tracker.classifiers.models import Convocation
+from promise_tracker.core.datasets import REFERENCE_DATE
+from promise_tracker.promises.models import Promise, PromiseResult
+from promise_tracker.promises.services.promise_result_services import PromiseResultService
+from promise_tracker.promises.services.promise_services import PromiseService
+from promise_tracker.users.models import BaseUser
+
+RowT = TypeVar("RowT")
+
+# Tracing allocations slows every call down several times, so memory is measured in its own short pass
+MEMORY_ITERATIONS = 3
+
+# Relative changes of the latencies and allocations below this are reported as noise when comparing reports
+COMPARE_NOISE_RATIO = 0.1
+
+
+@dataclass
+class Scenario:
+    name: str
+    # Runs the measured work once and returns the size of the response body, when there is one
+    run: Callable[[], int | None]
+    # Writes are rolled back after every run, so each one sees the same dataset
+    rollback: bool = False
+
+
+class QueryCounter:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+
+        return execute(sql, params, many, context)
+
+
+def _run_once(scenario: Scenario) -> tuple[float, int | None]:
+    if not scenario.rollback:
+        started_at = time.perf_counter()
+        response_bytes = scenario.run()
+
+        return time.perf_counter() - started_at, response_bytes
+
+    with transaction.atomic():
+        started_at = time.perf_counter()
+        response_bytes = scenario.run()
+        duration = time.perf_counter() - started_at
+
+        transaction.set_rollback(True)
+
+    return duration, response_bytes
+
+
+def get_percentile(sorted_durations: list[float], percent: int) -> float:
+    if len(sorted_durations) == 1:
+        return sorted_durations[0]
+
+    return statistics.quantiles(sorted_durations, n=100, method="inclusive")[percent - 1]
+
+
+def measure(scenario: Scenario, iterations: int, warmup: int) -> dict:
+    # The first runs fill the per-process caches, such as compiled templates and role checks
+    for _ in range(warmup):
+        _run_once(scenario)
+
+    durations = []
+    query_counts = []
+    response_bytes = None
+
+    for _ in range(iterations):
+        counter = QueryCounter()
+
+        with connection.execute_wrapper(counter):
+            duration, response_bytes = _run_once(scenario)
+
+        durations.append(duration)
+        query_counts.append(counter.count)
+
+    peak_allocated_bytes = 0
+
+    for _ in range(MEMORY_ITERATIONS):
+        tracemalloc.start()
+
+        try:
+            _run_once(scenario)
+            peak_allocated_bytes = max(peak_allocated_bytes, tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+
+    durations.sort()
+
+    return {
+        "iterations": iterations,
+        "p50_ms": round(get_percentile(durations, 50) * 1000, 3),
+        "p95_ms": round(get_percentile(durations, 95) * 1000, 3),
+        "p99_ms": round(get_percentile(durations, 99) * 1000, 3),
+        "max_ms": round(durations[-1] * 1000, 3),
+        "queries": max(query_counts),
+        "peak_allocated_bytes": peak_allocated_bytes,
+        "response_bytes": response_bytes,
+    }
+
+
+def _get_page(client: Client, url: str, headers: dict | None = None) -> Callable[[], int]:
+    def run() -> int:
+        response = client.get(url, headers=headers)
+
+        if response.status_code != 200:
+            raise RuntimeError(f"{url} responded with {response.status_code}")
+
+        return len(response.content)
+
+    return run
+
+
+def _call(method: Callable, **kwargs) -> Callable[[], None]:
+    def run() -> None:
+        method(**kwargs)
+
+    return run
+
+
+def _require(row: RowT | None, description: str) -> RowT:
+    if row is None:
+        raise RuntimeError(f"The benchmark database has no {description}")
+
+    return row
+
+
+def get_scenarios() -> list[Scenario]:
+    admin = BaseUser.objects.filter(is_admin=True).order_by("email").first()
+    registered = BaseUser.objects.filter(is_admin=False).order_by("email").first()
+
+    if admin is None or registered is None:
+        raise RuntimeError("The benchmark database has no dataset, it was built without users")
+
+    guest_client = Client()
+    admin_client = Client()
+    admin_client.force_login(admin)
+
+    # The newest approved promise tops the list that guests open first
+    promise = _require(
+        Promise.objects.filter(review_status=Promise.ReviewStatus.APPROVED).order_by("-date").first(),
+        "approved promise",
+    )
+    pending_promise = _require(
+        Promise.objects.filter(review_status=Promise.ReviewStatus.PENDING).order_by("name").first(),
+        "pending promise",
+    )
+    # Results can only be added to and approved for promises that have no approved final result yet
+    open_promises = Promise.objects.filter(review_status=Promise.ReviewStatus.APPROVED).exclude(
+        id__in=PromiseResult.objects.filter(is_final=True, review_status=PromiseResult.ReviewStatus.APPROVED).values(
+            "promise_id"
+        )
+    )
+    open_promise = _require(open_promises.order_by("name").first(), "approved promise without a final result")
+    pending_result = _require(
+        PromiseResult.objects.filter(
+            promise__in=open_promises, review_status=PromiseResult.ReviewStatus.PENDING, is_final=False
+        )
+        .order_by("promise__name", "name")
+        .first(),
+        "pending result of an approved promise without a final result",
+    )
+    convocation = _require(Convocation.objects.order_by("name").first(), "convocation")
+    party = _require(convocation.political_parties.order_by("name").first(), f"political party in {convocation}")
+
+    list_url = reverse("promises:promises:list")
+
+    return [
+        Scenario("promise_list_guest", _get_page(guest_client, list_url)),
+        Scenario("promise_list_admin", _get_page(admin_client, list_url)),
+        Scenario(
+            "promise_list_htmx_filtered",
+            _get_page(guest_client, f"{list_url}?party={party.id}&page=2", headers={"HX-Request": "true"}),
+        ),
+        Scenario("promise_detail", _get_page(guest_client, reverse("promises:promises:details", args=[promise.id]))),
+        Scenario("result_list_admin", _get_page(admin_client, reverse("promises:promise_results:list"))),
+        Scenario("analytics", _get_page(guest_client, reverse("promises:promise_analytics:analytics"))),
+        Scenario(
+            "create_promise",
+            _call(
+                PromiseService(performed_by=registered).create_promise,
+                name="Benchmark promise",
+                description="Benchmark description",
+                sources=["https://example.com/benchmark"],
+                date=REFERENCE_DATE,
+                party_id=party.id,
+                convocation_id=convocation.id,
+            ),
+            rollback=True,
+        ),
+        Scenario(
+            "create_result",
+            _call(
+                PromiseResultService(performed_by=registered).create_result,
+                name="Benchmark result",
+                description="Benchmark description",
+                sources=["https://example.com/benchmark"],
+                is_final=False,
+                date=REFERENCE_DATE,
+                promise_id=open_promise.id,
+            ),
+            rollback=True,
+        ),
+        Scenario(
+            "approve_promise",
+            _call(
+                PromiseService(performed_by=admin).evaluate_promise,
+                id=pending_promise.id,
+                new_status=Promise.ReviewStatus.APPROVED,
+            ),
+            rollback=True,
+        ),
+        Scenario(
+            "approve_result",
+            _call(
+                PromiseResultService(performed_by=admin).evaluate_result,
+                id=pending_result.id,
+                new_status=PromiseResult.ReviewStatus.APPROVED,
+            ),
+            rollback=True,
+        ),
+    ]
+
+
+def get_commit() -> str | None:
+    try:
+        completed = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return completed.stdout.strip()
+
+
+def get_environment() -> dict:
+    return {
+        "commit": get_commit(),
+        "database": connection.vendor,
+        "django": django.get_version(),
+        "python": sys.version.split()[0],
+    }
+
+
+def write_report(report: dict, path: Path) -> None:
+    # Sorted keys and one value per line keep the reports of two commits diffable line by line
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+def compare_reports(baseline: dict, current: dict) -> list[str]:
+    lines = []
+
+    for name, measurement in current["scenarios"].items():
+        previous = baseline["scenarios"].get(name)
+
+        if previous is None:
+            lines.append(f"{name}: new")
+            continue
+
+        changes = []
+
+        for key in ("p50_ms", "p95_ms", "p99_ms", "peak_allocated_bytes"):
+            ratio = measurement[key] / previous[key] - 1 if previous[key] else 0
+
+            if abs(ratio) >= COMPARE_NOISE_RATIO:
+                changes.append(f"{key} {previous[key]} -> {measurement[key]} ({ratio:+.0%})")
+
+        for key in ("queries", "response_bytes"):
+            if measurement[key] != previous[key]:
+                changes.append(f"{key} {previous[key]} -> {measurement[key]}")
+
+        lines.append(f"{name}: {', '.join(changes) or 'unchanged'}")
+
+    return lines
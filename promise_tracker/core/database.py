@@ -0,0 +1,50 @@
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import transaction
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+write_lock = threading.Lock()
+
+
+def get_sqlite_pragmas() -> dict[str, str | int]:
+    return {
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+        "temp_store": settings.SQLITE_TEMP_STORE,
+    }
+
+
+def apply_sqlite_pragmas(sender, connection: BaseDatabaseWrapper, **kwargs) -> None:
+    if connection.vendor != "sqlite" or not settings.SQLITE_TUNING_ENABLED:
+        return
+
+    with connection.cursor() as cursor:
+        for name, value in get_sqlite_pragmas().items():
+            cursor.execute(f"PRAGMA {name} = {value};")
+
+    # A transaction_mode database option, such as the one of the write serialization, is already applied
+    if settings.SQLITE_TRANSACTION_MODE and not connection.settings_dict["OPTIONS"].get("transaction_mode"):
+        # The SQLite backend reads the attribute at every BEGIN, the stubs do not declare it
+        setattr(connection, "transaction_mode", settings.SQLITE_TRANSACTION_MODE.upper())
+
+
+@contextmanager
+def write_transaction(using: str | None = None) -> Iterator[None]:
+    connection = transaction.get_connection(using)
+
+    # Nested writes are already covered by the outer transaction, and waiting for the lock while holding
+    # the database write lock could deadlock with another thread
+    if not settings.SQLITE_WRITE_SERIALIZATION_ENABLED or connection.vendor != "sqlite" or connection.in_atomic_block:
+        with transaction.atomic(using=using):
+            yield
+        return
+
+    # Threads of the same process queue on the lock instead of polling SQLite through busy_timeout
+    with write_lock, transaction.atomic(using=using):
+        yield
@@ -0,0 +1,385 @@
+import multiprocessing
+import random
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from uuid import UUID
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Group
+from django.db import DEFAULT_DB_ALIAS, connection, connections, transaction
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import Field, Model
+from django.utils import timezone
+
+from promise_tracker.classifiers.models import Convocation, PoliticalParty
+from promise_tracker.common.uuids import uuid7
+from promise_tracker.core.roles import Administrator, RegisteredUser
+from promise_tracker.promises.models import Promise, PromiseResult
+from promise_tracker.users.models import BaseUser
+
+# Dataset sizes by the number of promise and result rows they hold
+SCALES = {
+    "10k": 10_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+}
+
+DATASET_PASSWORD = "Benchmark-Password-1"
+ADMIN_COUNT = 3
+
+# Promises are generated in blocks with a generator of their own, so neither the batch size nor the number of
+# worker processes changes the rows a seed generates
+BLOCK_SIZE = 1_000
+
+# Dates are fixed instead of relative to today, so a seed builds the same rows on every day it is run
+REFERENCE_DATE = date(2025, 1, 1)
+REFERENCE_TIME = timezone.make_aware(datetime(2025, 1, 1, 12, 0))
+FIRST_PROMISE_DATE = date(2010, 1, 1)
+PARTY_ESTABLISHED_DATE = date(2000, 1, 1)
+
+UNPREPARED_FIELD_TYPES = {"BooleanField", "CharField", "TextField"}
+
+WORDS = (
+    "budget tax school hospital road pension wage energy housing transport police court health border "
+    "tariff grant reform audit census climate forest river railway airport library museum farm fishery"
+).split()
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    promises: int
+    results_per_promise: int = 3
+    parties: int = 20
+    convocations: int = 8
+    users: int = 100
+    seed: int = 0
+    # Share of the promises with results whose last result is final
+    final_share: float = 0.5
+
+    @classmethod
+    def for_rows(cls, rows: int, seed: int = 0) -> "DatasetSpec":
+        results_per_promise = 3
+        promises = max(1, rows // (1 + results_per_promise))
+
+        return cls(
+            promises=promises,
+            results_per_promise=results_per_promise,
+            users=max(10, promises // 50),
+            seed=seed,
+        )
+
+
+@dataclass(frozen=True)
+class ConvocationPeriod:
+    id: UUID
+    start_date: date
+    days: int
+    party_ids: list[UUID]
+
+
+# The ids the promises refer to, passed to the worker processes instead of model instances
+@dataclass(frozen=True)
+class DatasetContext:
+    admin_ids: list[UUID]
+    user_ids: list[UUID]
+    convocations: list[ConvocationPeriod]
+
+
+def _get_rng(spec: DatasetSpec, part: str) -> random.Random:
+    # String seeds are hashed with SHA-512, so they give the same sequence in every process and Python run
+    return random.Random(f"{spec.seed}:{part}")
+
+
+def _make_text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _create_users(spec: DatasetSpec) -> tuple[list[UUID], list[UUID]]:
+    # Hashing is deliberately slow, every generated user shares one hash
+    password = make_password(DATASET_PASSWORD)
+
+    admins = [
+        BaseUser(
+            email=f"admin{index}@example.com",
+            username=f"admin{index}",
+            name="Admin",
+            surname=str(index),
+            password=password,
+            is_admin=True,
+            is_verified=True,
+        )
+        for index in range(ADMIN_COUNT)
+    ]
+    users = [
+        BaseUser(
+            email=f"user{index}@example.com",
+            username=f"user{index}",
+            name="User",
+            surname=str(index),
+            password=password,
+            is_verified=True,
+        )
+        for index in range(spec.users)
+    ]
+
+    BaseUser.objects.bulk_create(admins + users, batch_size=BLOCK_SIZE)
+
+    # The same roles the user factories assign, written straight into the membership table
+    registered_group, _ = Group.objects.get_or_create(name=RegisteredUser.get_name())
+    admin_group, _ = Group.objects.get_or_create(name=Administrator.get_name())
+    membership = BaseUser.groups.through
+
+    membership.objects.bulk_create(
+        [membership(baseuser_id=user.id, group_id=registered_group.pk) for user in admins + users]
+        + [membership(baseuser_id=admin.id, group_id=admin_group.pk) for admin in admins],
+        batch_size=BLOCK_SIZE,
+    )
+
+    return [admin.id for admin in admins], [user.id for user in users]
+
+
+def _create_classifiers(spec: DatasetSpec, admin_id: UUID) -> list[ConvocationPeriod]:
+    rng = _get_rng(spec, "classifiers")
+
+    parties = PoliticalParty.objects.bulk_create(
+        PoliticalParty(name=f"Party {index}", established_date=PARTY_ESTABLISHED_DATE, created_by_id=admin_id)
+        for index in range(spec.parties)
+    )
+
+    # Convocations follow each other, every promise is dated within the convocation it was made in
+    days = max(1, (REFERENCE_DATE - FIRST_PROMISE_DATE).days // spec.convocations)
+    convocations = Convocation.objects.bulk_create(
+        Convocation(
+            name=f"Convocation {index}",
+            start_date=FIRST_PROMISE_DATE + timedelta(days=index * days),
+            end_date=FIRST_PROMISE_DATE + timedelta(days=(index + 1) * days - 1),
+            created_by_id=admin_id,
+        )
+        for index in range(spec.convocations)
+    )
+
+    periods = [
+        ConvocationPeriod(
+            id=convocation.id,
+            start_date=convocation.start_date,
+            days=days,
+            party_ids=[party.id for party in rng.sample(parties, k=max(1, spec.parties // 2))],
+        )
+        for convocation in convocations
+    ]
+    # The model annotates the field as a plain Field, which does not know the through model
+    membership: type[Model] = getattr(Convocation, "political_parties").through
+
+    membership.objects.bulk_create(
+        membership(convocation_id=period.id, politicalparty_id=party_id)
+        for period in periods
+        for party_id in period.party_ids
+    )
+
+    return periods
+
+
+def _make_promise(
+    index: int, rng: random.Random, spec: DatasetSpec, context: DatasetContext, descriptions: list[str]
+) -> tuple[dict, list[dict]]:
+    convocation = rng.choice(context.convocations)
+    # Mostly approved as in production, the review queue and the rejections are a small share
+    review_status = rng.choices(
+        [Promise.ReviewStatus.APPROVED, Promise.ReviewStatus.PENDING, Promise.ReviewStatus.REJECTED], [8, 1, 1]
+    )[0]
+    is_reviewed = review_status != Promise.ReviewStatus.PENDING
+
+    promise = {
+        "id": uuid7(),
+        "name": f"Promise {index}",
+        "description": rng.choice(descriptions),
+        "sources": f"https://example.com/promises/{index}",
+        "date": convocation.start_date + timedelta(days=rng.randrange(convocation.days)),
+        "party_id": rng.choice(convocation.party_ids),
+        "convocation_id": convocation.id,
+        "review_status": review_status,
+        "review_date": REFERENCE_TIME if is_reviewed else None,
+        "reviewer_id": rng.choice(context.admin_ids) if is_reviewed else None,
+        "created_by_id": rng.choice(context.user_ids),
+    }
+
+    return promise, _make_results(promise, rng, spec, context, descriptions)
+
+
+def _make_results(
+    promise: dict, rng: random.Random, spec: DatasetSpec, context: DatasetContext, descriptions: list[str]
+) -> list[dict]:
+    results = []
+    # Every promise gets the same number of results, as --results means outside bulk mode too
+    count = spec.results_per_promise
+    result_date = promise["date"]
+
+    for index in range(count):
+        result_date = min(REFERENCE_DATE, result_date + timedelta(days=rng.randrange(1, 365)))
+
+        # Results of promises that were not approved stay in review. Only the last, and so the latest, result can be
+        # final, which keeps the rules of the result service: nothing follows an approved final result.
+        if promise["review_status"] == Promise.ReviewStatus.APPROVED:
+            review_status = rng.choices(
+                [PromiseResult.ReviewStatus.APPROVED, PromiseResult.ReviewStatus.PENDING], [4, 1]
+            )[0]
+        else:
+            review_status = PromiseResult.ReviewStatus.PENDING
+
+        is_reviewed = review_status != PromiseResult.ReviewStatus.PENDING
+        is_final = index == count - 1 and rng.random() < spec.final_share
+
+        results.append(
+            {
+                "id": uuid7(),
+                "name": f"Result {index}",
+                "description": rng.choice(descriptions),
+                "sources": f"https://example.com/results/{index}",
+                "date": result_date,
+                "is_final": is_final,
+                "status": rng.choice(PromiseResult.CompletionStatus.values) if is_final else None,
+                "promise_id": promise["id"],
+                "review_status": review_status,
+                "review_date": REFERENCE_TIME if is_reviewed else None,
+                "reviewer_id": rng.choice(context.admin_ids) if is_reviewed else None,
+                "created_by_id": promise["created_by_id"],
+            }
+        )
+
+    return results
+
+
+class PreparedValues(dict):
+    # Most values repeat, such as the foreign keys, dates and statuses, so each is prepared for the database once
+    def __init__(self, field: Field, database: BaseDatabaseWrapper) -> None:
+        super().__init__()
+        self.field = field
+        self.database = database
+
+    def __missing__(self, value):
+        prepared = self[value] = self.field.get_db_prep_save(value, self.database)
+
+        return prepared
+
+
+def _insert_rows(model: type[Model], rows: list[dict], batch_size: int) -> None:
+    # bulk_create compiles every value of every row through the ORM, which was most of the time of a bulk seed.
+    # The rows are inserted with one prepared statement instead, fields missing from them get their static default.
+    fields = [field for field in model._meta.concrete_fields if not field.generated]
+    # The connection proxy looks the connection up on every attribute access, millions of times here
+    database = connections[DEFAULT_DB_ALIAS]
+    now = timezone.now()
+    defaults = {field.attname: None if callable(field.default) else field.get_default() for field in fields}
+    defaults.update(created_at=now, updated_at=now)
+
+    columns = [(field.attname, defaults[field.attname]) for field in fields]
+    # Text and booleans go to the drivers as they are, only the other columns need preparing
+    converters = [
+        (index, PreparedValues(field, database).__getitem__)
+        for index, field in enumerate(fields)
+        if field.get_internal_type() not in UNPREPARED_FIELD_TYPES
+    ]
+    sql = "INSERT INTO {} ({}) VALUES ({})".format(
+        database.ops.quote_name(model._meta.db_table),
+        ", ".join(database.ops.quote_name(field.column) for field in fields),
+        ", ".join(["%s"] * len(fields)),
+    )
+
+    with database.cursor() as cursor:
+        for offset in range(0, len(rows), batch_size):
+            params = []
+
+            for row in rows[offset : offset + batch_size]:
+                values = [row.get(column, default) for column, default in columns]
+
+                for index, convert in converters:
+                    values[index] = convert(values[index])
+
+                params.append(values)
+
+            cursor.executemany(sql, params)
+
+
+def insert_blocks(spec: DatasetSpec, context: DatasetContext, blocks: range, batch_size: int) -> tuple[int, int]:
+    descriptions_rng = _get_rng(spec, "descriptions")
+    descriptions = [_make_text(descriptions_rng, descriptions_rng.randint(20, 80)) for _ in range(200)]
+
+    promises = []
+    results = []
+
+    for block in blocks:
+        rng = _get_rng(spec, f"block-{block}")
+
+        for index in range(block * BLOCK_SIZE, min((block + 1) * BLOCK_SIZE, spec.promises)):
+            promise, promise_results = _make_promise(index, rng, spec, context, descriptions)
+            promises.append(promise)
+            results += promise_results
+
+    # One transaction per call, a failed run keeps the blocks inserted before it
+    with transaction.atomic():
+        _insert_rows(Promise, promises, batch_size)
+        _insert_rows(PromiseResult, results, batch_size)
+
+    return len(promises), len(results)
+
+
+def _split_blocks(spec: DatasetSpec, batch_size: int) -> Iterator[range]:
+    block_count = -(-spec.promises // BLOCK_SIZE)
+    blocks_per_batch = max(1, batch_size // BLOCK_SIZE)
+
+    for first_block in range(0, block_count, blocks_per_batch):
+        yield range(first_block, min(first_block + blocks_per_batch, block_count))
+
+
+def build_dataset(
+    spec: DatasetSpec,
+    batch_size: int = 5_000,
+    workers: int = 1,
+    progress: Callable[[str], None] | None = None,
+) -> None:
+    # Rows are made in memory and inserted in batches, a transaction per batch of promises and their results
+    report = progress or (lambda message: None)
+
+    with transaction.atomic():
+        admin_ids, user_ids = _create_users(spec)
+        context = DatasetContext(
+            admin_ids=admin_ids, user_ids=user_ids, convocations=_create_classifiers(spec, admin_ids[0])
+        )
+
+    report(
+        f"Created {len(admin_ids) + len(user_ids)} users, {spec.parties} parties and {spec.convocations} convocations"
+    )
+
+    batches = list(_split_blocks(spec, batch_size))
+    promise_count = 0
+    result_count = 0
+
+    if workers <= 1:
+        for blocks in batches:
+            promises, results = insert_blocks(spec, context, blocks, batch_size)
+            promise_count += promises
+            result_count += results
+
+            report(f"Created {promise_count}/{spec.promises} promises and {result_count} results")
+    else:
+        # Spawned workers start clean instead of inheriting the open connections of this process
+        connections.close_all()
+
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn"), initializer=django.setup
+        ) as executor:
+            futures = [executor.submit(insert_blocks, spec, context, blocks, batch_size) for blocks in batches]
+
+            for future in as_completed(futures):
+                promises, results = future.result()
+                promise_count += promises
+                result_count += results
+
+                report(f"Created {promise_count}/{spec.promises} promises and {result_count} results")
+
+    # The planners pick indexes from table statistics, which only exist after the data is analyzed
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
@@ -45,3 +45,8 @@ class EmailDelayError(ApplicationError):
 class AuthenticationError(ApplicationError):
     def __init__(self, message: str = _("Authentication failed."), extra=None):
         super().__init__(message, extra)
+
+
+class PasswordHashingBusyError(ApplicationError):
+    def __init__(self, extra=None):
+        super().__init__(_("The service is busy right now, please try again in a moment."), extra)
@@ -0,0 +1,151 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test.utils import (
+    override_settings,
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+
+from promise_tracker.core.benchmarks import compare_reports, get_environment, get_scenarios, measure, write_report
+from promise_tracker.core.datasets import SCALES, DatasetSpec, build_dataset
+from promise_tracker.promises.models import Promise
+
+
+class Command(BaseCommand):
+    help = "Benchmarks the main pages and services against generated datasets of several sizes"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scale",
+            action="append",
+            choices=list(SCALES),
+            help="Dataset size to benchmark, can be repeated (default: 10k)",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=30,
+            help="Measured runs of each scenario (default: 30)",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=3,
+            help="Unmeasured runs of each scenario before the measured ones (default: 3)",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Random seed of the generated dataset (default: 0)",
+        )
+        parser.add_argument(
+            "--output-dir",
+            default="benchmarks",
+            help="Directory of the JSON reports and the SQLite benchmark databases (default: benchmarks)",
+        )
+        parser.add_argument(
+            "--keep-database",
+            action="store_true",
+            help="Keep the benchmark database and reuse it in the next run with the same scale and seed",
+        )
+        parser.add_argument(
+            "--compare",
+            help="Report of an earlier run to print the changes against, only with a single --scale",
+        )
+
+    def handle(self, *args, **options):
+        scales: list[str] = options["scale"] or ["10k"]
+        output_dir = Path(options["output_dir"])
+
+        if options["compare"] and len(scales) > 1:
+            raise CommandError("--compare needs a single --scale")
+
+        if options["iterations"] < 1:
+            raise CommandError("--iterations must be at least 1")
+
+        setup_test_environment()
+
+        try:
+            for scale in scales:
+                report = self._benchmark_scale(scale, output_dir, options)
+                path = output_dir / f"benchmark-{scale}-{report['environment']['commit'] or 'unknown'}.json"
+
+                write_report(report, path)
+
+                self.stdout.write(self.style.SUCCESS(f"Wrote {path}"))
+
+                if options["compare"]:
+                    baseline = json.loads(Path(options["compare"]).read_text())
+
+                    for line in compare_reports(baseline, report):
+                        self.stdout.write(line)
+        finally:
+            teardown_test_environment()
+
+    def _set_database_names(self, scale: str, seed: int, output_dir: Path) -> dict[str, str | None]:
+        # The datasets are built in their own databases, named like test databases so the development data is safe
+        original_names = {}
+
+        for connection in connections.all():
+            test_settings = connection.settings_dict.setdefault("TEST", {})
+            original_names[connection.alias] = test_settings.get("NAME")
+
+            if connection.vendor == "sqlite":
+                output_dir.mkdir(parents=True, exist_ok=True)
+                test_settings["NAME"] = str((output_dir / f"benchmark-{scale}-{seed}.sqlite3").resolve())
+            else:
+                test_settings["NAME"] = f"{connection.settings_dict['NAME']}_benchmark_{scale}_{seed}"
+
+        return original_names
+
+    def _benchmark_scale(self, scale: str, output_dir: Path, options: dict) -> dict:
+        spec = DatasetSpec.for_rows(SCALES[scale], seed=options["seed"])
+        keep_database = options["keep_database"]
+        original_names = self._set_database_names(scale, spec.seed, output_dir)
+
+        self.stdout.write(self.style.NOTICE(f"Benchmarking {scale}: {spec}"))
+
+        old_config = setup_databases(verbosity=0, interactive=False, keepdb=keep_database)
+
+        try:
+            if Promise.objects.count() == spec.promises:
+                self.stdout.write("Reusing the dataset of an earlier run")
+            else:
+                build_dataset(spec, progress=self.stdout.write)
+
+            scenarios = {}
+
+            # DEBUG off, as in production, keeps Django from collecting every query of the run in memory
+            with override_settings(DEBUG=False):
+                for scenario in get_scenarios():
+                    scenarios[scenario.name] = measure(scenario, options["iterations"], options["warmup"])
+
+                    self.stdout.write(
+                        f"{scenario.name}: p50 {scenarios[scenario.name]['p50_ms']} ms, "
+                        f"p95 {scenarios[scenario.name]['p95_ms']} ms, {scenarios[scenario.name]['queries']} queries"
+                    )
+        finally:
+            teardown_databases(old_config, verbosity=0, keepdb=keep_database)
+
+            for connection in connections.all():
+                connection.settings_dict["TEST"]["NAME"] = original_names[connection.alias]
+
+        return {
+            "scale": scale,
+            "dataset": {
+                "promises": spec.promises,
+                "results_per_promise": spec.results_per_promise,
+                "parties": spec.parties,
+                "convocations": spec.convocations,
+                "users": spec.users,
+                "seed": spec.seed,
+            },
+            "environment": get_environment(),
+            "scenarios": scenarios,
+        }
@@ -0,0 +1,106 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from promise_tracker.core.access_logs import read_requests
+from promise_tracker.core.benchmarks import get_environment, write_report
+from promise_tracker.core.replay import IdMapper, Replayer, compare_latencies, create_sessions, prepare_requests
+
+
+class Command(BaseCommand):
+    help = "Replays the requests of a JSON request log against a local instance and compares the latencies per URL name"
+
+    def add_arguments(self, parser):
+        parser.add_argument("logs", nargs="+", help="JSON request logs, as written with LOGGING_FORMAT=prod")
+        parser.add_argument(
+            "--host",
+            default="http://localhost:8000",
+            help="Address of the local instance, which must use this database (default: http://localhost:8000)",
+        )
+        parser.add_argument(
+            "--speed",
+            type=float,
+            default=1.0,
+            help="Replay speed relative to the recorded one, 0 sends the requests as fast as possible (default: 1)",
+        )
+        parser.add_argument(
+            "--sessions",
+            type=int,
+            default=10,
+            help="Logged in sessions per role, the recorded users are spread over them (default: 10)",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=32,
+            help="Requests in flight at most (default: 32)",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            help="Replay only the first N requests",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Random seed of mapping the recorded ids to local rows (default: 0)",
+        )
+        parser.add_argument(
+            "--output",
+            help="Write the comparison as JSON to this file",
+        )
+
+    def handle(self, *args, **options):
+        if options["speed"] < 0:
+            raise CommandError("--speed can not be negative")
+
+        if options["concurrency"] < 1:
+            raise CommandError("--concurrency must be at least 1")
+
+        requests_to_replay, skipped = prepare_requests(read_requests(options["logs"]), IdMapper(options["seed"]))
+        requests_to_replay = requests_to_replay[: options["limit"]]
+
+        if not requests_to_replay:
+            raise CommandError("The logs have no requests to replay")
+
+        sessions = {}
+
+        for role in sorted({request.role for request in requests_to_replay} - {"guest"}):
+            sessions[role] = create_sessions(role, options["sessions"])
+
+            if not sessions[role]:
+                raise CommandError(f"There are no verified {role} users to replay the {role} requests with")
+
+        self.stdout.write(f"Replaying {len(requests_to_replay)} requests, skipped {skipped['write']} writes")
+
+        results = Replayer(options["host"], sessions, options["speed"], options["concurrency"]).replay(
+            requests_to_replay
+        )
+        comparison = compare_latencies(results)
+
+        self.stdout.write(f"{'URL name':<45}{'requests':>10}{'p50':>18}{'p95':>18}{'p99':>18}{'statuses':>10}")
+
+        for pattern, row in comparison.items():
+            self.stdout.write(
+                f"{pattern:<45}{row['requests']:>10}"
+                + "".join(
+                    f"{row[f'recorded_p{percent}_ms']:>8.1f} -> {row[f'replayed_p{percent}_ms']:<6.1f}"
+                    for percent in (50, 95, 99)
+                )
+                + f"{row['status_mismatches']:>10}"
+            )
+
+        if options["output"]:
+            path = Path(options["output"])
+            write_report(
+                {
+                    "environment": get_environment(),
+                    "logs": options["logs"],
+                    "speed": options["speed"],
+                    "patterns": comparison,
+                },
+                path,
+            )
+
+            self.stdout.write(self.style.SUCCESS(f"Wrote {path}"))
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 import random
+import time
 
-from django.core.management.base import BaseCommand
-from django.db import transaction
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
 from faker import Faker
 
 from promise_tracker.classifiers.tests.factories import (
     ValidConvocationFactory,
     ValidPoliticalPartyFactory,
 )
+from promise_tracker.core.datasets import DatasetSpec, build_dataset
 from promise_tracker.promises.models import PromiseResult
 from promise_tracker.promises.tests.factories import (
     ValidPromiseFactory,
@@ -63,6 +65,23 @@ class Command(BaseCommand):
             default=None,
             help="Optional random seed for reproducible data",
         )
+        parser.add_argument(
+            "--bulk",
+            action="store_true",
+            help="Generate the rows in memory and insert them in batches, for datasets of millions of rows",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10_000,
+            help="Promises inserted per transaction in bulk mode (default: 10000)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Processes inserting promises in bulk mode, only PostgreSQL takes parallel writes (default: 1)",
+        )
 
     def handle(self, *args, **options):
         users_count: int = options["users"]
@@ -73,6 +92,10 @@ class Command(BaseCommand):
         ensure_final: bool = options["ensure_final"]
         seed = options.get("seed")
 
+        if options["bulk"]:
+            self._seed_in_bulk(options)
+            return
+
         if seed is not None:
             random.seed(seed)
 
@@ -163,3 +186,36 @@ class Command(BaseCommand):
             self.stdout.write(self.style.WARNING("Seeding interrupted by user"))
 
         self.stdout.write(self.style.SUCCESS("Seeding finished successfully."))
+
+    def _seed_in_bulk(self, options) -> None:
+        if options["workers"] > 1 and connection.vendor == "sqlite":
+            raise CommandError("SQLite takes one writer at a time, use --workers with PostgreSQL")
+
+        seed = options["seed"]
+
+        # A run without a seed still prints the one it used, so its data can be generated again
+        if seed is None:
+            seed = random.randrange(2**32)
+
+        spec = DatasetSpec(
+            promises=options["promises"],
+            results_per_promise=options["results"],
+            parties=options["parties"],
+            convocations=options["convocations"],
+            users=options["users"],
+            seed=seed,
+            final_share=1.0 if options["ensure_final"] else 0.5,
+        )
+
+        self.stdout.write(self.style.NOTICE(f"Seeding database in bulk with seed {seed}..."))
+
+        started_at = time.perf_counter()
+
+        build_dataset(
+            spec,
+            batch_size=options["batch_size"],
+            workers=options["workers"],
+            progress=lambda message: self.stdout.write(f"{message} ({time.perf_counter() - started_at:.0f}s)"),
+        )
+
+        self.stdout.write(self.style.SUCCESS(f"Seeding finished in {time.perf_counter() - started_at:.0f}s."))
@@ -0,0 +1,169 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 250)
+SIZE_BUCKETS = (1_000, 5_000, 10_000, 50_000, 100_000, 500_000, 1_000_000)
+
+HISTOGRAMS = {
+    "http_request_duration_seconds": ("Time spent handling the request.", DURATION_BUCKETS),
+    "http_request_db_seconds": ("Time spent in database queries.", DURATION_BUCKETS),
+    "http_request_db_queries": ("Number of database queries.", QUERY_COUNT_BUCKETS),
+    "http_request_render_seconds": ("Time spent rendering templates, without their queries.", DURATION_BUCKETS),
+    "http_response_size_bytes": ("Size of the response body.", SIZE_BUCKETS),
+}
+
+COUNTERS = {
+    "http_requests_total": "Number of handled requests.",
+    "http_cache_requests_total": "Number of cache lookups.",
+}
+
+
+class MetricsRegistry:
+    # Samples are keyed by metric name and sorted label pairs, histograms hold per-bucket counts, sum and count
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.histograms: dict[tuple, dict] = {}
+        self.counters: dict[tuple, float] = {}
+        self.flushed_at = 0.0
+
+    def observe(self, name: str, labels: dict[str, str], value: float) -> None:
+        buckets = HISTOGRAMS[name][1]
+        key = (name, tuple(sorted(labels.items())))
+
+        with self.lock:
+            sample = self.histograms.setdefault(key, {"buckets": [0] * len(buckets), "sum": 0.0, "count": 0})
+
+            for index, bound in enumerate(buckets):
+                if value <= bound:
+                    sample["buckets"][index] += 1
+                    break
+
+            sample["sum"] += value
+            sample["count"] += 1
+
+    def inc(self, name: str, labels: dict[str, str], amount: float = 1) -> None:
+        key = (name, tuple(sorted(labels.items())))
+
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {
+                "histograms": [[name, list(labels), sample] for (name, labels), sample in self.histograms.items()],
+                "counters": [[name, list(labels), value] for (name, labels), value in self.counters.items()],
+            }
+
+    def reset(self) -> None:
+        with self.lock:
+            self.histograms.clear()
+            self.counters.clear()
+
+
+registry = MetricsRegistry()
+
+
+def _get_process_file() -> Path:
+    return Path(settings.REQUEST_METRICS_DIR) / f"{os.getpid()}.json"
+
+
+def flush_metrics(force: bool = False) -> None:
+    # Every gunicorn worker writes its own snapshot, so a scrape that lands on any of them sees all of them
+    if not settings.REQUEST_METRICS_DIR:
+        return
+
+    now = time.monotonic()
+
+    if not force and now - registry.flushed_at < settings.REQUEST_METRICS_FLUSH_SECONDS:
+        return
+
+    registry.flushed_at = now
+
+    path = _get_process_file()
+    temporary_path = path.with_suffix(".tmp")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path.write_text(json.dumps(registry.snapshot()))
+    os.replace(temporary_path, path)
+
+
+def _load_snapshots() -> list[dict]:
+    if not settings.REQUEST_METRICS_DIR:
+        return [registry.snapshot()]
+
+    flush_metrics(force=True)
+
+    snapshots = []
+
+    for path in Path(settings.REQUEST_METRICS_DIR).glob("*.json"):
+        try:
+            snapshots.append(json.loads(path.read_text()))
+        except (OSError, ValueError):
+            # A worker may replace its file while it is read, its next flush is picked up by the next scrape
+            continue
+
+    return snapshots
+
+
+def _escape_label_value(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: list, extra: tuple = ()) -> str:
+    pairs = [*labels, *extra]
+
+    if not pairs:
+        return ""
+
+    return "{" + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in pairs) + "}"
+
+
+def render_metrics() -> str:
+    histograms: dict[tuple, dict] = {}
+    counters: dict[tuple, float] = {}
+
+    for snapshot in _load_snapshots():
+        for name, labels, sample in snapshot["histograms"]:
+            key = (name, tuple(tuple(pair) for pair in labels))
+            merged = histograms.setdefault(key, {"buckets": [0] * len(sample["buckets"]), "sum": 0.0, "count": 0})
+            merged["buckets"] = [total + count for total, count in zip(merged["buckets"], sample["buckets"])]
+            merged["sum"] += sample["sum"]
+            merged["count"] += sample["count"]
+
+        for name, labels, value in snapshot["counters"]:
+            key = (name, tuple(tuple(pair) for pair in labels))
+            counters[key] = counters.get(key, 0) + value
+
+    lines = []
+
+    for name, (help_text, buckets) in HISTOGRAMS.items():
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+
+        for (sample_name, labels), sample in sorted(histograms.items()):
+            if sample_name != name:
+                continue
+
+            cumulative = 0
+
+            for bound, count in zip(buckets, sample["buckets"]):
+                cumulative += count
+                lines.append(f"{name}_bucket{_format_labels(labels, (('le', bound),))} {cumulative}")
+
+            lines.append(f"{name}_bucket{_format_labels(labels, (('le', '+Inf'),))} {sample['count']}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {sample['sum']}")
+            lines.append(f"{name}_count{_format_labels(labels)} {sample['count']}")
+
+    for name, help_text in COUNTERS.items():
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+
+        for (sample_name, labels), value in sorted(counters.items()):
+            if sample_name == name:
+                lines.append(f"{name}{_format_labels(labels)} {value}")
+
+    return "\n".join(lines) + "\n"
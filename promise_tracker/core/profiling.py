@@ -0,0 +1,91 @@
+import cProfile
+import io
+import json
+import pstats
+import threading
+from datetime import datetime
+from pathlib import Path
+from uuid import UUID
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from promise_tracker.common.uuids import uuid7
+
+PROFILE_SORT_KEYS = ("cumulative", "tottime", "calls")
+
+# cProfile hooks the whole interpreter, so a process profiles one request at a time
+profiler_lock = threading.Lock()
+
+
+def get_profiles_dir() -> Path:
+    return Path(settings.REQUEST_PROFILING_DIR)
+
+
+def take_profiling_slot(user_id) -> bool:
+    # Counts the profiles of a user per clock hour, the window is approximate but keeps the cost bounded
+    key = f"request-profiler:{user_id}:{timezone.now():%Y%m%d%H}"
+
+    cache.add(key, 0, timeout=60 * 60)
+
+    return cache.incr(key) <= settings.REQUEST_PROFILING_MAX_PER_HOUR
+
+
+def save_profile(profiler: cProfile.Profile, metadata: dict) -> UUID:
+    profile_id = uuid7()
+    profiles_dir = get_profiles_dir()
+    profiles_dir.mkdir(parents=True, exist_ok=True)
+
+    profiler.dump_stats(profiles_dir / f"{profile_id}.prof")
+    (profiles_dir / f"{profile_id}.json").write_text(
+        json.dumps({**metadata, "id": str(profile_id), "created_at": timezone.now().isoformat()})
+    )
+
+    prune_profiles()
+
+    return profile_id
+
+
+def prune_profiles() -> None:
+    # Profile ids are time ordered, so the oldest ones sort first
+    metadata_files = sorted(get_profiles_dir().glob("*.json"))
+
+    for metadata_file in metadata_files[: -settings.REQUEST_PROFILING_MAX_STORED or None]:
+        metadata_file.unlink(missing_ok=True)
+        metadata_file.with_suffix(".prof").unlink(missing_ok=True)
+
+
+def _read_metadata(metadata_file: Path) -> dict:
+    metadata = json.loads(metadata_file.read_text())
+    metadata["created_at"] = datetime.fromisoformat(metadata["created_at"])
+
+    return metadata
+
+
+def get_profiles() -> list[dict]:
+    return [_read_metadata(metadata_file) for metadata_file in sorted(get_profiles_dir().glob("*.json"), reverse=True)]
+
+
+def get_profile_path(profile_id: UUID) -> Path | None:
+    path = get_profiles_dir() / f"{profile_id}.prof"
+
+    return path if path.exists() else None
+
+
+def get_profile(profile_id: UUID) -> dict | None:
+    metadata_file = get_profiles_dir() / f"{profile_id}.json"
+
+    if not metadata_file.exists():
+        return None
+
+    return _read_metadata(metadata_file)
+
+
+def get_profile_report(profile_id: UUID, sort_by: str, limit: int = 60) -> str:
+    output = io.StringIO()
+
+    stats = pstats.Stats(str(get_profiles_dir() / f"{profile_id}.prof"), stream=output)
+    stats.sort_stats(sort_by).print_stats(limit)
+
+    return output.getvalue()
@@ -0,0 +1,321 @@
+import random
+import threading
+import time
+import zlib
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from importlib import import_module
+
+import requests
+from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.db.models import Model
+from django.urls import Resolver404, resolve, reverse
+from django.utils import translation
+from django.utils.translation import get_language_from_path
+
+from promise_tracker.classifiers.models import Convocation, PoliticalParty
+from promise_tracker.core.benchmarks import get_percentile
+from promise_tracker.promises.models import Promise, PromiseResult
+from promise_tracker.users.models import BaseUser
+
+# Writes would need the forms of the recorded users and change the local data, only reads are replayed
+REPLAYED_METHODS = ("GET", "HEAD")
+
+# The local rows that the ids of the recorded URLs are mapped to, randomly sampled once per model
+ID_POOL_SIZE = 10_000
+
+# The models behind the ids in the URLs. The result views of a promise also take its id as promise_id.
+RESULT_VIEWS = {
+    "promises:promises:edit_result",
+    "promises:promises:approve_result",
+    "promises:promises:reject_result",
+    "promises:promises:delete_result",
+    "promises:review_queue:approve_result",
+    "promises:review_queue:reject_result",
+}
+ID_MODELS_BY_NAMESPACE = {
+    "promises:promises": Promise,
+    "promises:review_queue": Promise,
+    "classifiers:political_parties": PoliticalParty,
+    "classifiers:convocations": Convocation,
+    "users": BaseUser,
+}
+# Guests only see approved promises and results, the ids of the others would not be found for most of the log
+APPROVED_STATUSES: dict[type[Model], str] = {
+    Promise: Promise.ReviewStatus.APPROVED,
+    PromiseResult: PromiseResult.ReviewStatus.APPROVED,
+}
+# Ids of rows that the generated datasets do not have, such as moderation jobs and profiles, are kept as recorded
+UNMAPPED_VIEWS = {"users:moderation_job"}
+
+
+@dataclass
+class ReplayRequest:
+    # Seconds after the first recorded request
+    offset: float
+    method: str
+    path: str
+    query: str
+    # Sent with the HX-Request header, which renders only the fragment that htmx swaps in
+    htmx: bool
+    # The URL name, latencies are compared per URL name and separately for htmx requests
+    pattern: str
+    role: str
+    user: str
+    recorded_ms: float
+    recorded_status: int | None
+
+
+@dataclass
+class ReplayResult:
+    pattern: str
+    recorded_ms: float
+    replayed_ms: float
+    recorded_status: int | None
+    # 0 when the request failed without a response
+    status: int
+    # How much later than scheduled the request was sent, when the workers could not keep up
+    lag_ms: float
+
+
+def _get_id_model(view_name: str, kwarg: str) -> type[Model] | None:
+    if view_name in UNMAPPED_VIEWS:
+        return None
+
+    if kwarg == "promise_id":
+        return Promise
+
+    if view_name in RESULT_VIEWS:
+        return PromiseResult
+
+    return ID_MODELS_BY_NAMESPACE.get(view_name.rpartition(":")[0])
+
+
+class IdMapper:
+    def __init__(self, seed: int = 0) -> None:
+        self.rng = random.Random(seed)
+        self.pools: dict[type[Model], list] = {}
+        self.mapped: dict[tuple[type[Model], str], object] = {}
+        self.result_promise_ids: dict[object, object] = {}
+
+    def _get_pool(self, model: type[Model]) -> list:
+        if model not in self.pools:
+            queryset = model.objects.all()
+
+            if model in APPROVED_STATUSES:
+                queryset = queryset.filter(review_status=APPROVED_STATUSES[model])
+
+            self.pools[model] = list(queryset.order_by("?").values_list("id", flat=True)[:ID_POOL_SIZE])
+
+        return self.pools[model]
+
+    def _get_local_id(self, model: type[Model], recorded_id) -> object:
+        key = (model, str(recorded_id))
+
+        # The same recorded id always maps to the same local row, so repeated visits stay repeated
+        if key not in self.mapped:
+            pool = self._get_pool(model)
+            self.mapped[key] = self.rng.choice(pool) if pool else recorded_id
+
+        return self.mapped[key]
+
+    def _get_result_promise_id(self, result_id, recorded_promise_id) -> object:
+        if result_id not in self.result_promise_ids:
+            promise_id = PromiseResult.objects.filter(id=result_id).values_list("promise_id", flat=True).first()
+            # Without local results the result id is kept as recorded, and so is the promise it belongs to
+            self.result_promise_ids[result_id] = promise_id or self._get_local_id(Promise, recorded_promise_id)
+
+        return self.result_promise_ids[result_id]
+
+    def map_path(self, path: str) -> tuple[str, str]:
+        # The language prefix only resolves while its language is active
+        with translation.override(get_language_from_path(path)):
+            match = resolve(path)
+
+            # The result views of a promise only find the result under its own promise, so the promise is taken from
+            # the mapped result instead of being mapped on its own
+            takes_result_promise = match.view_name in RESULT_VIEWS and "promise_id" in match.kwargs
+            kwargs = {}
+
+            for name, value in match.kwargs.items():
+                model = _get_id_model(match.view_name, name)
+
+                if model is None or (takes_result_promise and name == "promise_id"):
+                    kwargs[name] = value
+                else:
+                    kwargs[name] = self._get_local_id(model, value)
+
+            if takes_result_promise:
+                kwargs["promise_id"] = self._get_result_promise_id(kwargs["id"], match.kwargs["promise_id"])
+
+            return reverse(match.view_name, kwargs=kwargs), match.view_name
+
+
+def prepare_requests(entries: Iterable[dict], mapper: IdMapper) -> tuple[list[ReplayRequest], Counter[str]]:
+    entries = sorted(
+        (entry for entry in entries if entry.get("timestamp") is not None and entry.get("duration_ms") is not None),
+        key=lambda entry: entry["timestamp"],
+    )
+    prepared = []
+    skipped: Counter[str] = Counter()
+
+    for entry in entries:
+        if entry["method"] not in REPLAYED_METHODS:
+            skipped["write"] += 1
+            continue
+
+        try:
+            path, pattern = mapper.map_path(entry["path"])
+        except Resolver404:
+            # Such as the redirects to a language prefix, and 404s, which are part of the traffic too
+            path, pattern = entry["path"], "unresolved"
+
+        htmx = bool(entry.get("htmx"))
+        pattern = entry.get("view") or pattern
+
+        # Named like the htmx requests of the load test
+        if htmx:
+            pattern = f"{pattern} [htmx]"
+
+        prepared.append(
+            ReplayRequest(
+                offset=entry["timestamp"] - entries[0]["timestamp"],
+                method=entry["method"],
+                path=path,
+                query=entry.get("query", ""),
+                htmx=htmx,
+                pattern=pattern,
+                role=entry.get("role", "guest"),
+                user=entry.get("user", "anonymous"),
+                recorded_ms=entry["duration_ms"],
+                recorded_status=entry.get("status"),
+            )
+        )
+
+    return prepared, skipped
+
+
+def create_sessions(role: str, count: int) -> list[str]:
+    # Logged in straight through the session store, like the test client does, so the replay is not held up by
+    # password hashing
+    users = BaseUser.objects.filter(is_active=True, is_verified=True, is_admin=role == "admin").order_by("email")
+    engine = import_module(settings.SESSION_ENGINE)
+    session_keys = []
+
+    for user in users[:count]:
+        session = engine.SessionStore()
+        session[SESSION_KEY] = user._meta.pk.value_to_string(user)
+        session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+        session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        session.save()
+
+        session_keys.append(session.session_key)
+
+    return session_keys
+
+
+class Replayer:
+    def __init__(self, base_url: str, sessions: dict[str, list[str]], speed: float, concurrency: int) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.sessions = sessions
+        self.speed = speed
+        self.concurrency = concurrency
+        self.local = threading.local()
+
+    def _get_cookies(self, request: ReplayRequest) -> dict[str, str]:
+        session_keys = self.sessions.get(request.role)
+
+        if not session_keys:
+            return {}
+
+        # Each recorded user keeps one local session, spread evenly over the pool of its role
+        index = zlib.crc32(request.user.encode()) % len(session_keys)
+
+        return {settings.SESSION_COOKIE_NAME: session_keys[index]}
+
+    def _send(self, request: ReplayRequest, scheduled_at: float, started_at: float) -> ReplayResult:
+        if not hasattr(self.local, "session"):
+            self.local.session = requests.Session()
+
+        # The cookies that earlier responses set belong to other recorded users
+        self.local.session.cookies.clear()
+
+        url = f"{self.base_url}{request.path}"
+
+        if request.query:
+            url = f"{url}?{request.query}"
+
+        headers = {"HX-Request": "true"} if request.htmx else {}
+        sent_at = time.perf_counter()
+
+        try:
+            response = self.local.session.request(
+                request.method,
+                url,
+                headers=headers,
+                cookies=self._get_cookies(request),
+                allow_redirects=False,
+                timeout=60,
+            )
+            status = response.status_code
+        except requests.RequestException:
+            status = 0
+
+        return ReplayResult(
+            pattern=request.pattern,
+            recorded_ms=request.recorded_ms,
+            replayed_ms=(time.perf_counter() - sent_at) * 1000,
+            recorded_status=request.recorded_status,
+            status=status,
+            lag_ms=max(0.0, (sent_at - started_at - scheduled_at) * 1000),
+        )
+
+    def replay(self, requests_to_replay: list[ReplayRequest]) -> list[ReplayResult]:
+        started_at = time.perf_counter()
+        futures = []
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for request in requests_to_replay:
+                # A speed of 0 sends the requests as fast as the workers take them
+                scheduled_at = request.offset / self.speed if self.speed else 0.0
+                delay = scheduled_at - (time.perf_counter() - started_at)
+
+                if delay > 0:
+                    time.sleep(delay)
+
+                futures.append(executor.submit(self._send, request, scheduled_at, started_at))
+
+        return [future.result() for future in futures]
+
+
+def compare_latencies(results: list[ReplayResult]) -> dict[str, dict[str, float | None]]:
+    by_pattern: defaultdict[str, list[ReplayResult]] = defaultdict(list)
+
+    for result in results:
+        by_pattern[result.pattern].append(result)
+
+    comparison: dict[str, dict[str, float | None]] = {}
+
+    for pattern, pattern_results in sorted(by_pattern.items(), key=lambda item: -len(item[1])):
+        recorded = sorted(result.recorded_ms for result in pattern_results)
+        replayed = sorted(result.replayed_ms for result in pattern_results)
+        row: dict[str, float | None] = {"requests": len(pattern_results)}
+
+        for percent in (50, 95, 99):
+            row[f"recorded_p{percent}_ms"] = round(get_percentile(recorded, percent), 2)
+            row[f"replayed_p{percent}_ms"] = round(get_percentile(replayed, percent), 2)
+
+        recorded_p95 = get_percentile(recorded, 95)
+        row["p95_change"] = round(get_percentile(replayed, 95) / recorded_p95 - 1, 3) if recorded_p95 else None
+        # A different status means the local data or setup answered another question than production did
+        row["status_mismatches"] = sum(
+            1 for result in pattern_results if result.recorded_status and result.status != result.recorded_status
+        )
+        row["max_lag_ms"] = round(max(result.lag_ms for result in pattern_results), 2)
+
+        comparison[pattern] = row
+
+    return comparison
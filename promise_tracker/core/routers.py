@@ -0,0 +1,52 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import Model
+
+REPLICA_DB_ALIAS = "replica"
+
+_replica_reads_allowed: ContextVar[bool] = ContextVar("replica_reads_allowed", default=False)
+
+
+@contextmanager
+def replica_reads() -> Iterator[None]:
+    token = _replica_reads_allowed.set(True)
+
+    try:
+        yield
+    finally:
+        _replica_reads_allowed.reset(token)
+
+
+# Sends the reads of the selectors in the routed apps to the replica. Reads run on the primary outside of
+# replica_reads(), which is only entered for safe requests of clients that have not written recently, and
+# inside transactions, which have to see their own writes.
+class ReplicaRouter:
+    route_app_labels = {"classifiers", "promises"}
+
+    def db_for_read(self, model: type[Model], **hints) -> str | None:
+        instance = hints.get("instance")
+
+        # Related objects are loaded from the same database as the object they are accessed through
+        if instance is not None and instance._state.db:
+            return instance._state.db
+
+        if (
+            model._meta.app_label in self.route_app_labels
+            and _replica_reads_allowed.get()
+            and not transaction.get_connection(DEFAULT_DB_ALIAS).in_atomic_block
+        ):
+            return REPLICA_DB_ALIAS
+
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model: type[Model], **hints) -> str:
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Model, obj2: Model, **hints) -> bool:
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, model_name: str | None = None, **hints) -> bool:
+        return db == DEFAULT_DB_ALIAS
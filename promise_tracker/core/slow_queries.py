@@ -0,0 +1,122 @@
+import hashlib
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import FrameType
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from loguru import logger
+
+EXPLAIN_PREFIXES = {
+    "sqlite": "EXPLAIN QUERY PLAN ",
+    "postgresql": "EXPLAIN ",
+}
+
+# Callers in these modules are named in the log, they are the ones a slow query can be traced back to
+CALLER_MODULE_SUFFIXES = (".selectors", ".services", ".filters", ".views", ".tasks")
+
+_explain_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-explain")
+_pending_explains = threading.BoundedSemaphore(10)
+
+
+def get_params_shape(params) -> list[str] | dict[str, str] | None:
+    # Only the types are logged, the values may hold personal data
+    if params is None:
+        return None
+
+    if isinstance(params, dict):
+        return {name: type(value).__name__ for name, value in params.items()}
+
+    return [type(value).__name__ for value in params]
+
+
+def get_caller() -> str | None:
+    frame: FrameType | None = sys._getframe(1)
+    fallback = None
+
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+
+        if module.startswith("promise_tracker.") and module != __name__:
+            caller = f"{module}.{frame.f_code.co_qualname}"
+
+            if module.endswith(CALLER_MODULE_SUFFIXES):
+                return caller
+
+            fallback = fallback or caller
+
+        frame = frame.f_back
+
+    return fallback
+
+
+def capture_query_plan(alias: str, sql: str, params) -> str:
+    connection = connections[alias]
+
+    with connection.cursor() as cursor:
+        cursor.execute(EXPLAIN_PREFIXES[connection.vendor] + sql, params)
+        # The plan text is the last column in both backends, SQLite puts node ids before it
+        return "\n".join(str(row[-1]) for row in cursor.fetchall())
+
+
+def _log_query_plan(alias: str, sql: str, params, query_hash: str) -> None:
+    try:
+        plan = capture_query_plan(alias, sql, params)
+        logger.warning("slow query plan", query_hash=query_hash, plan=plan)
+    except Exception as exc:
+        logger.warning(f"Could not explain slow query {query_hash}: {exc}")
+    finally:
+        # The explain thread is long-lived, it should not keep a connection open between rare slow queries
+        connections[alias].close()
+        _pending_explains.release()
+
+
+def _schedule_explain(alias: str, vendor: str, sql: str, params, many: bool, query_hash: str) -> None:
+    if many or vendor not in EXPLAIN_PREFIXES or not sql.lstrip().upper().startswith("SELECT"):
+        return
+
+    if random.random() >= settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE:
+        return
+
+    # Plans are captured on a separate connection off the request thread, and skipped while the backlog is full
+    if not _pending_explains.acquire(blocking=False):
+        return
+
+    _explain_executor.submit(_log_query_plan, alias, sql, params, query_hash)
+
+
+def log_slow_query(execute, sql, params, many, context):
+    started_at = time.perf_counter()
+
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration_ms = (time.perf_counter() - started_at) * 1000
+
+        if duration_ms >= settings.SLOW_QUERY_THRESHOLD_MS and not sql.startswith(tuple(EXPLAIN_PREFIXES.values())):
+            connection = context["connection"]
+            query_hash = hashlib.sha1(sql.encode()).hexdigest()[:12]
+
+            logger.warning(
+                "slow query",
+                query_hash=query_hash,
+                duration_ms=round(duration_ms, 2),
+                alias=connection.alias,
+                sql=sql,
+                params_shape=get_params_shape(params),
+                many=many,
+                caller=get_caller(),
+            )
+
+            _schedule_explain(connection.alias, connection.vendor, sql, params, many, query_hash)
+
+
+def install_slow_query_log(sender, connection: BaseDatabaseWrapper, **kwargs) -> None:
+    # Runs on every new connection of the wrapper, which keeps its execute wrappers between reconnects. Inserted
+    # first, because execute_wrapper() blocks that may already be open remove their wrapper by popping the last one.
+    if settings.SLOW_QUERY_LOG_ENABLED and log_slow_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, log_slow_query)
@@ -0,0 +1,118 @@
+import time
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import connections
+from django.template.backends.django import DjangoTemplates, Template, reraise
+from django.template.exceptions import TemplateDoesNotExist
+from django.utils.module_loading import import_string
+
+
+@dataclass
+class RequestMetrics:
+    db_queries: int = 0
+    db_seconds: float = 0.0
+    render_seconds: float = 0.0
+    render_depth: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+
+_current_metrics: ContextVar[RequestMetrics | None] = ContextVar("current_metrics", default=None)
+
+
+def get_current_metrics() -> RequestMetrics | None:
+    return _current_metrics.get()
+
+
+def _record_query(metrics: RequestMetrics):
+    def wrapper(execute, sql, params, many, context):
+        started_at = time.perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            metrics.db_queries += 1
+            metrics.db_seconds += time.perf_counter() - started_at
+
+    return wrapper
+
+
+@contextmanager
+def collect_request_metrics() -> Iterator[RequestMetrics]:
+    metrics = RequestMetrics()
+    token = _current_metrics.set(metrics)
+
+    try:
+        with ExitStack() as stack:
+            # Wrapping a connection does not open it, so aliases the request never touches cost nothing
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(_record_query(metrics)))
+
+            yield metrics
+    finally:
+        _current_metrics.reset(token)
+
+
+_MISSING = object()
+
+
+def _count_cache_lookups(get):
+    def wrapper(self, key, default=None, version=None):
+        value = get(self, key, _MISSING, version)
+        metrics = _current_metrics.get()
+
+        if metrics is not None:
+            if value is _MISSING:
+                metrics.cache_misses += 1
+            else:
+                metrics.cache_hits += 1
+
+        return default if value is _MISSING else value
+
+    wrapper.counts_cache_lookups = True
+
+    return wrapper
+
+
+def instrument_cache_backends() -> None:
+    # Django has no cache signals, so the lookups of the configured backends are counted by wrapping their get
+    for config in settings.CACHES.values():
+        backend = import_string(config["BACKEND"])
+
+        if not getattr(backend.get, "counts_cache_lookups", False):
+            backend.get = _count_cache_lookups(backend.get)
+
+
+class TimedTemplate(Template):
+    def render(self, context=None, request=None):
+        metrics = _current_metrics.get()
+
+        # Templates rendered from inside another template are already part of the outer render time
+        if metrics is None or metrics.render_depth:
+            return super().render(context, request)
+
+        started_at = time.perf_counter()
+        db_seconds_before = metrics.db_seconds
+        metrics.render_depth += 1
+
+        try:
+            return super().render(context, request)
+        finally:
+            metrics.render_depth -= 1
+            # Lazy querysets are evaluated while rendering, their time is already counted as database time
+            metrics.render_seconds += time.perf_counter() - started_at - (metrics.db_seconds - db_seconds_before)
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    def from_string(self, template_code):
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        try:
+            return TimedTemplate(self.engine.get_template(template_name), self)
+        except TemplateDoesNotExist as exc:
+            reraise(exc, self)
@@ -1,4 +1,5 @@
 from django import template
+from django.urls import translate_url
 
 register = template.Library()
 
@@ -6,3 +7,9 @@ register = template.Library()
 @register.filter
 def to_decimal(value: float) -> str:
     return f"{value:.2f}"
+
+
+@register.simple_tag(takes_context=True)
+def translated_path(context: template.Context, language_code: str) -> str:
+    # The language prefix of the URL selects the language, so switching is a plain link
+    return translate_url(context["request"].get_full_path(), language_code)
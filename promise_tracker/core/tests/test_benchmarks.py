@@ -0,0 +1,59 @@
+from django.test import TestCase
+
+from promise_tracker.core.benchmarks import compare_reports, get_scenarios, measure
+from promise_tracker.core.datasets import DatasetSpec, build_dataset
+from promise_tracker.promises.models import Promise
+
+SPEC = DatasetSpec.for_rows(400, seed=1)
+
+
+class BenchmarkTests(TestCase):
+    def test_measures_every_scenario(self):
+        build_dataset(SPEC)
+
+        for scenario in get_scenarios():
+            with self.subTest(scenario=scenario.name):
+                measurement = measure(scenario, iterations=2, warmup=1)
+
+                self.assertGreater(measurement["queries"], 0)
+                self.assertGreater(measurement["peak_allocated_bytes"], 0)
+                self.assertLessEqual(measurement["p50_ms"], measurement["p99_ms"])
+
+                if scenario.rollback:
+                    self.assertIsNone(measurement["response_bytes"])
+                else:
+                    self.assertGreater(measurement["response_bytes"], 0)
+
+        # The writes were rolled back, the next run sees the same dataset
+        self.assertEqual(Promise.objects.count(), SPEC.promises)
+        self.assertFalse(Promise.objects.filter(name="Benchmark promise").exists())
+
+    def test_names_the_row_that_the_dataset_lacks(self):
+        build_dataset(SPEC)
+        Promise.objects.filter(review_status=Promise.ReviewStatus.PENDING).delete()
+
+        with self.assertRaisesMessage(RuntimeError, "The benchmark database has no pending promise"):
+            get_scenarios()
+
+    def test_compare_reports_ignores_noise(self):
+        measurement = {
+            "p50_ms": 10.0,
+            "p95_ms": 20.0,
+            "p99_ms": 30.0,
+            "peak_allocated_bytes": 1000,
+            "queries": 5,
+            "response_bytes": 100,
+        }
+        baseline = {"scenarios": {"list": measurement, "detail": measurement}}
+        current = {
+            "scenarios": {
+                "list": {**measurement, "p50_ms": 10.5, "queries": 6},
+                "detail": {**measurement, "p95_ms": 40.0},
+                "analytics": measurement,
+            }
+        }
+
+        self.assertListEqual(
+            compare_reports(baseline, current),
+            ["list: queries 5 -> 6", "detail: p95_ms 20.0 -> 40.0 (+100%)", "analytics: new"],
+        )
@@ -0,0 +1,108 @@
+import tempfile
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+from django.db import connection, transaction
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from promise_tracker.classifiers.models import PoliticalParty
+from promise_tracker.classifiers.services.political_party_services import PoliticalPartyService
+from promise_tracker.core.database import write_lock, write_transaction
+from promise_tracker.users.tests.factories import AdminUserFactory
+
+
+class SqlitePragmasIntegrationTests(TestCase):
+    def setUp(self) -> None:
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+
+        self.database_path = str(Path(temp_dir.name) / "db.sqlite3")
+
+    def _get_wrapper(self) -> DatabaseWrapper:
+        wrapper = DatabaseWrapper({**connection.settings_dict, "NAME": self.database_path}, alias="sqlite_tuning")
+        self.addCleanup(wrapper.close)
+
+        return wrapper
+
+    def _read_pragmas(self) -> dict[str, object]:
+        with self._get_wrapper().cursor() as cursor:
+            return {
+                name: cursor.execute(f"PRAGMA {name};").fetchone()[0]
+                for name in ("journal_mode", "synchronous", "busy_timeout", "cache_size", "temp_store")
+            }
+
+    @override_settings(SQLITE_TUNING_ENABLED=True, SQLITE_BUSY_TIMEOUT_MS=1234, SQLITE_CACHE_SIZE=-2000)
+    def test_pragmas_are_applied_when_tuning_is_enabled(self):
+        pragmas = self._read_pragmas()
+
+        self.assertEqual(pragmas["journal_mode"], "wal")
+        self.assertEqual(pragmas["synchronous"], 1)  # NORMAL
+        self.assertEqual(pragmas["busy_timeout"], 1234)
+        self.assertEqual(pragmas["cache_size"], -2000)
+        self.assertEqual(pragmas["temp_store"], 2)  # MEMORY
+
+    @override_settings(SQLITE_TUNING_ENABLED=False)
+    def test_pragmas_are_not_applied_when_tuning_is_disabled(self):
+        pragmas = self._read_pragmas()
+
+        self.assertEqual(pragmas["journal_mode"], "delete")
+        self.assertNotEqual(pragmas["temp_store"], 2)
+
+    @override_settings(SQLITE_TUNING_ENABLED=True, SQLITE_TRANSACTION_MODE="immediate")
+    def test_transaction_mode_is_applied_when_configured(self):
+        wrapper = self._get_wrapper()
+        wrapper.ensure_connection()
+
+        self.assertEqual(wrapper.transaction_mode, "IMMEDIATE")
+
+    @override_settings(SQLITE_TUNING_ENABLED=True, SQLITE_TRANSACTION_MODE="deferred")
+    def test_transaction_mode_option_takes_precedence(self):
+        wrapper = DatabaseWrapper(
+            {**connection.settings_dict, "NAME": self.database_path, "OPTIONS": {"transaction_mode": "IMMEDIATE"}},
+            alias="sqlite_tuning",
+        )
+        self.addCleanup(wrapper.close)
+        wrapper.ensure_connection()
+
+        self.assertEqual(wrapper.transaction_mode, "IMMEDIATE")
+
+
+class WriteTransactionIntegrationTests(TransactionTestCase):
+    @override_settings(SQLITE_WRITE_SERIALIZATION_ENABLED=True)
+    def test_outermost_write_takes_the_write_lock(self):
+        with write_transaction():
+            self.assertTrue(write_lock.locked())
+            self.assertTrue(connection.in_atomic_block)
+
+        self.assertFalse(write_lock.locked())
+
+    @override_settings(SQLITE_WRITE_SERIALIZATION_ENABLED=True)
+    def test_nested_write_does_not_take_the_write_lock(self):
+        with transaction.atomic(), write_transaction():
+            self.assertFalse(write_lock.locked())
+
+    @override_settings(SQLITE_WRITE_SERIALIZATION_ENABLED=False)
+    def test_write_lock_is_not_taken_when_serialization_is_disabled(self):
+        with write_transaction():
+            self.assertFalse(write_lock.locked())
+            self.assertTrue(connection.in_atomic_block)
+
+    @override_settings(SQLITE_WRITE_SERIALIZATION_ENABLED=True)
+    def test_service_write_takes_the_write_lock(self):
+        admin = AdminUserFactory.create()
+        lock_states = []
+        original_save = PoliticalParty.save
+
+        def save(instance, *args, **kwargs):
+            lock_states.append(write_lock.locked())
+            return original_save(instance, *args, **kwargs)
+
+        with mock.patch.object(PoliticalParty, "save", save):
+            PoliticalPartyService(performed_by=admin).create_political_party(
+                name="Party", established_date=date(2000, 1, 1)
+            )
+
+        self.assertListEqual(lock_states, [True])
+        self.assertFalse(write_lock.locked())
@@ -0,0 +1,100 @@
+from io import StringIO
+from unittest import skipUnless
+from unittest.mock import patch
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.db.models import F, Max
+from django.test import TestCase
+
+from promise_tracker.classifiers.models import Convocation, PoliticalParty
+from promise_tracker.core.datasets import DatasetSpec, build_dataset
+from promise_tracker.promises.models import Promise, PromiseResult
+from promise_tracker.users.models import BaseUser
+
+SPEC = DatasetSpec.for_rows(400, seed=1)
+
+
+def _get_rows() -> list[tuple]:
+    return list(
+        PromiseResult.objects.order_by("promise__name", "name").values_list(
+            "promise__name", "promise__review_status", "name", "date", "is_final", "status", "review_status"
+        )
+    )
+
+
+def _delete_dataset() -> None:
+    PromiseResult.objects.all().delete()
+    Promise.objects.all().delete()
+    Convocation.objects.all().delete()
+    PoliticalParty.objects.all().delete()
+    BaseUser.all_with_deleted.all().delete()
+
+
+class DatasetTests(TestCase):
+    def test_builds_consistent_dataset(self):
+        build_dataset(SPEC, batch_size=30)
+
+        self.assertEqual(Promise.objects.count(), SPEC.promises)
+        self.assertTrue(BaseUser.objects.filter(is_admin=True).exists())
+
+        # Promises are dated within their convocation and made by a party elected in it
+        self.assertFalse(Promise.objects.filter(date__lt=F("convocation__start_date")).exists())
+        self.assertFalse(Promise.objects.filter(date__gt=F("convocation__end_date")).exists())
+        self.assertFalse(Promise.objects.exclude(party__convocations=F("convocation")).exists())
+
+        # Results follow their promise, promises that were not approved have no reviewed results
+        self.assertFalse(PromiseResult.objects.filter(date__lt=F("promise__date")).exists())
+        self.assertFalse(
+            PromiseResult.objects.exclude(promise__review_status=Promise.ReviewStatus.APPROVED)
+            .exclude(review_status=PromiseResult.ReviewStatus.PENDING)
+            .exists()
+        )
+
+        # A promise has at most one final result, and no result is dated after it
+        finals = PromiseResult.objects.filter(is_final=True)
+
+        self.assertEqual(finals.values("promise").distinct().count(), finals.count())
+
+        for final in finals.annotate(latest_date=Max("promise__results__date")):
+            self.assertEqual(final.date, final.latest_date)
+
+    @patch("promise_tracker.core.datasets.BLOCK_SIZE", 10)
+    def test_seed_builds_the_same_rows_in_any_batch_size(self):
+        build_dataset(SPEC, batch_size=10)
+        first_rows = _get_rows()
+
+        _delete_dataset()
+        build_dataset(SPEC, batch_size=30)
+
+        self.assertListEqual(_get_rows(), first_rows)
+
+
+class SeedDatabaseBulkTests(TestCase):
+    def test_seeds_in_bulk(self):
+        call_command(
+            "seed_database",
+            "--bulk",
+            "--promises",
+            "40",
+            "--users",
+            "5",
+            "--results",
+            "2",
+            "--seed",
+            "2",
+            "--ensure-final",
+            stdout=StringIO(),
+        )
+
+        self.assertEqual(Promise.objects.count(), 40)
+        self.assertEqual(BaseUser.objects.filter(is_admin=False).count(), 5)
+
+        # The flags mean what they mean outside bulk mode: N results per promise, every promise ends with a final one
+        self.assertEqual(PromiseResult.objects.count(), 80)
+        self.assertEqual(PromiseResult.objects.filter(is_final=True).count(), 40)
+
+    @skipUnless(connection.vendor == "sqlite", "SQLite only")
+    def test_rejects_parallel_workers_on_sqlite(self):
+        with self.assertRaises(CommandError):
+            call_command("seed_database", "--bulk", "--workers", "2")
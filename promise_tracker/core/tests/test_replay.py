@@ -0,0 +1,129 @@
+import json
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from django.test import LiveServerTestCase, TestCase
+from django.urls import reverse
+
+from promise_tracker.core.access_logs import read_requests
+from promise_tracker.core.datasets import DatasetSpec, build_dataset
+from promise_tracker.core.replay import IdMapper, Replayer, compare_latencies, create_sessions, prepare_requests
+from promise_tracker.promises.models import Promise, PromiseResult
+
+SPEC = DatasetSpec.for_rows(400, seed=1)
+
+
+def _entry(
+    timestamp: float, path: str, view: str, method: str = "GET", role: str = "guest", htmx: bool = False
+) -> dict:
+    return {
+        "timestamp": timestamp,
+        "method": method,
+        "path": path,
+        "query": "",
+        "htmx": htmx,
+        "view": view,
+        "status": 200,
+        "duration_ms": 10.0,
+        "role": role,
+        "user": "anonymous" if role == "guest" else str(uuid.uuid4()),
+    }
+
+
+class ReplayTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        build_dataset(SPEC)
+
+    def test_reads_request_lines_of_loguru_logs(self):
+        lines = [
+            {"text": "", "record": {"message": "request", "time": {"timestamp": 1.5}, "extra": {"method": "GET"}}},
+            {"text": "", "record": {"message": "slow query", "time": {"timestamp": 2.0}, "extra": {}}},
+            {"method": "GET", "path": "/lv/", "timestamp": 3.0},
+        ]
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "app.log"
+            path.write_text("\n".join(json.dumps(line) for line in lines) + "\nnot json\n")
+
+            self.assertListEqual(
+                list(read_requests([str(path)])),
+                [{"method": "GET", "timestamp": 1.5}, {"method": "GET", "path": "/lv/", "timestamp": 3.0}],
+            )
+
+    def test_maps_recorded_ids_to_local_rows(self):
+        recorded_id = uuid.uuid4()
+        detail_path = f"/lv/promises/promises/{recorded_id}/"
+        entries = [
+            _entry(2.0, detail_path, "promises:promises:details"),
+            _entry(1.0, "/lv/promises/promises/create/", "promises:promises:create", method="POST"),
+            _entry(3.0, detail_path, "promises:promises:details"),
+            _entry(4.0, "/", "unresolved"),
+        ]
+
+        requests_to_replay, skipped = prepare_requests(entries, IdMapper(seed=1))
+
+        self.assertEqual(skipped["write"], 1)
+        self.assertListEqual([request.offset for request in requests_to_replay], [1.0, 2.0, 3.0])
+
+        # Both visits of the recorded promise open the same approved local one
+        first, second, unresolved = requests_to_replay
+        self.assertEqual(first.path, second.path)
+        self.assertNotEqual(first.path, detail_path)
+        promise = Promise.objects.get(id=first.path.split("/")[-2])
+        self.assertEqual(promise.review_status, Promise.ReviewStatus.APPROVED)
+
+        self.assertEqual((unresolved.path, unresolved.pattern), ("/", "unresolved"))
+
+    def test_maps_result_urls_to_a_result_of_the_mapped_promise(self):
+        path = f"/lv/promises/promises/{uuid.uuid4()}/{uuid.uuid4()}/edit/"
+
+        mapped_path, _ = IdMapper(seed=1).map_path(path)
+
+        promise_id, result_id = mapped_path.split("/")[-4:-2]
+        self.assertTrue(PromiseResult.objects.filter(id=result_id, promise_id=promise_id).exists())
+
+    def test_replays_htmx_requests_with_their_header(self):
+        entries = [_entry(1.0, reverse("promises:promises:list"), "promises:promises:list", htmx=True)]
+        requests_to_replay, _ = prepare_requests(entries, IdMapper())
+        replayer = Replayer("http://localhost:8000", {}, speed=0, concurrency=1)
+        replayer.local.session = MagicMock()
+        replayer.local.session.request.return_value.status_code = 200
+
+        result = replayer._send(requests_to_replay[0], 0.0, time.perf_counter())
+
+        # The fragments are compared apart from the full pages of the same URL name
+        self.assertEqual(result.pattern, "promises:promises:list [htmx]")
+        self.assertDictEqual(replayer.local.session.request.call_args.kwargs["headers"], {"HX-Request": "true"})
+
+
+class ReplayLiveServerTests(LiveServerTestCase):
+    def test_replays_requests_of_each_role(self):
+        build_dataset(SPEC)
+
+        entries = [
+            _entry(0.0, reverse("promises:promises:list"), "promises:promises:list"),
+            _entry(0.1, reverse("promises:promise_results:mine"), "promises:promise_results:mine", role="registered"),
+            _entry(0.2, reverse("promises:review_queue:queue"), "promises:review_queue:queue", role="admin"),
+            _entry(0.3, reverse("promises:promises:list"), "promises:promises:list"),
+        ]
+        requests_to_replay, _ = prepare_requests(entries, IdMapper())
+        sessions = {role: create_sessions(role, 2) for role in ("registered", "admin")}
+
+        results = Replayer(self.live_server_url, sessions, speed=0, concurrency=2).replay(requests_to_replay)
+
+        # The pages that need a login would redirect guests, so equal statuses mean the sessions were used
+        self.assertListEqual([result.status for result in results], [200, 200, 200, 200])
+
+        comparison = compare_latencies(results)
+
+        self.assertListEqual(
+            list(comparison),
+            ["promises:promises:list", "promises:promise_results:mine", "promises:review_queue:queue"],
+        )
+        self.assertEqual(comparison["promises:promises:list"]["requests"], 2)
+        self.assertEqual(comparison["promises:promises:list"]["recorded_p95_ms"], 10.0)
+        self.assertEqual(comparison["promises:promises:list"]["status_mismatches"], 0)
@@ -0,0 +1,45 @@
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.test import TestCase, TransactionTestCase
+
+from promise_tracker.core.routers import REPLICA_DB_ALIAS, ReplicaRouter, replica_reads
+from promise_tracker.promises.models import Promise
+from promise_tracker.promises.tests.factories import ValidPromiseFactory
+from promise_tracker.users.models import BaseUser
+
+
+class ReplicaRouterUnitTests(TestCase):
+    def setUp(self) -> None:
+        self.router = ReplicaRouter()
+
+    def test_reads_go_to_primary_outside_replica_reads(self):
+        self.assertEqual(self.router.db_for_read(Promise), DEFAULT_DB_ALIAS)
+
+    def test_reads_of_not_routed_apps_go_to_primary(self):
+        with replica_reads():
+            self.assertEqual(self.router.db_for_read(BaseUser), DEFAULT_DB_ALIAS)
+
+    def test_related_reads_follow_the_instance_database(self):
+        promise = ValidPromiseFactory.create(results=[])
+        promise._state.db = REPLICA_DB_ALIAS
+
+        self.assertEqual(self.router.db_for_read(BaseUser, instance=promise), REPLICA_DB_ALIAS)
+
+    def test_writes_and_migrations_go_to_primary(self):
+        with replica_reads():
+            self.assertEqual(self.router.db_for_write(Promise), DEFAULT_DB_ALIAS)
+
+        self.assertTrue(self.router.allow_migrate(DEFAULT_DB_ALIAS, "promises"))
+        self.assertFalse(self.router.allow_migrate(REPLICA_DB_ALIAS, "promises"))
+
+
+class ReplicaRouterTransactionUnitTests(TransactionTestCase):
+    def setUp(self) -> None:
+        self.router = ReplicaRouter()
+
+    def test_reads_go_to_replica_inside_replica_reads(self):
+        with replica_reads():
+            self.assertEqual(self.router.db_for_read(Promise), REPLICA_DB_ALIAS)
+
+    def test_reads_inside_transaction_go_to_primary(self):
+        with replica_reads(), transaction.atomic():
+            self.assertEqual(self.router.db_for_read(Promise), DEFAULT_DB_ALIAS)
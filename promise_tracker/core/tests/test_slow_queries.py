@@ -0,0 +1,61 @@
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from promise_tracker.core.slow_queries import (
+    capture_query_plan,
+    get_params_shape,
+    install_slow_query_log,
+    log_slow_query,
+)
+from promise_tracker.users.selectors import UserSelectors
+from promise_tracker.users.tests.factories import AdminUserFactory
+
+
+@override_settings(SLOW_QUERY_THRESHOLD_MS=0, SLOW_QUERY_EXPLAIN_SAMPLE_RATE=0)
+class SlowQueryLogIntegrationTests(TestCase):
+    def setUp(self):
+        self.admin = AdminUserFactory.create()
+
+    @patch("promise_tracker.core.slow_queries.logger")
+    def test_logs_calling_selector(self, mock_logger):
+        UserSelectors(performed_by=self.admin).get_user_by_id(self.admin.id)
+
+        callers = [call.kwargs["caller"] for call in mock_logger.warning.call_args_list]
+        self.assertIn("promise_tracker.users.selectors.UserSelectors.get_user_by_id", callers)
+
+    @patch("promise_tracker.core.slow_queries.logger")
+    def test_logs_parameter_types_instead_of_values(self, mock_logger):
+        UserSelectors(performed_by=self.admin).get_user_by_id(self.admin.id)
+
+        logged = str(mock_logger.warning.call_args_list)
+        self.assertNotIn(self.admin.id.hex, logged)
+        self.assertListEqual(get_params_shape((self.admin.id.hex, 1)), ["str", "int"])
+
+    @override_settings(SLOW_QUERY_THRESHOLD_MS=10_000)
+    @patch("promise_tracker.core.slow_queries.logger")
+    def test_fast_queries_are_not_logged(self, mock_logger):
+        UserSelectors(performed_by=self.admin).get_user_by_id(self.admin.id)
+
+        mock_logger.warning.assert_not_called()
+
+    @override_settings(SLOW_QUERY_EXPLAIN_SAMPLE_RATE=1)
+    @patch("promise_tracker.core.slow_queries._explain_executor")
+    def test_sampled_select_queries_are_explained_off_thread(self, mock_executor):
+        UserSelectors(performed_by=self.admin).get_user_by_id(self.admin.id)
+
+        self.assertTrue(mock_executor.submit.called)
+        self.assertTrue(all("SELECT" in call.args[2] for call in mock_executor.submit.call_args_list))
+
+    def test_captures_sqlite_query_plan(self):
+        plan = capture_query_plan("default", 'SELECT * FROM "users_baseuser" WHERE "email" = %s', ["a@example.com"])
+
+        self.assertIn("users_baseuser", plan)
+
+    def test_wrapper_is_installed_once_and_outermost(self):
+        install_slow_query_log(sender=None, connection=connection)
+        install_slow_query_log(sender=None, connection=connection)
+
+        self.assertEqual(connection.execute_wrappers.count(log_slow_query), 1)
+        self.assertIs(connection.execute_wrappers[0], log_slow_query)
@@ -0,0 +1,68 @@
+import json
+import tempfile
+
+from django.core.cache import cache
+from django.template import engines
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from promise_tracker.core.metrics import MetricsRegistry, flush_metrics, registry, render_metrics
+from promise_tracker.core.telemetry import collect_request_metrics
+from promise_tracker.users.models import BaseUser
+
+
+class RequestMetricsIntegrationTests(TestCase):
+    def test_counts_queries(self):
+        with collect_request_metrics() as metrics:
+            list(BaseUser.objects.all())
+            BaseUser.objects.count()
+
+        self.assertEqual(metrics.db_queries, 2)
+        self.assertGreater(metrics.db_seconds, 0)
+
+    def test_counts_cache_hits_and_misses(self):
+        cache.set("telemetry-test", "value")
+
+        with collect_request_metrics() as metrics:
+            self.assertEqual(cache.get("telemetry-test"), "value")
+            self.assertEqual(cache.get("telemetry-missing", "default"), "default")
+
+        self.assertEqual(metrics.cache_hits, 1)
+        self.assertEqual(metrics.cache_misses, 1)
+
+    def test_measures_template_rendering(self):
+        template = engines["django"].from_string("{% for i in items %}{{ i }}{% endfor %}")
+
+        with collect_request_metrics() as metrics:
+            template.render({"items": range(1000)})
+
+        self.assertGreater(metrics.render_seconds, 0)
+        self.assertEqual(metrics.render_depth, 0)
+
+
+class MetricsRegistryUnitTests(SimpleTestCase):
+    def setUp(self):
+        self.addCleanup(registry.reset)
+
+    def test_renders_cumulative_histogram_buckets(self):
+        labels = {"view": "home:index", "method": "GET"}
+        registry.observe("http_request_db_queries", labels, 1)
+        registry.observe("http_request_db_queries", labels, 7)
+
+        output = render_metrics()
+
+        self.assertIn('http_request_db_queries_bucket{method="GET",view="home:index",le="1"} 1', output)
+        self.assertIn('http_request_db_queries_bucket{method="GET",view="home:index",le="10"} 2', output)
+        self.assertIn('http_request_db_queries_bucket{method="GET",view="home:index",le="+Inf"} 2', output)
+        self.assertIn('http_request_db_queries_sum{method="GET",view="home:index"} 8.0', output)
+
+    def test_merges_snapshots_of_all_workers(self):
+        with tempfile.TemporaryDirectory() as metrics_dir, override_settings(REQUEST_METRICS_DIR=metrics_dir):
+            other_worker = MetricsRegistry()
+            other_worker.inc("http_requests_total", {"view": "home:index"}, 2)
+            with open(f"{metrics_dir}/1.json", "w") as snapshot_file:
+                json.dump(other_worker.snapshot(), snapshot_file)
+
+            registry.inc("http_requests_total", {"view": "home:index"})
+            flush_metrics(force=True)
+
+            self.assertIn('http_requests_total{view="home:index"} 3', render_metrics())
@@ -0,0 +1,186 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from promise_tracker.core.tracing import (
+    SPAN_KIND_CONSUMER,
+    SPAN_KIND_SERVER,
+    install_query_tracing,
+    parse_traceparent,
+    start_span,
+    start_trace,
+    trace_query,
+)
+from promise_tracker.emails.tasks import email_send_batch_task
+from promise_tracker.tasks.models import OutboxMessage
+from promise_tracker.tasks.services import OutboxRelayService, OutboxService
+from promise_tracker.users.selectors import UserSelectors
+from promise_tracker.users.tests.factories import AdminUserFactory
+
+REMOTE_TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+REMOTE_SPAN_ID = "00f067aa0ba902b7"
+
+
+class TraceparentTests(TestCase):
+    def test_parses_valid_header(self):
+        self.assertEqual(
+            parse_traceparent(f"00-{REMOTE_TRACE_ID}-{REMOTE_SPAN_ID}-01"), (REMOTE_TRACE_ID, REMOTE_SPAN_ID, True)
+        )
+        self.assertEqual(
+            parse_traceparent(f"00-{REMOTE_TRACE_ID}-{REMOTE_SPAN_ID}-00"), (REMOTE_TRACE_ID, REMOTE_SPAN_ID, False)
+        )
+
+    def test_rejects_invalid_headers(self):
+        for value in (None, "", "garbage", f"00-{'0' * 32}-{REMOTE_SPAN_ID}-01", f"00-{REMOTE_TRACE_ID}-{'0' * 16}-01"):
+            with self.subTest(value=value):
+                self.assertIsNone(parse_traceparent(value))
+
+
+@override_settings(TRACING_ENABLED=True, TRACING_SAMPLE_RATE=1.0)
+@patch("promise_tracker.core.tracing.export_spans")
+class TracingIntegrationTests(TestCase):
+    def setUp(self):
+        self.admin = AdminUserFactory.create()
+
+        # The wrapper is installed when a connection is opened, the test connection was opened with tracing disabled
+        install_query_tracing(sender=None, connection=connection)
+        self.addCleanup(connection.execute_wrappers.remove, trace_query)
+
+    def _get_spans(self, mock_export) -> list[dict]:
+        return [span.to_dict() for call in mock_export.call_args_list for span in call.args[0]]
+
+    def test_nothing_is_recorded_outside_of_a_trace(self, mock_export):
+        UserSelectors(performed_by=self.admin).get_user_by_id(self.admin.id)
+
+        with start_span("orphan") as span:
+            self.assertIsNone(span)
+
+        mock_export.assert_not_called()
+
+    def test_selector_and_query_spans_nest_under_the_trace(self, mock_export):
+        with start_trace("test", SPAN_KIND_SERVER) as root:
+            UserSelectors(performed_by=self.admin).get_user_by_id(self.admin.id)
+
+        spans = {span["name"]: span for span in self._get_spans(mock_export)}
+        selector_span = spans["UserSelectors.get_user_by_id"]
+
+        self.assertIsNone(spans["test"]["parent_span_id"])
+        self.assertEqual(selector_span["parent_span_id"], root.span_id)
+        self.assertEqual(spans["db SELECT"]["parent_span_id"], selector_span["span_id"])
+        self.assertEqual(spans["db SELECT"]["attributes"]["db.operation"], "SELECT")
+        self.assertEqual({span["trace_id"] for span in spans.values()}, {root.trace.trace_id})
+        self.assertNotIn(self.admin.id.hex, str(spans["db SELECT"]))
+
+    def test_exception_is_recorded_on_the_span(self, mock_export):
+        with self.assertRaises(ValueError), start_trace("test", SPAN_KIND_SERVER):
+            with start_span("failing"):
+                raise ValueError("boom")
+
+        spans = {span["name"]: span for span in self._get_spans(mock_export)}
+
+        self.assertEqual(spans["failing"]["status"], "error")
+        self.assertEqual(spans["failing"]["attributes"]["exception.type"], "ValueError")
+
+    @override_settings(TRACING_SAMPLE_RATE=0.0)
+    def test_unsampled_traces_are_not_recorded(self, mock_export):
+        with start_trace("test", SPAN_KIND_SERVER) as root:
+            UserSelectors(performed_by=self.admin).get_user_by_id(self.admin.id)
+
+        self.assertIsNone(root)
+        mock_export.assert_not_called()
+
+    @override_settings(TRACING_MAX_SPANS_PER_TRACE=2)
+    def test_spans_over_the_limit_are_dropped(self, mock_export):
+        with start_trace("test", SPAN_KIND_SERVER):
+            for _ in range(4):
+                with start_span("child"):
+                    pass
+
+        spans = self._get_spans(mock_export)
+
+        self.assertEqual(len(spans), 3)
+        self.assertEqual(spans[-1]["attributes"]["tracing.dropped_spans"], 2)
+
+    def test_request_span_is_named_after_the_view(self, mock_export):
+        self.client.force_login(self.admin)
+
+        response = self.client.get(reverse("users:list"))
+
+        root = next(span for span in self._get_spans(mock_export) if span["parent_span_id"] is None)
+
+        self.assertEqual(root["name"], "GET users:list")
+        self.assertEqual(root["kind"], SPAN_KIND_SERVER)
+        self.assertEqual(root["attributes"]["http.response.status_code"], 200)
+        self.assertEqual(root["attributes"]["enduser.id"], str(self.admin.pk))
+        self.assertEqual(response["traceresponse"], f"00-{root['trace_id']}-{root['span_id']}-01")
+
+    def test_request_joins_incoming_trace(self, mock_export):
+        self.client.get(
+            reverse("authentication:login"), headers={"traceparent": f"00-{REMOTE_TRACE_ID}-{REMOTE_SPAN_ID}-01"}
+        )
+
+        spans = self._get_spans(mock_export)
+        root = next(span for span in spans if span["kind"] == SPAN_KIND_SERVER)
+
+        self.assertEqual(root["parent_span_id"], REMOTE_SPAN_ID)
+        self.assertEqual({span["trace_id"] for span in spans}, {REMOTE_TRACE_ID})
+
+    @override_settings(TRACING_SAMPLE_RATE=0.0)
+    def test_request_does_not_trust_incoming_sampling_decision_by_default(self, mock_export):
+        response = self.client.get(
+            reverse("authentication:login"), headers={"traceparent": f"00-{REMOTE_TRACE_ID}-{REMOTE_SPAN_ID}-01"}
+        )
+
+        self.assertNotIn("traceresponse", response)
+        mock_export.assert_not_called()
+
+    @override_settings(TRACING_TRUSTED_PARENT=True)
+    def test_request_keeps_incoming_sampling_decision_of_trusted_parent(self, mock_export):
+        response = self.client.get(
+            reverse("authentication:login"), headers={"traceparent": f"00-{REMOTE_TRACE_ID}-{REMOTE_SPAN_ID}-00"}
+        )
+
+        self.assertNotIn("traceresponse", response)
+        mock_export.assert_not_called()
+
+    def test_outbox_task_continues_the_trace_that_enqueued_it(self, mock_export):
+        with start_trace("test", SPAN_KIND_SERVER) as root:
+            OutboxService().enqueue(email_send_batch_task)
+
+        message = OutboxMessage.objects.get()
+        enqueue_span = next(span for span in self._get_spans(mock_export) if span["name"] == "OutboxService.enqueue")
+
+        self.assertEqual(message.headers["traceparent"], f"00-{root.trace.trace_id}-{enqueue_span['span_id']}-01")
+
+        mock_export.reset_mock()
+
+        with override_settings(TRACING_SAMPLE_RATE=0.0):
+            OutboxRelayService().relay_batch()
+
+        task_span = next(span for span in self._get_spans(mock_export) if span["kind"] == SPAN_KIND_CONSUMER)
+
+        self.assertEqual(task_span["name"], f"celery {email_send_batch_task.name}")
+        self.assertEqual(task_span["trace_id"], root.trace.trace_id)
+        self.assertEqual(task_span["parent_span_id"], enqueue_span["span_id"])
+        self.assertEqual(task_span["attributes"]["celery.state"], "SUCCESS")
+
+
+@override_settings(TRACING_ENABLED=True, TRACING_SAMPLE_RATE=1.0, TRACING_EXPORTER="file")
+class FileExporterTests(TestCase):
+    def test_appends_spans_as_json_lines(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "traces" / "spans.jsonl"
+
+            with override_settings(TRACING_FILE_PATH=str(path)), start_trace("test", SPAN_KIND_SERVER) as root:
+                with start_span("child"):
+                    pass
+
+            lines = [json.loads(line) for line in path.read_text().splitlines()]
+
+            self.assertEqual([line["name"] for line in lines], ["child", "test"])
+            self.assertEqual(lines[0]["parent_span_id"], root.span_id)
@@ -0,0 +1,316 @@
+import inspect
+import json
+import os
+import random
+import re
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from functools import wraps
+from pathlib import Path
+
+from django.conf import settings
+from django.db.backends.base.base import BaseDatabaseWrapper
+from loguru import logger
+
+# Spans follow the OpenTelemetry data model and W3C trace context ids, so the exported lines can be loaded into any
+# tracing backend that reads OTLP-like JSON
+SPAN_KIND_INTERNAL = "internal"
+SPAN_KIND_SERVER = "server"
+SPAN_KIND_CLIENT = "client"
+SPAN_KIND_PRODUCER = "producer"
+SPAN_KIND_CONSUMER = "consumer"
+
+TRACEPARENT_HEADER = "traceparent"
+TRACEPARENT_PATTERN = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+_export_lock = threading.Lock()
+
+
+@dataclass
+class Trace:
+    trace_id: str
+    root_span_id: str = ""
+    spans: list["Span"] = field(default_factory=list)
+    dropped_spans: int = 0
+
+
+@dataclass
+class Span:
+    trace: Trace
+    name: str
+    kind: str = SPAN_KIND_INTERNAL
+    parent_id: str | None = None
+    attributes: dict = field(default_factory=dict)
+    span_id: str = field(default_factory=lambda: os.urandom(8).hex())
+    status: str = "ok"
+    start_time_ns: int = field(default_factory=time.time_ns)
+    end_time_ns: int = 0
+
+    @property
+    def traceparent(self) -> str:
+        # Only sampled traces create spans, so the sampled flag is always set
+        return f"00-{self.trace.trace_id}-{self.span_id}-01"
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.status = "error"
+        self.attributes["exception.type"] = type(exc).__name__
+        self.attributes["exception.message"] = str(exc)
+
+    def to_dict(self) -> dict:
+        return {
+            "trace_id": self.trace.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_time_unix_nano": self.start_time_ns,
+            "end_time_unix_nano": self.end_time_ns,
+            "duration_ms": round((self.end_time_ns - self.start_time_ns) / 1_000_000, 3),
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def get_current_span() -> Span | None:
+    return _current_span.get()
+
+
+def get_current_traceparent() -> str | None:
+    span = _current_span.get()
+
+    return span.traceparent if span is not None else None
+
+
+def parse_traceparent(value: str | None) -> tuple[str, str, bool] | None:
+    match = TRACEPARENT_PATTERN.match((value or "").strip().lower())
+
+    if match is None:
+        return None
+
+    trace_id, parent_id, flags = match.groups()
+
+    if trace_id == "0" * 32 or parent_id == "0" * 16:
+        return None
+
+    return trace_id, parent_id, bool(int(flags, 16) & 1)
+
+
+def export_spans(spans: list[Span]) -> None:
+    if settings.TRACING_EXPORTER == "file":
+        path = Path(settings.TRACING_FILE_PATH)
+        lines = "".join(json.dumps(span.to_dict(), default=str) + "\n" for span in spans)
+
+        # One write per trace, the lock keeps the lines of concurrent traces of a process from interleaving
+        with _export_lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            with path.open("a") as file:
+                file.write(lines)
+
+        return
+
+    for span in spans:
+        logger.info("span", **span.to_dict())
+
+
+def open_span(span: Span) -> Token:
+    return _current_span.set(span)
+
+
+def close_span(span: Span, token: Token) -> None:
+    span.end_time_ns = time.time_ns()
+    _current_span.reset(token)
+
+    trace = span.trace
+    is_root = span.span_id == trace.root_span_id
+
+    # A page with an N+1 query would otherwise export thousands of spans, the root is always kept
+    if is_root or len(trace.spans) < settings.TRACING_MAX_SPANS_PER_TRACE:
+        trace.spans.append(span)
+    else:
+        trace.dropped_spans += 1
+
+    if is_root:
+        if trace.dropped_spans:
+            span.attributes["tracing.dropped_spans"] = trace.dropped_spans
+
+        try:
+            export_spans(trace.spans)
+        except Exception as exc:
+            logger.warning(f"Could not export trace {trace.trace_id}: {exc}")
+
+
+def create_child_span(name: str, kind: str = SPAN_KIND_INTERNAL, attributes: dict | None = None) -> Span | None:
+    parent = _current_span.get()
+
+    if parent is None:
+        return None
+
+    return Span(trace=parent.trace, name=name, kind=kind, parent_id=parent.span_id, attributes=attributes or {})
+
+
+def create_root_span(
+    name: str,
+    kind: str,
+    traceparent: str | None = None,
+    attributes: dict | None = None,
+    trust_sampled: bool = True,
+) -> Span | None:
+    if not settings.TRACING_ENABLED:
+        return None
+
+    # Work started inside an already traced one, such as an eagerly run task, joins its trace
+    if _current_span.get() is not None:
+        return create_child_span(name, kind, attributes)
+
+    remote_parent = parse_traceparent(traceparent)
+
+    if remote_parent is not None:
+        trace_id, parent_id, sampled = remote_parent
+    else:
+        trace_id, parent_id, sampled = os.urandom(16).hex(), None, False
+
+    # A trusted caller already made the sampling decision for its trace, it is kept so traces are never cut in half.
+    # Anyone else could force every request to be recorded, so their traces are only joined when sampled here.
+    if remote_parent is None or not trust_sampled:
+        sampled = random.random() < settings.TRACING_SAMPLE_RATE
+
+    if not sampled:
+        return None
+
+    trace = Trace(trace_id=trace_id)
+    span = Span(trace=trace, name=name, kind=kind, parent_id=parent_id, attributes=attributes or {})
+    trace.root_span_id = span.span_id
+
+    return span
+
+
+@contextmanager
+def _run_span(span: Span | None) -> Iterator[Span | None]:
+    if span is None:
+        yield None
+        return
+
+    token = open_span(span)
+
+    try:
+        yield span
+    except BaseException as exc:
+        span.record_exception(exc)
+        raise
+    finally:
+        close_span(span, token)
+
+
+def start_trace(
+    name: str,
+    kind: str = SPAN_KIND_SERVER,
+    traceparent: str | None = None,
+    attributes: dict | None = None,
+    trust_sampled: bool = True,
+):
+    return _run_span(create_root_span(name, kind, traceparent, attributes, trust_sampled))
+
+
+def start_span(name: str, kind: str = SPAN_KIND_INTERNAL, attributes: dict | None = None):
+    return _run_span(create_child_span(name, kind, attributes))
+
+
+def _trace_method(name: str, func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        # Outside of a sampled trace the call costs one context variable lookup
+        if _current_span.get() is None:
+            return func(*args, **kwargs)
+
+        with start_span(name, attributes={"code.function": name}):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def traced(cls):
+    # Wraps the public methods a service or selector class defines itself, private helpers show up in their callers
+    for attribute, value in list(vars(cls).items()):
+        if not attribute.startswith("_") and inspect.isfunction(value):
+            setattr(cls, attribute, _trace_method(f"{cls.__name__}.{attribute}", value))
+
+    return cls
+
+
+def trace_query(execute, sql, params, many, context):
+    if _current_span.get() is None:
+        return execute(sql, params, many, context)
+
+    connection = context["connection"]
+    operation = sql.lstrip().split(None, 1)[0].upper() if sql.strip() else "QUERY"
+
+    # Parameters are left out, they may hold personal data
+    attributes = {
+        "db.system": connection.vendor,
+        "db.name": connection.alias,
+        "db.operation": operation,
+        "db.statement": sql,
+    }
+
+    with start_span(f"db {operation}", SPAN_KIND_CLIENT, attributes):
+        return execute(sql, params, many, context)
+
+
+def install_query_tracing(sender, connection: BaseDatabaseWrapper, **kwargs) -> None:
+    # Inserted first for the same reason as the slow query log, see install_slow_query_log
+    if settings.TRACING_ENABLED and trace_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, trace_query)
+
+
+def _get_task_traceparent(task) -> str | None:
+    # Custom headers are merged into the request by the worker, eagerly run tasks keep them under "headers"
+    return getattr(task.request, TRACEPARENT_HEADER, None) or (task.request.headers or {}).get(TRACEPARENT_HEADER)
+
+
+def inject_task_traceparent(sender=None, headers=None, **kwargs) -> None:
+    # Messages relayed from the outbox already carry the context of the request that enqueued them
+    traceparent = get_current_traceparent()
+
+    if headers is not None and traceparent is not None:
+        headers.setdefault(TRACEPARENT_HEADER, traceparent)
+
+
+def start_task_span(sender=None, task_id=None, task=None, **kwargs) -> None:
+    span = create_root_span(
+        f"celery {task.name}",
+        SPAN_KIND_CONSUMER,
+        _get_task_traceparent(task),
+        {"celery.task_name": task.name, "celery.task_id": task_id, "celery.retries": task.request.retries},
+    )
+
+    if span is not None:
+        task.request.tracing_span = span
+        task.request.tracing_token = open_span(span)
+
+
+def record_task_failure(sender=None, exception=None, **kwargs) -> None:
+    span = getattr(sender.request, "tracing_span", None)
+
+    if span is not None and exception is not None:
+        span.record_exception(exception)
+
+
+def end_task_span(sender=None, task=None, state=None, **kwargs) -> None:
+    span = getattr(task.request, "tracing_span", None)
+
+    if span is None:
+        return
+
+    span.attributes["celery.state"] = state
+    close_span(span, task.request.tracing_token)
+
+    task.request.tracing_span = None
+    task.request.tracing_token = None
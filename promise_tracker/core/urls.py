@@ -0,0 +1,11 @@
+from django.urls import path
+
+from .views import ProfileDetailView, ProfileDownloadView, ProfileListView
+
+app_name = "core"
+
+urlpatterns = [
+    path("profiles/", ProfileListView.as_view(), name="profile_list"),
+    path("profiles/<uuid:id>/", ProfileDetailView.as_view(), name="profile_detail"),
+    path("profiles/<uuid:id>/download/", ProfileDownloadView.as_view(), name="profile_download"),
+]
@@ -1,4 +1,21 @@
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse
 from django.shortcuts import render
+from django.utils.crypto import constant_time_compare
+from django.utils.translation import gettext_lazy as _
+from django.views import View
+
+from promise_tracker.common.mixins import HandleErrorsMixin, RoleBasedAccessMixin, VerifiedLoginRequiredMixin
+from promise_tracker.core.exceptions import NotFoundError
+from promise_tracker.core.metrics import render_metrics
+from promise_tracker.core.profiling import (
+    PROFILE_SORT_KEYS,
+    get_profile,
+    get_profile_path,
+    get_profile_report,
+    get_profiles,
+)
+from promise_tracker.core.roles import Administrator
 
 
 def custom_404(request, exception):
@@ -11,3 +28,63 @@ def custom_500(request):
 
 def custom_403(request, exception):
     return render(request, "core/403.html", status=403)
+
+
+def metrics(request):
+    # Scrapers authenticate with a bearer token, the endpoint does not exist until one is configured
+    token = settings.REQUEST_METRICS_TOKEN
+    authorization = request.headers.get("Authorization", "")
+
+    if not token:
+        raise Http404()
+
+    if not constant_time_compare(authorization, f"Bearer {token}"):
+        return HttpResponse(status=401, headers={"WWW-Authenticate": "Bearer"})
+
+    return HttpResponse(render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+class ProfileListView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View):
+    template_name = "core/profiles/list.html"
+    required_roles = [Administrator]
+
+    def get(self, request, *args, **kwargs):
+        return render(request, self.template_name, {"profiles": get_profiles()})
+
+
+class ProfileDetailView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View):
+    template_name = "core/profiles/detail.html"
+    required_roles = [Administrator]
+
+    def get(self, request, *args, **kwargs):
+        profile = get_profile(kwargs["id"])
+
+        if profile is None:
+            raise NotFoundError(_("Profile not found."))
+
+        sort_by = request.GET.get("sort")
+
+        if sort_by not in PROFILE_SORT_KEYS:
+            sort_by = PROFILE_SORT_KEYS[0]
+
+        context = {
+            "profile": profile,
+            "report": get_profile_report(kwargs["id"], sort_by),
+            "sort_by": sort_by,
+            "sort_keys": PROFILE_SORT_KEYS,
+        }
+
+        return render(request, self.template_name, context)
+
+
+class ProfileDownloadView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View):
+    required_roles = [Administrator]
+
+    def get(self, request, *args, **kwargs):
+        path = get_profile_path(kwargs["id"])
+
+        if path is None:
+            raise NotFoundError(_("Profile not found."))
+
+        # Opens in snakeviz or any other pstats viewer
+        return FileResponse(path.open("rb"), as_attachment=True, filename=path.name)
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.7 on 2026-10-18 23:26
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QueuedEmail',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, help_text='The unique identifier for the record.', primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True, help_text='The date and time when the record was created.', verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='The date and time when the record was last updated.', verbose_name='Updated At')),
+                ('recipient', models.EmailField(help_text='The email address of the recipient.', max_length=255, verbose_name='Recipient')),
+                ('subject', models.CharField(help_text='The subject of the email.', max_length=255, verbose_name='Subject')),
+                ('body', models.TextField(help_text='The plain text body of the email.', verbose_name='Body')),
+                ('html_body', models.TextField(blank=True, help_text='The HTML body of the email.', null=True, verbose_name='HTML body')),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('FAILED', 'Failed')], default='PENDING', help_text='The sending status of the email.', max_length=20, verbose_name='Status')),
+                ('attempts', models.PositiveIntegerField(default=0, help_text='The number of failed attempts to send the email.', verbose_name='Attempts')),
+                ('last_error', models.TextField(blank=True, help_text='The error raised by the last failed sending attempt.', null=True, verbose_name='Last error')),
+                ('next_attempt_at', models.DateTimeField(blank=True, help_text='The date and time after which sending is retried.', null=True, verbose_name='Next attempt at')),
+                ('created_by', models.ForeignKey(blank=True, help_text='The user who created the record.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('updated_by', models.ForeignKey(blank=True, help_text='The user who last updated the record.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated', to=settings.AUTH_USER_MODEL, verbose_name='Updated By')),
+            ],
+            options={
+                'verbose_name': 'Queued email',
+                'verbose_name_plural': 'Queued emails',
+                'indexes': [models.Index(condition=models.Q(('status', 'PENDING')), fields=['created_at'], name='queued_email_pending_idx')],
+            },
+        ),
+    ]
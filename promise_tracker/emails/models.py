@@ -0,0 +1,80 @@
+from django.db import models
+from django.db.models import Q
+from django.db.models.fields import Field
+from django.utils.translation import gettext_lazy as _
+
+from promise_tracker.common.models import BaseModel
+
+
+class QueuedEmail(BaseModel):
+    class Status(models.TextChoices):
+        PENDING = "PENDING", _("Pending")
+        FAILED = "FAILED", _("Failed")
+
+    recipient: Field = models.EmailField(
+        max_length=255,
+        null=False,
+        blank=False,
+        verbose_name=_("Recipient"),
+        help_text=_("The email address of the recipient."),
+    )
+    subject: Field = models.CharField(
+        max_length=255,
+        null=False,
+        blank=False,
+        verbose_name=_("Subject"),
+        help_text=_("The subject of the email."),
+    )
+    body: Field = models.TextField(
+        null=False,
+        blank=False,
+        verbose_name=_("Body"),
+        help_text=_("The plain text body of the email."),
+    )
+    html_body: Field = models.TextField(
+        null=True,
+        blank=True,
+        verbose_name=_("HTML body"),
+        help_text=_("The HTML body of the email."),
+    )
+    status: Field = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING,
+        null=False,
+        blank=False,
+        verbose_name=_("Status"),
+        help_text=_("The sending status of the email."),
+    )
+    attempts: Field = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Attempts"),
+        help_text=_("The number of failed attempts to send the email."),
+    )
+    last_error: Field = models.TextField(
+        null=True,
+        blank=True,
+        verbose_name=_("Last error"),
+        help_text=_("The error raised by the last failed sending attempt."),
+    )
+    next_attempt_at: Field = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name=_("Next attempt at"),
+        help_text=_("The date and time after which sending is retried."),
+    )
+
+    def __str__(self) -> str:
+        return f"{self.subject} ({self.recipient})"
+
+    class Meta:
+        verbose_name = _("Queued email")
+        verbose_name_plural = _("Queued emails")
+
+        indexes = [
+            models.Index(
+                fields=["created_at"],
+                condition=Q(status="PENDING"),
+                name="queued_email_pending_idx",
+            ),
+        ]
@@ -1,24 +1,182 @@
+import datetime
+import time
+from dataclasses import dataclass
+from uuid import UUID
+
 from django.conf import settings
-from django.core.mail import EmailMultiAlternatives
-from django.db import transaction
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.html import format_html, format_html_join
 from django.utils.translation import gettext_lazy as _
 from loguru import logger
 
+from promise_tracker.core.database import write_transaction
+from promise_tracker.core.tracing import traced
+from promise_tracker.emails.models import QueuedEmail
+
+
+@dataclass
+class EmailBatchResult:
+    sent: int
+    failed: int
+    duration_seconds: float
+
+    @property
+    def per_second(self) -> float:
+        if self.duration_seconds == 0:
+            return 0.0
+        return self.sent / self.duration_seconds
 
-class EmailService:
-    @transaction.atomic
-    def send_verification_email(self, user_email: str, verification_code: str) -> None:
-        logger.debug(f"Sending verification email to {user_email}")
 
-        subject = _("Your Verification Code")
-        to = user_email
-        from_email = settings.EMAIL_SENDER
+@traced
+class EmailService:
+    def _build_verification_email(self, verification_code: str) -> tuple[str, str, str]:
+        subject = str(_("Your Verification Code"))
         plain_text = _("Your verification code is: {code}").format(code=verification_code)
         html = _("<p>Your verification code is: <strong>{code}</strong></p>").format(code=verification_code)
 
-        msg = EmailMultiAlternatives(subject, plain_text, from_email, [to])
-        msg.attach_alternative(html, "text/html")
+        return subject, plain_text, html
+
+    def queue_verification_email(self, user_email: str, verification_code: str) -> QueuedEmail:
+        subject, plain_text, html = self._build_verification_email(verification_code)
+
+        queued_email = QueuedEmail.objects.create(
+            recipient=user_email,
+            subject=subject,
+            body=plain_text,
+            html_body=html,
+        )
+
+        logger.debug(f"Queued verification email {queued_email.id} to {user_email}")
+
+        return queued_email
+
+    def _build_review_digest_email(self, lines: list[str]) -> tuple[str, str, str]:
+        subject = str(_("Your contributions have been reviewed"))
+        plain_text = "\n".join(f"- {line}" for line in lines)
+        html = format_html("<ul>{}</ul>", format_html_join("", "<li>{}</li>", ((line,) for line in lines)))
+
+        return subject, plain_text, html
+
+    def queue_review_digests(self, digests: dict[str, list[str]]) -> list[QueuedEmail]:
+        queued_emails = []
+
+        for user_email, lines in digests.items():
+            subject, plain_text, html = self._build_review_digest_email(lines)
+            queued_emails.append(QueuedEmail(recipient=user_email, subject=subject, body=plain_text, html_body=html))
+
+        return QueuedEmail.objects.bulk_create(queued_emails)
+
+
+@traced
+class EmailBatchService:
+    def _claim_pending_emails(self, batch_size: int) -> list[QueuedEmail]:
+        now = timezone.now()
+        qs = (
+            QueuedEmail.objects.filter(status=QueuedEmail.Status.PENDING)
+            .filter(Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=now))
+            .order_by("created_at")
+        )
+
+        if connection.features.has_select_for_update_skip_locked:
+            qs = qs.select_for_update(skip_locked=True)
+
+        with write_transaction():
+            queued_emails = list(qs[:batch_size])
+
+            # Other workers skip the claimed emails until the claim expires, which retries the emails of a worker
+            # that died while sending
+            claimed_until = now + datetime.timedelta(seconds=settings.EMAIL_CLAIM_TIMEOUT_SECONDS)
+            QueuedEmail.objects.filter(id__in=[queued_email.id for queued_email in queued_emails]).update(
+                next_attempt_at=claimed_until
+            )
+
+        return queued_emails
+
+    def _to_message(self, queued_email: QueuedEmail, smtp_connection) -> EmailMultiAlternatives:
+        msg = EmailMultiAlternatives(
+            queued_email.subject,
+            queued_email.body,
+            settings.EMAIL_SENDER,
+            [queued_email.recipient],
+            connection=smtp_connection,
+        )
+
+        if queued_email.html_body:
+            msg.attach_alternative(queued_email.html_body, "text/html")
+
+        return msg
+
+    def _throttle(self, started_at: float, sent_count: int) -> None:
+        if settings.EMAIL_MAX_PER_SECOND <= 0:
+            return
+
+        earliest_next_send = started_at + sent_count / settings.EMAIL_MAX_PER_SECOND
+        wait = earliest_next_send - time.monotonic()
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def _mark_failed_attempt(self, queued_email: QueuedEmail, exc: Exception) -> None:
+        queued_email.attempts += 1
+        queued_email.last_error = str(exc)
+
+        if queued_email.attempts >= settings.EMAIL_MAX_ATTEMPTS:
+            queued_email.status = QueuedEmail.Status.FAILED
+            return
+
+        backoff = settings.EMAIL_RETRY_DELAY_SECONDS * 2 ** (queued_email.attempts - 1)
+        queued_email.next_attempt_at = timezone.now() + datetime.timedelta(seconds=backoff)
+
+    def _record_outcome(self, sent_ids: list[UUID], failed_emails: list[QueuedEmail]) -> None:
+        with write_transaction():
+            QueuedEmail.objects.filter(id__in=sent_ids).delete()
+            QueuedEmail.objects.bulk_update(failed_emails, ["status", "attempts", "last_error", "next_attempt_at"])
+
+    def send_pending(self, batch_size: int | None = None) -> EmailBatchResult:
+        batch_size = batch_size or settings.EMAIL_BATCH_SIZE
+        queued_emails = self._claim_pending_emails(batch_size)
+
+        if not queued_emails:
+            return EmailBatchResult(sent=0, failed=0, duration_seconds=0.0)
+
+        sent_ids: list[UUID] = []
+        failed_emails: list[QueuedEmail] = []
+        started_at = time.monotonic()
+
+        # Sent outside of a transaction, so a slow SMTP server does not keep the rows or the database locked.
+        # One SMTP session for the whole batch instead of a handshake per message.
+        with get_connection(fail_silently=False) as smtp_connection:
+            for queued_email in queued_emails:
+                self._throttle(started_at, len(sent_ids) + len(failed_emails))
+
+                try:
+                    self._to_message(queued_email, smtp_connection).send(fail_silently=False)
+                except Exception as exc:
+                    logger.warning(f"Failed to send queued email {queued_email.id}: {exc}")
+
+                    self._mark_failed_attempt(queued_email, exc)
+                    failed_emails.append(queued_email)
+                    continue
+
+                sent_ids.append(queued_email.id)
+
+        self._record_outcome(sent_ids, failed_emails)
+
+        result = EmailBatchResult(
+            sent=len(sent_ids),
+            failed=len(failed_emails),
+            duration_seconds=time.monotonic() - started_at,
+        )
 
-        msg.send(fail_silently=False)
+        logger.info(
+            "email batch",
+            sent=result.sent,
+            failed=result.failed,
+            duration_ms=round(result.duration_seconds * 1000, 2),
+            per_second=round(result.per_second, 2),
+        )
 
-        logger.info(f"Sent verification email to {user_email}")
+        return result
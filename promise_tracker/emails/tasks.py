@@ -1,20 +1,29 @@
 from celery import shared_task
 from loguru import logger
 
-from promise_tracker.emails.services import EmailService
+from promise_tracker.emails.services import EmailBatchService, EmailService
 from promise_tracker.tasks.models import BaseTask
 
 
-@shared_task(bind=True, base=BaseTask, name="send_email_task")
-def email_send_task(self, user_email: str, verification_code: str) -> None:
+@shared_task(bind=True, base=BaseTask, name="send_email_batch_task")
+def email_send_batch_task(self) -> None:
     logger.info(f"Starting task {self.name} (id: {self.request.id})")
 
-    email_service = EmailService()
+    email_batch_service = EmailBatchService()
 
     try:
-        email_service.send_verification_email(user_email, verification_code)
+        while email_batch_service.send_pending().sent > 0:
+            pass
     except Exception as exc:
-        logger.warning(f"Exception occurred while sending email: {exc}")
+        logger.warning(f"Exception occurred while sending email batch: {exc}")
         self.retry(exc=exc)
 
     logger.info(f"Completed task {self.name} (id: {self.request.id})")
+
+
+# Deprecated: kept for one release so messages queued by the previous version are still handled
+@shared_task(bind=True, base=BaseTask, name="send_email_task")
+def email_send_task(self, user_email: str, verification_code: str) -> None:
+    logger.warning(f"Task {self.name} is deprecated, verification emails are queued by EmailService")
+
+    EmailService().queue_verification_email(user_email, verification_code)
@@ -0,0 +1,133 @@
+import socket
+from unittest.mock import patch
+
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import Envelope
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from promise_tracker.emails.models import QueuedEmail
+from promise_tracker.emails.services import EmailBatchService, EmailService
+
+
+class RecordingHandler:
+    def __init__(self) -> None:
+        self.sessions = 0
+        self.messages: list[Envelope] = []
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        self.sessions += 1
+        session.host_name = hostname
+        return responses
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(envelope)
+        return "250 OK"
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@override_settings(EMAIL_MAX_ATTEMPTS=2, EMAIL_RETRY_DELAY_SECONDS=60, EMAIL_MAX_PER_SECOND=0)
+class EmailBatchServicesIntegrationTests(TestCase):
+    def setUp(self) -> None:
+        self.handler = RecordingHandler()
+        self.port = get_free_port()
+        self.controller = Controller(self.handler, hostname="127.0.0.1", port=self.port)
+        self.controller.start()
+        self.addCleanup(self.controller.stop)
+
+        self.settings_override = override_settings(
+            EMAIL_BACKEND="django.core.mail.backends.smtp.EmailBackend",
+            EMAIL_HOST="127.0.0.1",
+            EMAIL_PORT=self.port,
+            EMAIL_HOST_USER="",
+            EMAIL_HOST_PASSWORD="",
+            EMAIL_USE_SSL=False,
+            EMAIL_USE_TLS=False,
+            EMAIL_SENDER="sender@example.com",
+        )
+        self.settings_override.enable()
+        self.addCleanup(self.settings_override.disable)
+
+        self.email_service = EmailService()
+        self.service = EmailBatchService()
+
+    def test_send_pending_sends_batch_over_single_connection(self):
+        for i in range(5):
+            self.email_service.queue_verification_email(f"user{i}@example.com", "123456")
+
+        result = self.service.send_pending(batch_size=10)
+
+        self.assertEqual(result.sent, 5)
+        self.assertEqual(result.failed, 0)
+        self.assertEqual(len(self.handler.messages), 5)
+        self.assertEqual(self.handler.sessions, 1)
+        self.assertFalse(QueuedEmail.objects.exists())
+
+    def test_send_pending_respects_batch_size(self):
+        for i in range(3):
+            self.email_service.queue_verification_email(f"user{i}@example.com", "123456")
+
+        result = self.service.send_pending(batch_size=2)
+
+        self.assertEqual(result.sent, 2)
+        self.assertEqual(QueuedEmail.objects.count(), 1)
+
+    def test_claimed_emails_are_not_claimed_again(self):
+        for i in range(3):
+            self.email_service.queue_verification_email(f"user{i}@example.com", "123456")
+
+        self.assertEqual(len(self.service._claim_pending_emails(batch_size=2)), 2)
+        self.assertEqual(len(self.service._claim_pending_emails(batch_size=10)), 1)
+        self.assertListEqual(self.service._claim_pending_emails(batch_size=10), [])
+
+    def test_send_pending_retries_failed_message_with_backoff(self):
+        failing = self.email_service.queue_verification_email("fail@example.com", "123456")
+        self.email_service.queue_verification_email("ok@example.com", "123456")
+
+        original_to_message = EmailBatchService._to_message
+
+        def to_message(service, queued_email, smtp_connection):
+            if queued_email.id == failing.id:
+                raise RuntimeError("mailbox unavailable")
+            return original_to_message(service, queued_email, smtp_connection)
+
+        with patch.object(EmailBatchService, "_to_message", to_message):
+            result = self.service.send_pending()
+
+        failing.refresh_from_db()
+
+        self.assertEqual(result.sent, 1)
+        self.assertEqual(result.failed, 1)
+        self.assertEqual(failing.attempts, 1)
+        self.assertEqual(failing.last_error, "mailbox unavailable")
+        self.assertGreater(failing.next_attempt_at, timezone.now())
+        self.assertEqual(self.service.send_pending().sent, 0)
+
+    def test_send_pending_marks_message_failed_after_max_attempts(self):
+        queued_email = self.email_service.queue_verification_email("fail@example.com", "123456")
+
+        with patch.object(EmailBatchService, "_to_message", side_effect=RuntimeError("mailbox unavailable")):
+            self.service.send_pending()
+            QueuedEmail.objects.update(next_attempt_at=timezone.now())
+            self.service.send_pending()
+
+        queued_email.refresh_from_db()
+
+        self.assertEqual(queued_email.status, QueuedEmail.Status.FAILED)
+        self.assertEqual(queued_email.attempts, 2)
+
+    @override_settings(EMAIL_MAX_PER_SECOND=20)
+    def test_send_pending_paces_messages_to_rate_limit(self):
+        for i in range(4):
+            self.email_service.queue_verification_email(f"user{i}@example.com", "123456")
+
+        result = self.service.send_pending()
+
+        # Four messages at 20 per second need at least three 50 ms gaps
+        self.assertGreaterEqual(result.duration_seconds, 0.15)
+        self.assertEqual(result.sent, 4)
@@ -2,20 +2,24 @@ from unittest.mock import patch
 
 from django.test import TestCase
 
-from promise_tracker.emails.services import EmailService
-from promise_tracker.emails.tasks import email_send_task
-from promise_tracker.users.tests.factories import UnverifiedUserFactory
+from promise_tracker.emails.models import QueuedEmail
+from promise_tracker.emails.services import EmailBatchResult
+from promise_tracker.emails.tasks import email_send_batch_task, email_send_task
 
 
 class EmailTasksIntegrationTests(TestCase):
-    def setUp(self) -> None:
-        self.service = EmailService()
+    @patch("promise_tracker.emails.services.EmailBatchService.send_pending")
+    def test_email_send_batch_task_drains_until_nothing_is_sent(self, mock_send_pending):
+        mock_send_pending.side_effect = [
+            EmailBatchResult(sent=2, failed=0, duration_seconds=0.1),
+            EmailBatchResult(sent=0, failed=0, duration_seconds=0.0),
+        ]
 
-    @patch("promise_tracker.emails.services.EmailService.send_verification_email")
-    def test_email_send_task_calls_service_method(self, mock_send_email):
-        user = UnverifiedUserFactory.create()
-        verification_code = "123456"
+        email_send_batch_task()
 
-        email_send_task(user_email=user.email, verification_code=verification_code)
+        self.assertEqual(mock_send_pending.call_count, 2)
 
-        mock_send_email.assert_called_once_with(user.email, verification_code)
+    def test_deprecated_email_send_task_queues_verification_email(self):
+        email_send_task("user@example.com", "123456")
+
+        self.assertEqual(QueuedEmail.objects.get().recipient, "user@example.com")
@@ -1,10 +1,10 @@
 from django.shortcuts import render
 from django.views import View
 
-from promise_tracker.common.mixins import VerifiedLoginRequiredMixin
+from promise_tracker.common.mixins import NonAtomicReadMixin, SessionFreeMixin
 
 
-class IndexView(View):
+class IndexView(NonAtomicReadMixin, SessionFreeMixin, View):
     template_name = "home/index.html"
 
     def get(self, request, *args, **kwargs):
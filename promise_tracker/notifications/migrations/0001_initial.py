@@ -0,0 +1,39 @@
+# Generated by Django 5.2.7 on 2026-10-18 23:30
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReviewNotification',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, help_text='The unique identifier for the record.', primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True, help_text='The date and time when the record was created.', verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='The date and time when the record was last updated.', verbose_name='Updated At')),
+                ('kind', models.CharField(choices=[('PROMISE', 'Promise'), ('RESULT', 'Result')], help_text='The kind of the reviewed item.', max_length=20, verbose_name='Kind')),
+                ('object_id', models.UUIDField(help_text='The identifier of the reviewed item.', verbose_name='Object ID')),
+                ('object_name', models.CharField(help_text='The name of the reviewed item at the time of the review.', max_length=255, verbose_name='Object name')),
+                ('review_status', models.CharField(help_text='The review status given to the item.', max_length=20, verbose_name='Review status')),
+                ('sent_at', models.DateTimeField(blank=True, help_text='The date and time when the notification was included in a digest.', null=True, verbose_name='Sent at')),
+                ('created_by', models.ForeignKey(blank=True, help_text='The user who created the record.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('recipient', models.ForeignKey(help_text='The user who is notified about the review.', on_delete=django.db.models.deletion.CASCADE, related_name='review_notifications', to=settings.AUTH_USER_MODEL, verbose_name='Recipient')),
+                ('updated_by', models.ForeignKey(blank=True, help_text='The user who last updated the record.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated', to=settings.AUTH_USER_MODEL, verbose_name='Updated By')),
+            ],
+            options={
+                'verbose_name': 'Review notification',
+                'verbose_name_plural': 'Review notifications',
+                'indexes': [models.Index(condition=models.Q(('sent_at__isnull', True)), fields=['recipient', 'created_at'], name='notification_unsent_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-19 00:17
+
+import promise_tracker.common.uuids
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0001_initial'),
+    ]
+
+    operations = [
+        # The default is only applied in Python, so existing rows and the table itself are left as they are
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='reviewnotification',
+                    name='id',
+                    field=models.UUIDField(default=promise_tracker.common.uuids.uuid7, editable=False, help_text='The unique identifier for the record.', primary_key=True, serialize=False, verbose_name='ID'),
+                ),
+            ],
+        ),
+    ]
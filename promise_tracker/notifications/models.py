@@ -0,0 +1,72 @@
+from django.conf import settings
+from django.db import models
+from django.db.models import Q
+from django.db.models.fields import Field
+from django.utils.translation import gettext_lazy as _
+
+from promise_tracker.common.models import BaseModel
+
+
+class ReviewNotification(BaseModel):
+    class Kind(models.TextChoices):
+        PROMISE = "PROMISE", _("Promise")
+        RESULT = "RESULT", _("Result")
+
+    recipient: Field = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        null=False,
+        blank=False,
+        related_name="review_notifications",
+        verbose_name=_("Recipient"),
+        help_text=_("The user who is notified about the review."),
+    )
+    kind: Field = models.CharField(
+        max_length=20,
+        choices=Kind.choices,
+        null=False,
+        blank=False,
+        verbose_name=_("Kind"),
+        help_text=_("The kind of the reviewed item."),
+    )
+    object_id: Field = models.UUIDField(
+        null=False,
+        blank=False,
+        verbose_name=_("Object ID"),
+        help_text=_("The identifier of the reviewed item."),
+    )
+    object_name: Field = models.CharField(
+        max_length=255,
+        null=False,
+        blank=False,
+        verbose_name=_("Object name"),
+        help_text=_("The name of the reviewed item at the time of the review."),
+    )
+    review_status: Field = models.CharField(
+        max_length=20,
+        null=False,
+        blank=False,
+        verbose_name=_("Review status"),
+        help_text=_("The review status given to the item."),
+    )
+    sent_at: Field = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name=_("Sent at"),
+        help_text=_("The date and time when the notification was included in a digest."),
+    )
+
+    def __str__(self) -> str:
+        return f"{self.object_name} -> {self.review_status}"
+
+    class Meta:
+        verbose_name = _("Review notification")
+        verbose_name_plural = _("Review notifications")
+
+        indexes = [
+            models.Index(
+                fields=["recipient", "created_at"],
+                condition=Q(sent_at__isnull=True),
+                name="notification_unsent_idx",
+            ),
+        ]
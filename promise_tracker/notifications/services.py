@@ -0,0 +1,123 @@
+from collections import defaultdict
+from uuid import UUID
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from loguru import logger
+
+from promise_tracker.core.database import write_transaction
+from promise_tracker.core.tracing import traced
+from promise_tracker.emails.services import EmailService
+from promise_tracker.notifications.models import ReviewNotification
+from promise_tracker.promises.models import Promise, PromiseResult
+from promise_tracker.users.models import BaseUser
+
+
+@traced
+class NotificationService:
+    def __init__(self, performed_by: BaseUser) -> None:
+        self.performed_by = performed_by
+
+    def _record(self, kind: ReviewNotification.Kind, reviewed: Promise | PromiseResult) -> ReviewNotification | None:
+        recipient = reviewed.created_by
+
+        # Reviewers do not need to be told about their own decisions
+        if recipient is None or recipient.id == self.performed_by.id:
+            return None
+
+        if not recipient.is_active or recipient.is_deleted:
+            return None
+
+        return ReviewNotification.objects.create(
+            recipient=recipient,
+            kind=kind,
+            object_id=reviewed.id,
+            object_name=reviewed.name,
+            review_status=reviewed.review_status,
+            created_by=self.performed_by,
+        )
+
+    def record_promise_review(self, promise: Promise) -> ReviewNotification | None:
+        return self._record(ReviewNotification.Kind.PROMISE, promise)
+
+    def record_result_review(self, result: PromiseResult) -> ReviewNotification | None:
+        return self._record(ReviewNotification.Kind.RESULT, result)
+
+
+@traced
+class DigestService:
+    def __init__(self, email_service: EmailService | None = None) -> None:
+        self.email_service = email_service or EmailService()
+
+    PROMISE_REVIEWED = _('Promise "{name}" was {status}.')
+    RESULT_REVIEWED = _('Result "{name}" was {status}.')
+
+    def _get_pending_notifications(self, batch_size: int) -> list[dict]:
+        qs = (
+            ReviewNotification.objects.filter(sent_at__isnull=True)
+            .order_by("recipient_id", "created_at")
+            .values(
+                "id",
+                "recipient_id",
+                "kind",
+                "object_name",
+                "review_status",
+                "recipient__email",
+                "recipient__is_active",
+                "recipient__is_deleted",
+            )
+        )
+
+        if connection.features.has_select_for_update_skip_locked and connection.features.has_select_for_update_of:
+            qs = qs.select_for_update(skip_locked=True, of=("self",))
+
+        # One row past the batch tells whether the batch ends inside the notifications of a recipient
+        notifications = list(qs[: batch_size + 1])
+
+        if len(notifications) <= batch_size:
+            return notifications
+
+        split_recipient_id = notifications[batch_size]["recipient_id"]
+        notifications = notifications[:batch_size]
+
+        # The split recipient is left for the next batch so they get a single digest, unless they fill the batch alone
+        complete = [
+            notification for notification in notifications if notification["recipient_id"] != split_recipient_id
+        ]
+
+        return complete or notifications
+
+    def _format_line(self, notification: dict) -> str:
+        message = (
+            self.PROMISE_REVIEWED if notification["kind"] == ReviewNotification.Kind.PROMISE else self.RESULT_REVIEWED
+        )
+        status = Promise.ReviewStatus(notification["review_status"]).label
+
+        return message.format(name=notification["object_name"], status=str(status).lower())
+
+    @write_transaction()
+    def send_digests(self, batch_size: int | None = None) -> int:
+        batch_size = batch_size or settings.NOTIFICATION_DIGEST_BATCH_SIZE
+        notifications = self._get_pending_notifications(batch_size)
+
+        if not notifications:
+            return 0
+
+        digests: dict[str, list[str]] = defaultdict(list)
+
+        for notification in notifications:
+            # Users deactivated after the review are not emailed, their notifications are still marked as sent so
+            # they leave the pending ones
+            if notification["recipient__is_active"] and not notification["recipient__is_deleted"]:
+                digests[notification["recipient__email"]].append(self._format_line(notification))
+
+        self.email_service.queue_review_digests(digests)
+
+        notification_ids: list[UUID] = [notification["id"] for notification in notifications]
+        ReviewNotification.objects.filter(id__in=notification_ids).update(sent_at=timezone.now())
+
+        logger.info(f"Queued {len(digests)} review digests for {len(notification_ids)} notifications.")
+
+        return len(notification_ids)
@@ -0,0 +1,21 @@
+from celery import shared_task
+from loguru import logger
+
+from promise_tracker.notifications.services import DigestService
+from promise_tracker.tasks.models import BaseTask
+
+
+@shared_task(bind=True, base=BaseTask, name="send_review_digests_task")
+def send_review_digests_task(self) -> None:
+    logger.info(f"Starting task {self.name} (id: {self.request.id})")
+
+    digest_service = DigestService()
+
+    try:
+        while digest_service.send_digests() > 0:
+            pass
+    except Exception as exc:
+        logger.warning(f"Exception occurred while sending review digests: {exc}")
+        self.retry(exc=exc)
+
+    logger.info(f"Completed task {self.name} (id: {self.request.id})")
@@ -0,0 +1,154 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from promise_tracker.emails.models import QueuedEmail
+from promise_tracker.notifications.models import ReviewNotification
+from promise_tracker.notifications.services import DigestService
+from promise_tracker.promises.models import Promise, PromiseResult
+from promise_tracker.promises.services.promise_result_services import PromiseResultService
+from promise_tracker.promises.services.promise_services import PromiseService
+from promise_tracker.promises.tests.factories import ValidPromiseFactory
+from promise_tracker.users.models import BaseUser
+from promise_tracker.users.tests.factories import AdminUserFactory, VerifiedUserFactory
+
+
+class NotificationServicesIntegrationTests(TestCase):
+    def setUp(self) -> None:
+        self.admin = AdminUserFactory.create()
+        self.user = VerifiedUserFactory.create()
+
+        self.digest_service = DigestService()
+
+    def test_evaluate_promise_records_notification_for_author(self):
+        promise = ValidPromiseFactory.create(created_by=self.user, results=[])
+
+        PromiseService(performed_by=self.admin).evaluate_promise(
+            id=promise.id, new_status=Promise.ReviewStatus.APPROVED
+        )
+
+        notification = ReviewNotification.objects.get()
+
+        self.assertEqual(notification.recipient, self.user)
+        self.assertEqual(notification.kind, ReviewNotification.Kind.PROMISE)
+        self.assertEqual(notification.review_status, Promise.ReviewStatus.APPROVED)
+        self.assertIsNone(notification.sent_at)
+
+    def test_evaluate_promise_with_longest_name_records_notification(self):
+        promise = ValidPromiseFactory.create(created_by=self.user, results=[])
+        Promise.objects.filter(id=promise.id).update(name="a" * 255)
+
+        PromiseService(performed_by=self.admin).evaluate_promise(
+            id=promise.id, new_status=Promise.ReviewStatus.APPROVED
+        )
+
+        self.assertEqual(ReviewNotification.objects.get().object_name, "a" * 255)
+
+    def test_evaluate_result_records_notification_for_author(self):
+        promise = ValidPromiseFactory.create(created_by=self.user)
+        Promise.objects.filter(id=promise.id).update(
+            review_status=Promise.ReviewStatus.APPROVED, review_date=timezone.now()
+        )
+        result = promise.results.first()
+        PromiseResult.objects.filter(id=result.id).update(created_by=self.user)
+
+        PromiseResultService(performed_by=self.admin).evaluate_result(
+            id=result.id, new_status=PromiseResult.ReviewStatus.REJECTED
+        )
+
+        notification = ReviewNotification.objects.get()
+
+        self.assertEqual(notification.kind, ReviewNotification.Kind.RESULT)
+        self.assertEqual(notification.object_id, result.id)
+
+    def test_evaluate_own_promise_does_not_record_notification(self):
+        promise = ValidPromiseFactory.create(created_by=self.admin, results=[])
+
+        PromiseService(performed_by=self.admin).evaluate_promise(
+            id=promise.id, new_status=Promise.ReviewStatus.APPROVED
+        )
+
+        self.assertFalse(ReviewNotification.objects.exists())
+
+    def test_send_digests_queues_one_email_per_user(self):
+        other_user = VerifiedUserFactory.create()
+        service = PromiseService(performed_by=self.admin)
+
+        for author in (self.user, self.user, other_user):
+            promise = ValidPromiseFactory.create(created_by=author, results=[])
+            service.evaluate_promise(id=promise.id, new_status=Promise.ReviewStatus.APPROVED)
+
+        sent = self.digest_service.send_digests()
+
+        self.assertEqual(sent, 3)
+        self.assertEqual(QueuedEmail.objects.filter(recipient=self.user.email).get().body.count("\n"), 1)
+        self.assertTrue(QueuedEmail.objects.filter(recipient=other_user.email).exists())
+        self.assertFalse(ReviewNotification.objects.filter(sent_at__isnull=True).exists())
+        self.assertEqual(self.digest_service.send_digests(), 0)
+
+    def test_send_digests_does_not_split_user_across_batches(self):
+        other_user = VerifiedUserFactory.create()
+        service = PromiseService(performed_by=self.admin)
+        first, second = sorted((self.user, other_user), key=lambda user: str(user.id))
+
+        for author in (first, second, second):
+            promise = ValidPromiseFactory.create(created_by=author, results=[])
+            service.evaluate_promise(id=promise.id, new_status=Promise.ReviewStatus.APPROVED)
+
+        self.assertEqual(self.digest_service.send_digests(batch_size=2), 1)
+        self.assertEqual(self.digest_service.send_digests(batch_size=2), 2)
+        self.assertEqual(QueuedEmail.objects.filter(recipient=second.email).get().body.count("\n"), 1)
+
+    def test_send_digests_skips_inactive_users(self):
+        inactive_user = VerifiedUserFactory.create(is_active=False)
+        promise = ValidPromiseFactory.create(created_by=inactive_user, results=[])
+
+        PromiseService(performed_by=self.admin).evaluate_promise(
+            id=promise.id, new_status=Promise.ReviewStatus.APPROVED
+        )
+
+        self.assertEqual(self.digest_service.send_digests(), 0)
+        self.assertFalse(QueuedEmail.objects.exists())
+
+    def test_send_digests_marks_notifications_of_deactivated_users_sent(self):
+        promise = ValidPromiseFactory.create(created_by=self.user, results=[])
+
+        PromiseService(performed_by=self.admin).evaluate_promise(
+            id=promise.id, new_status=Promise.ReviewStatus.APPROVED
+        )
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertEqual(self.digest_service.send_digests(), 1)
+        self.assertFalse(QueuedEmail.objects.exists())
+        self.assertFalse(ReviewNotification.objects.filter(sent_at__isnull=True).exists())
+
+    def test_evaluate_promise_of_deleted_author_does_not_record_notification(self):
+        promise = ValidPromiseFactory.create(created_by=self.user, results=[])
+        BaseUser.objects.filter(id=self.user.id).update(is_deleted=True)
+
+        PromiseService(performed_by=self.admin).evaluate_promise(
+            id=promise.id, new_status=Promise.ReviewStatus.APPROVED
+        )
+
+        self.assertFalse(ReviewNotification.objects.exists())
+
+    def test_send_digests_query_count_does_not_depend_on_user_count(self):
+        service = PromiseService(performed_by=self.admin)
+
+        for author in VerifiedUserFactory.create_batch(2):
+            promise = ValidPromiseFactory.create(created_by=author, results=[])
+            service.evaluate_promise(id=promise.id, new_status=Promise.ReviewStatus.APPROVED)
+
+        with CaptureQueriesContext(connection) as few_users:
+            self.digest_service.send_digests()
+
+        for author in VerifiedUserFactory.create_batch(10):
+            promise = ValidPromiseFactory.create(created_by=author, results=[])
+            service.evaluate_promise(id=promise.id, new_status=Promise.ReviewStatus.APPROVED)
+
+        with CaptureQueriesContext(connection) as many_users:
+            self.digest_service.send_digests()
+
+        self.assertEqual(len(few_users), len(many_users))
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.7 on 2026-10-18 23:19
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('promises', '0008_remove_promiseresult_promiseresult_final_status_consistency_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='promise',
+            name='claim_expires_at',
+            field=models.DateTimeField(blank=True, help_text='The date and time when the review claim expires.', null=True, verbose_name='Claim expires at'),
+        ),
+        migrations.AddField(
+            model_name='promise',
+            name='claimed_by',
+            field=models.ForeignKey(blank=True, help_text='The administrator who has claimed the promise for review.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='claimed_promises', to=settings.AUTH_USER_MODEL, verbose_name='Claimed by'),
+        ),
+        migrations.AddField(
+            model_name='promiseresult',
+            name='claim_expires_at',
+            field=models.DateTimeField(blank=True, help_text='The date and time when the review claim expires.', null=True, verbose_name='Claim expires at'),
+        ),
+        migrations.AddField(
+            model_name='promiseresult',
+            name='claimed_by',
+            field=models.ForeignKey(blank=True, help_text='The administrator who has claimed the promise result for review.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='claimed_promise_results', to=settings.AUTH_USER_MODEL, verbose_name='Claimed by'),
+        ),
+        migrations.AddIndex(
+            model_name='promise',
+            index=models.Index(condition=models.Q(('review_status', 'PENDING')), fields=['created_at'], name='promise_pending_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='promiseresult',
+            index=models.Index(condition=models.Q(('review_status', 'PENDING')), fields=['created_at'], name='result_pending_queue_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-19 01:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('promises', '0010_uuid7_ids'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='promise',
+            index=models.Index(fields=['review_status', 'date'], name='promise_status_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='promise',
+            index=models.Index(fields=['date'], name='promise_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='promiseresult',
+            index=models.Index(fields=['review_status', 'date'], name='result_status_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='promiseresult',
+            index=models.Index(fields=['promise', 'date'], name='result_promise_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='promiseresult',
+            index=models.Index(condition=models.Q(('is_final', True), ('review_status', 'APPROVED')), fields=['promise'], name='result_final_approved_idx'),
+        ),
+    ]
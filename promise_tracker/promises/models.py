@@ -101,9 +101,30 @@ class Promise(BaseModel):
         verbose_name=_("Reviewer"),
         help_text=_("The user who reviewed the promise."),
     )
+    claimed_by: Field = models.ForeignKey(
+        to=BaseUser,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="claimed_promises",
+        verbose_name=_("Claimed by"),
+        help_text=_("The administrator who has claimed the promise for review."),
+    )
+    claim_expires_at: Field = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name=_("Claim expires at"),
+        help_text=_("The date and time when the review claim expires."),
+    )
 
     @property
     def is_final(self) -> bool:
+        # Lists prefetch the approved final results (see prefetch_approved_final_results), single promises query them
+        prefetched = getattr(self, "approved_final_results", None)
+
+        if prefetched is not None:
+            return bool(prefetched)
+
         return self.results.filter(is_final=True, review_status=PromiseResult.ReviewStatus.APPROVED).exists()
 
     @property
@@ -124,6 +145,11 @@ class Promise(BaseModel):
 
     @property
     def final_result(self) -> PromiseResult.CompletionStatus | None:
+        prefetched = getattr(self, "approved_final_results", None)
+
+        if prefetched is not None:
+            return prefetched[0] if prefetched else None
+
         final_result_qs = self.results.filter(is_final=True, review_status=PromiseResult.ReviewStatus.APPROVED)
 
         if final_result_qs.exists():
@@ -146,6 +172,17 @@ class Promise(BaseModel):
             ),
         ]
 
+        indexes = [
+            models.Index(
+                fields=["created_at"],
+                condition=Q(review_status="PENDING"),
+                name="promise_pending_queue_idx",
+            ),
+            # The promise list orders by date, for guests and the pending filter within one review status
+            models.Index(fields=["review_status", "date"], name="promise_status_date_idx"),
+            models.Index(fields=["date"], name="promise_date_idx"),
+        ]
+
 
 class PromiseResult(BaseModel):
     class CompletionStatus(models.TextChoices):
@@ -242,6 +279,21 @@ class PromiseResult(BaseModel):
         verbose_name=_("Reviewer"),
         help_text=_("The user who reviewed the promise result."),
     )
+    claimed_by: Field = models.ForeignKey(
+        to=BaseUser,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="claimed_promise_results",
+        verbose_name=_("Claimed by"),
+        help_text=_("The administrator who has claimed the promise result for review."),
+    )
+    claim_expires_at: Field = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name=_("Claim expires at"),
+        help_text=_("The date and time when the review claim expires."),
+    )
 
     @property
     def is_reviewed(self) -> bool:
@@ -291,3 +343,20 @@ class PromiseResult(BaseModel):
         unique_together = [
             ("promise", "name"),
         ]
+
+        indexes = [
+            models.Index(
+                fields=["created_at"],
+                condition=Q(review_status="PENDING"),
+                name="result_pending_queue_idx",
+            ),
+            models.Index(fields=["review_status", "date"], name="result_status_date_idx"),
+            # The results of a promise are listed by date
+            models.Index(fields=["promise", "date"], name="result_promise_date_idx"),
+            # Final approved results are read by the analytics and Promise.is_final, they are a small share of all
+            models.Index(
+                fields=["promise"],
+                condition=Q(is_final=True, review_status="APPROVED"),
+                name="result_final_approved_idx",
+            ),
+        ]
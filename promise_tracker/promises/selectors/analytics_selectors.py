@@ -7,6 +7,7 @@ from django.utils.translation import gettext_lazy as _
 
 from promise_tracker.classifiers.models import PoliticalParty
 from promise_tracker.common.utils import get_object_or_raise
+from promise_tracker.core.tracing import traced
 from promise_tracker.promises.models import Promise, PromiseResult
 
 
@@ -39,6 +40,7 @@ class AnalyticsFilterSet(django_filters.FilterSet):
         fields = []
 
 
+@traced
 class AnalyticsSelectors:
     FIELD_INVALID = _("Field {field} is invalid!")
     PARTY_NOT_FOUND = _("Party does not exist!")
@@ -10,7 +10,9 @@ from rolepermissions.checkers import has_role
 from promise_tracker.common.utils import get_object_or_raise
 from promise_tracker.core.exceptions import ApplicationError, PermissionViolationError
 from promise_tracker.core.roles import Administrator, RegisteredUser
+from promise_tracker.core.tracing import traced
 from promise_tracker.promises.models import Promise, PromiseResult
+from promise_tracker.promises.selectors.promise_selectors import prefetch_approved_final_results
 from promise_tracker.users.models import BaseUser
 
 
@@ -47,6 +49,7 @@ class PromiseResultFilterSet(FilterSet):
         fields = []
 
 
+@traced
 class PromiseResultSelectors:
     def __init__(self, performed_by: BaseUser) -> None:
         self.performed_by = performed_by
@@ -104,7 +107,11 @@ class PromiseResultSelectors:
 
         qs = self._get_queryset_for_promise(result)
 
-        return qs.order_by("date")
+        return (
+            qs.select_related("promise", "created_by", "updated_by")
+            .prefetch_related(prefetch_approved_final_results("promise__results"))
+            .order_by("date")
+        )
 
     def get_promise_results_by_id(self, id: UUID) -> PromiseResult:
         result = get_object_or_raise(PromiseResult, self.NOT_FOUND_ERROR, id=id)
@@ -121,4 +128,9 @@ class PromiseResultSelectors:
 
         qs = self._get_all_promise_results(filters)
 
-        return PromiseResultFilterSet(filters, queryset=qs, performed_by=self.performed_by).qs.order_by("-date")
+        return (
+            PromiseResultFilterSet(filters, queryset=qs, performed_by=self.performed_by)
+            .qs.select_related("promise", "created_by", "updated_by")
+            .prefetch_related(prefetch_approved_final_results("promise__results"))
+            .order_by("-date")
+        )
@@ -1,7 +1,7 @@
 from uuid import UUID
 
 import django_filters
-from django.db.models import Q, QuerySet
+from django.db.models import Prefetch, Q, QuerySet
 from django.forms.widgets import CheckboxInput
 from django.http import HttpRequest
 from django.utils.translation import gettext_lazy as _
@@ -12,10 +12,20 @@ from promise_tracker.classifiers.models import Convocation, PoliticalParty
 from promise_tracker.common.utils import get_object_or_raise
 from promise_tracker.core.exceptions import ApplicationError, PermissionViolationError
 from promise_tracker.core.roles import Administrator, RegisteredUser
+from promise_tracker.core.tracing import traced
 from promise_tracker.promises.models import Promise, PromiseResult
 from promise_tracker.users.models import BaseUser
 
 
+def prefetch_approved_final_results(lookup: str = "results") -> Prefetch:
+    # Read by Promise.is_final and Promise.final_result, which otherwise run a query per listed promise
+    return Prefetch(
+        lookup,
+        queryset=PromiseResult.objects.filter(is_final=True, review_status=PromiseResult.ReviewStatus.APPROVED),
+        to_attr="approved_final_results",
+    )
+
+
 class PromiseFilterSet(FilterSet):
     name = django_filters.CharFilter(
         field_name="name",
@@ -57,9 +67,10 @@ class PromiseFilterSet(FilterSet):
 
     def filter_result_status(self, queryset: QuerySet[Promise], name: str, value: str) -> QuerySet[Promise]:
         if value:
+            # The only filter that joins the results, a promise could match through more than one of them
             return queryset.filter(
                 results__is_final=True, results__review_status=Promise.ReviewStatus.APPROVED, results__status=value
-            )
+            ).distinct()
         return queryset
 
     class Meta:
@@ -96,6 +107,7 @@ class PromiseAdminFilterSet(PromiseRegisteredUserFilterSet):
         return queryset
 
 
+@traced
 class PromiseSelectors:
     def __init__(self, request: HttpRequest, performed_by: BaseUser | None = None) -> None:
         self.performed_by = performed_by
@@ -143,7 +155,7 @@ class PromiseSelectors:
         else:
             return Promise.objects.filter(
                 Q(review_status=Promise.ReviewStatus.APPROVED) | Q(created_by=self.performed_by)
-            ).distinct()
+            )
 
     def get_filterset_class(self) -> type[FilterSet]:
         if has_role(self.performed_by, Administrator):
@@ -162,7 +174,12 @@ class PromiseSelectors:
         qs = self._get_queryset(filters)
         filterset_class = self.get_filterset_class()
 
-        return filterset_class(filters, request=self.request, queryset=qs).qs.distinct().order_by("-date")
+        return (
+            filterset_class(filters, request=self.request, queryset=qs)
+            .qs.select_related("party", "convocation", "created_by")
+            .prefetch_related(prefetch_approved_final_results())
+            .order_by("-date")
+        )
 
     def get_promise_by_id(self, id: UUID) -> Promise:
         promise = get_object_or_raise(Promise, self.NOT_FOUND_ERROR, id=id)
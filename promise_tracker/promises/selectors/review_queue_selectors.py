@@ -0,0 +1,40 @@
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from promise_tracker.core.tracing import traced
+from promise_tracker.promises.models import Promise, PromiseResult
+from promise_tracker.users.models import BaseUser
+
+
+@traced
+class ReviewQueueSelectors:
+    def __init__(self, performed_by: BaseUser) -> None:
+        self.performed_by = performed_by
+
+    def get_claimed_promises(self) -> QuerySet[Promise]:
+        return (
+            Promise.objects.filter(
+                review_status=Promise.ReviewStatus.PENDING,
+                claimed_by=self.performed_by,
+                claim_expires_at__gt=timezone.now(),
+            )
+            .select_related("party", "convocation", "created_by")
+            .order_by("created_at")
+        )
+
+    def get_claimed_results(self) -> QuerySet[PromiseResult]:
+        return (
+            PromiseResult.objects.filter(
+                review_status=PromiseResult.ReviewStatus.PENDING,
+                claimed_by=self.performed_by,
+                claim_expires_at__gt=timezone.now(),
+            )
+            .select_related("promise", "created_by")
+            .order_by("created_at")
+        )
+
+    def get_pending_counts(self) -> dict[str, int]:
+        return {
+            "promises": Promise.objects.filter(review_status=Promise.ReviewStatus.PENDING).count(),
+            "results": PromiseResult.objects.filter(review_status=PromiseResult.ReviewStatus.PENDING).count(),
+        }
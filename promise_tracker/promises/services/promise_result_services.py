@@ -1,7 +1,6 @@
 from datetime import date
 from uuid import UUID
 
-from django.db import transaction
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from loguru import logger
@@ -10,16 +9,26 @@ from rolepermissions.checkers import has_role
 from promise_tracker.common.services import BaseService
 from promise_tracker.common.utils import get_object_or_raise
 from promise_tracker.common.wrappers import handle_unique_error
+from promise_tracker.core.database import write_transaction
 from promise_tracker.core.exceptions import ApplicationError, PermissionViolationError
 from promise_tracker.core.roles import Administrator
+from promise_tracker.core.tracing import traced
+from promise_tracker.notifications.services import NotificationService
 from promise_tracker.promises.models import Promise, PromiseResult
 from promise_tracker.users.models import BaseUser
 
 
+@traced
 class PromiseResultService:
-    def __init__(self, performed_by: BaseUser, base_service: BaseService[PromiseResult] | None = None) -> None:
+    def __init__(
+        self,
+        performed_by: BaseUser,
+        base_service: BaseService[PromiseResult] | None = None,
+        notification_service: NotificationService | None = None,
+    ) -> None:
         self.performed_by = performed_by
         self.base_service: BaseService[PromiseResult] = base_service or BaseService()
+        self.notification_service = notification_service or NotificationService(performed_by=performed_by)
 
     NOT_FOUND_MESSAGE = _("Promise result not found.")
 
@@ -85,7 +94,7 @@ class PromiseResultService:
             raise ApplicationError(self.RESULT_EARLIER_THAN_PROMISE)
 
     @handle_unique_error(str(UNIQUE_CONSTRAINT_MESSAGE))
-    @transaction.atomic
+    @write_transaction()
     def create_result(
         self,
         name: str,
@@ -126,7 +135,7 @@ class PromiseResultService:
         return result
 
     @handle_unique_error(str(UNIQUE_CONSTRAINT_MESSAGE))
-    @transaction.atomic
+    @write_transaction()
     def edit_result(
         self,
         id: UUID,
@@ -169,7 +178,7 @@ class PromiseResultService:
         return result
 
     @handle_unique_error(str(UNIQUE_CONSTRAINT_MESSAGE))
-    @transaction.atomic
+    @write_transaction()
     def delete_result(self, id: UUID) -> None:
         result = get_object_or_raise(PromiseResult, self.NOT_FOUND_MESSAGE, id=id)
 
@@ -179,7 +188,7 @@ class PromiseResultService:
         self.base_service.delete_base(result)
 
     @handle_unique_error(str(UNIQUE_CONSTRAINT_MESSAGE))
-    @transaction.atomic
+    @write_transaction()
     def evaluate_result(self, id: UUID, new_status: PromiseResult.ReviewStatus) -> PromiseResult:
         result = get_object_or_raise(PromiseResult, self.NOT_FOUND_MESSAGE, id=id)
 
@@ -201,6 +210,8 @@ class PromiseResultService:
 
         result = self.base_service.edit_base(result, self.performed_by)
 
+        self.notification_service.record_result_review(result)
+
         logger.info(f"Evaluated promise result: {result.id} -> {result.review_status}")
 
         return result
@@ -1,7 +1,6 @@
 from datetime import date
 from uuid import UUID
 
-from django.db import transaction
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from loguru import logger
@@ -11,16 +10,26 @@ from promise_tracker.classifiers.models import Convocation, PoliticalParty
 from promise_tracker.common.services import BaseService
 from promise_tracker.common.utils import get_object_or_raise
 from promise_tracker.common.wrappers import handle_unique_error
+from promise_tracker.core.database import write_transaction
 from promise_tracker.core.exceptions import ApplicationError, PermissionViolationError
 from promise_tracker.core.roles import Administrator
+from promise_tracker.core.tracing import traced
+from promise_tracker.notifications.services import NotificationService
 from promise_tracker.promises.models import Promise, PromiseResult
 from promise_tracker.users.models import BaseUser
 
 
+@traced
 class PromiseService:
-    def __init__(self, performed_by: BaseUser, base_service: BaseService[Promise] | None = None) -> None:
+    def __init__(
+        self,
+        performed_by: BaseUser,
+        base_service: BaseService[Promise] | None = None,
+        notification_service: NotificationService | None = None,
+    ) -> None:
         self.performed_by = performed_by
         self.base_service: BaseService[Promise] = base_service or BaseService()
+        self.notification_service = notification_service or NotificationService(performed_by=performed_by)
 
     NOT_FOUND_MESSAGE = _("Promise not found.")
 
@@ -74,7 +83,7 @@ class PromiseService:
                 raise ApplicationError(self.LIQIDATED_DATE_EARLIER_THAN_PROMISE.format(name=party.name))
 
     @handle_unique_error(str(UNIQUE_CONSTRAINT_MESSAGE))
-    @transaction.atomic
+    @write_transaction()
     def create_promise(
         self,
         name: str,
@@ -110,7 +119,7 @@ class PromiseService:
         return promise
 
     @handle_unique_error(str(UNIQUE_CONSTRAINT_MESSAGE))
-    @transaction.atomic
+    @write_transaction()
     def edit_promise(
         self,
         id: UUID,
@@ -147,7 +156,7 @@ class PromiseService:
         return promise
 
     @handle_unique_error(str(UNIQUE_CONSTRAINT_MESSAGE))
-    @transaction.atomic
+    @write_transaction()
     def delete_promise(self, id: UUID) -> None:
         promise = get_object_or_raise(Promise, self.NOT_FOUND_MESSAGE, id=id)
 
@@ -162,7 +171,7 @@ class PromiseService:
         logger.info(f"Deleted promise: {promise.id}")
 
     @handle_unique_error(str(UNIQUE_CONSTRAINT_MESSAGE))
-    @transaction.atomic
+    @write_transaction()
     def evaluate_promise(self, id: UUID, new_status: Promise.ReviewStatus) -> Promise:
         promise = get_object_or_raise(Promise, self.NOT_FOUND_MESSAGE, id=id)
 
@@ -175,6 +184,8 @@ class PromiseService:
 
         promise = self.base_service.edit_base(promise, self.performed_by)
 
+        self.notification_service.record_promise_review(promise)
+
         logger.info(f"Evaluated promise: {promise.id} -> {promise.review_status}")
 
         return promise
@@ -0,0 +1,130 @@
+import datetime
+from uuid import UUID
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from loguru import logger
+
+from promise_tracker.core.database import write_transaction
+from promise_tracker.core.exceptions import ApplicationError
+from promise_tracker.core.tracing import traced
+from promise_tracker.promises.models import Promise, PromiseResult
+from promise_tracker.promises.services.promise_result_services import PromiseResultService
+from promise_tracker.promises.services.promise_services import PromiseService
+from promise_tracker.users.models import BaseUser
+
+ReviewableModel = type[Promise] | type[PromiseResult]
+
+
+@traced
+class ReviewQueueService:
+    def __init__(
+        self,
+        performed_by: BaseUser,
+        promise_service: PromiseService | None = None,
+        result_service: PromiseResultService | None = None,
+    ) -> None:
+        self.performed_by = performed_by
+        self.promise_service = promise_service or PromiseService(performed_by=performed_by)
+        self.result_service = result_service or PromiseResultService(performed_by=performed_by)
+
+    CLAIM_NOT_HELD = _("This item is not claimed by you or the claim has expired!")
+
+    def _get_lease_expiry(self, now: datetime.datetime) -> datetime.datetime:
+        return now + datetime.timedelta(minutes=settings.REVIEW_QUEUE_LEASE_MINUTES)
+
+    def _is_claimable(self, now: datetime.datetime) -> Q:
+        return Q(claim_expires_at__isnull=True) | Q(claim_expires_at__lte=now)
+
+    def _is_reviewable(self, model: ReviewableModel) -> Q:
+        # Results can only be evaluated once their promise is approved, claiming the others would block the batch
+        if model is PromiseResult:
+            return Q(promise__review_status=Promise.ReviewStatus.APPROVED)
+
+        return Q()
+
+    def _count_held_claims(self, model: ReviewableModel, now: datetime.datetime) -> int:
+        return model.objects.filter(
+            review_status=model.ReviewStatus.PENDING,
+            claimed_by=self.performed_by,
+            claim_expires_at__gt=now,
+        ).count()
+
+    def _claim(self, model: ReviewableModel, batch_size: int, now: datetime.datetime) -> int:
+        limit = batch_size - self._count_held_claims(model, now)
+
+        if limit <= 0:
+            return 0
+
+        candidates_qs = (
+            model.objects.filter(review_status=model.ReviewStatus.PENDING)
+            .filter(self._is_claimable(now), self._is_reviewable(model))
+            .order_by("created_at")
+        )
+
+        # Concurrent administrators skip each other's locked rows instead of waiting on them
+        if connection.features.has_select_for_update_skip_locked and connection.features.has_select_for_update_of:
+            candidates_qs = candidates_qs.select_for_update(skip_locked=True, of=("self",))
+
+        candidate_ids = list(candidates_qs.values_list("id", flat=True)[:limit])
+
+        # Re-checking the claimable condition keeps the update safe on backends without row locks
+        return (
+            model.objects.filter(id__in=candidate_ids, review_status=model.ReviewStatus.PENDING)
+            .filter(self._is_claimable(now))
+            .update(claimed_by=self.performed_by, claim_expires_at=self._get_lease_expiry(now))
+        )
+
+    def _ensure_holds_claim(self, model: ReviewableModel, id: UUID) -> None:
+        if not model.objects.filter(id=id, claimed_by=self.performed_by, claim_expires_at__gt=timezone.now()).exists():
+            raise ApplicationError(str(self.CLAIM_NOT_HELD))
+
+    def _clear_claim(self, model: ReviewableModel, id: UUID) -> None:
+        model.objects.filter(id=id).update(claimed_by=None, claim_expires_at=None)
+
+    @write_transaction()
+    def claim_next_batch(self, batch_size: int | None = None) -> int:
+        batch_size = batch_size or settings.REVIEW_QUEUE_BATCH_SIZE
+        now = timezone.now()
+
+        claimed = self._claim(Promise, batch_size, now) + self._claim(PromiseResult, batch_size, now)
+
+        logger.info(f"User {self.performed_by.id} claimed {claimed} items for review.")
+
+        return claimed
+
+    @write_transaction()
+    def release_claims(self) -> int:
+        released = 0
+
+        for model in (Promise, PromiseResult):
+            released += model.objects.filter(claimed_by=self.performed_by).update(
+                claimed_by=None, claim_expires_at=None
+            )
+
+        logger.info(f"User {self.performed_by.id} released {released} review claims.")
+
+        return released
+
+    @write_transaction()
+    def evaluate_promise(self, id: UUID, new_status: Promise.ReviewStatus) -> Promise:
+        self._ensure_holds_claim(Promise, id)
+
+        promise = self.promise_service.evaluate_promise(id=id, new_status=new_status)
+
+        self._clear_claim(Promise, id)
+
+        return promise
+
+    @write_transaction()
+    def evaluate_result(self, id: UUID, new_status: PromiseResult.ReviewStatus) -> PromiseResult:
+        self._ensure_holds_claim(PromiseResult, id)
+
+        result = self.result_service.evaluate_result(id=id, new_status=new_status)
+
+        self._clear_claim(PromiseResult, id)
+
+        return result
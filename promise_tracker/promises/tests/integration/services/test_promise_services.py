@@ -14,11 +14,13 @@ faker = Faker()
 class PromiseServicesIntegrationTests(TestCase):
     def setUp(self):
         self.mock_base_service = MagicMock()
+        self.mock_notification_service = MagicMock()
         self.performed_by = VerifiedUserFactory.create()
 
         self.service = PromiseService(
             performed_by=self.performed_by,
             base_service=self.mock_base_service,
+            notification_service=self.mock_notification_service,
         )
 
     def test_create_calls_base_when_promise_with_valid_data(self):
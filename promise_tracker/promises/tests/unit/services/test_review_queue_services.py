@@ -0,0 +1,128 @@
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from faker import Faker
+
+from promise_tracker.core.exceptions import ApplicationError
+from promise_tracker.promises.models import Promise, PromiseResult
+from promise_tracker.promises.selectors.review_queue_selectors import ReviewQueueSelectors
+from promise_tracker.promises.services.review_queue_services import ReviewQueueService
+from promise_tracker.promises.tests.factories import ValidPromiseFactory
+from promise_tracker.users.tests.factories import AdminUserFactory
+
+faker = Faker()
+
+
+@override_settings(REVIEW_QUEUE_BATCH_SIZE=2, REVIEW_QUEUE_LEASE_MINUTES=15)
+class ReviewQueueServicesUnitTests(TestCase):
+    def setUp(self):
+        self.admin = AdminUserFactory.create()
+        self.other_admin = AdminUserFactory.create()
+
+        self.service = ReviewQueueService(performed_by=self.admin)
+        self.other_service = ReviewQueueService(performed_by=self.other_admin)
+
+        self.promises = ValidPromiseFactory.create_batch(3, results=[])
+
+    def test_claim_returns_oldest_pending_promises_first(self):
+        claimed = self.service.claim_next_batch()
+
+        claimed_promises = list(ReviewQueueSelectors(performed_by=self.admin).get_claimed_promises())
+
+        self.assertEqual(claimed, 2)
+        self.assertListEqual([p.id for p in claimed_promises], [p.id for p in self.promises[:2]])
+
+    def test_claim_gives_disjoint_batches_to_different_admins(self):
+        self.service.claim_next_batch()
+        self.other_service.claim_next_batch()
+
+        mine = set(ReviewQueueSelectors(performed_by=self.admin).get_claimed_promises().values_list("id", flat=True))
+        theirs = set(
+            ReviewQueueSelectors(performed_by=self.other_admin).get_claimed_promises().values_list("id", flat=True)
+        )
+
+        self.assertEqual(len(mine), 2)
+        self.assertEqual(len(theirs), 1)
+        self.assertSetEqual(mine & theirs, set())
+
+    def test_claim_does_not_exceed_batch_size_when_claims_are_held(self):
+        self.service.claim_next_batch()
+
+        claimed = self.service.claim_next_batch()
+
+        self.assertEqual(claimed, 0)
+
+    def test_claim_takes_over_expired_claims(self):
+        Promise.objects.update(claimed_by=self.other_admin, claim_expires_at=timezone.now() - timedelta(minutes=1))
+
+        claimed = self.service.claim_next_batch()
+
+        self.assertEqual(claimed, 2)
+
+    def test_claim_skips_reviewed_promises(self):
+        Promise.objects.filter(id=self.promises[0].id).update(
+            review_status=Promise.ReviewStatus.APPROVED, review_date=timezone.now()
+        )
+
+        self.service.claim_next_batch()
+
+        claimed_ids = ReviewQueueSelectors(performed_by=self.admin).get_claimed_promises().values_list("id", flat=True)
+
+        self.assertNotIn(self.promises[0].id, claimed_ids)
+
+    def test_release_claims_frees_items(self):
+        self.service.claim_next_batch()
+
+        self.service.release_claims()
+
+        self.assertFalse(Promise.objects.filter(claimed_by=self.admin).exists())
+
+    def test_evaluate_promise_raises_when_claim_not_held(self):
+        self.other_service.claim_next_batch()
+
+        with self.assertRaisesMessage(ApplicationError, str(self.service.CLAIM_NOT_HELD)):
+            self.service.evaluate_promise(id=self.promises[0].id, new_status=Promise.ReviewStatus.APPROVED)
+
+    def test_evaluate_promise_raises_when_claim_expired(self):
+        self.service.claim_next_batch()
+        Promise.objects.update(claim_expires_at=timezone.now() - timedelta(minutes=1))
+
+        with self.assertRaisesMessage(ApplicationError, str(self.service.CLAIM_NOT_HELD)):
+            self.service.evaluate_promise(id=self.promises[0].id, new_status=Promise.ReviewStatus.APPROVED)
+
+    def test_evaluate_promise_approves_and_clears_claim(self):
+        self.service.claim_next_batch()
+
+        self.service.evaluate_promise(id=self.promises[0].id, new_status=Promise.ReviewStatus.APPROVED)
+
+        promise = Promise.objects.get(id=self.promises[0].id)
+
+        self.assertEqual(promise.review_status, Promise.ReviewStatus.APPROVED)
+        self.assertEqual(promise.reviewer, self.admin)
+        self.assertIsNone(promise.claimed_by)
+        self.assertIsNone(promise.claim_expires_at)
+
+    def test_evaluate_result_rejects_claimed_result(self):
+        promise = ValidPromiseFactory.create(results=None)
+        Promise.objects.filter(id=promise.id).update(
+            review_status=Promise.ReviewStatus.APPROVED, review_date=timezone.now()
+        )
+
+        self.service.claim_next_batch()
+
+        result = ReviewQueueSelectors(performed_by=self.admin).get_claimed_results().first()
+
+        self.service.evaluate_result(id=result.id, new_status=PromiseResult.ReviewStatus.REJECTED)
+
+        result.refresh_from_db()
+
+        self.assertEqual(result.review_status, PromiseResult.ReviewStatus.REJECTED)
+        self.assertIsNone(result.claimed_by)
+
+    def test_claim_skips_results_of_unapproved_promises(self):
+        ValidPromiseFactory.create(results=None)
+
+        self.service.claim_next_batch()
+
+        self.assertFalse(ReviewQueueSelectors(performed_by=self.admin).get_claimed_results().exists())
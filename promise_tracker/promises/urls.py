@@ -19,6 +19,15 @@ from promise_tracker.promises.views.promises_views import (
     PromiseListView,
     PromiseRejectView,
 )
+from promise_tracker.promises.views.review_queue_views import (
+    ReviewQueueClaimView,
+    ReviewQueuePromiseApproveView,
+    ReviewQueuePromiseRejectView,
+    ReviewQueueReleaseView,
+    ReviewQueueResultApproveView,
+    ReviewQueueResultRejectView,
+    ReviewQueueView,
+)
 
 app_name = "promises"
 
@@ -46,6 +55,16 @@ promise_analytics_urlpatterns = [
     path("", AnalyticsView.as_view(), name="analytics"),
 ]
 
+review_queue_urlpatterns = [
+    path("", ReviewQueueView.as_view(), name="queue"),
+    path("claim/", ReviewQueueClaimView.as_view(), name="claim"),
+    path("release/", ReviewQueueReleaseView.as_view(), name="release"),
+    path("promises/<uuid:id>/approve/", ReviewQueuePromiseApproveView.as_view(), name="approve_promise"),
+    path("promises/<uuid:id>/reject/", ReviewQueuePromiseRejectView.as_view(), name="reject_promise"),
+    path("results/<uuid:id>/approve/", ReviewQueueResultApproveView.as_view(), name="approve_result"),
+    path("results/<uuid:id>/reject/", ReviewQueueResultRejectView.as_view(), name="reject_result"),
+]
+
 urlpatterns = [
     path(
         "promises/",
@@ -59,4 +78,8 @@ urlpatterns = [
         "analytics/",
         include((promise_analytics_urlpatterns, "promise_analytics"), namespace="promise_analytics"),
     ),
+    path(
+        "reviews/",
+        include((review_queue_urlpatterns, "review_queue"), namespace="review_queue"),
+    ),
 ]
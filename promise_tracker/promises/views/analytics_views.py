@@ -4,12 +4,14 @@ from django.views import View
 
 from promise_tracker.common.mixins import (
     HandleErrorsMixin,
+    NonAtomicReadMixin,
+    SessionFreeMixin,
 )
 from promise_tracker.common.utils import bootstrapify_form, is_htmx_request, paginate_queryset, prepare_get_params
 from promise_tracker.promises.selectors.analytics_selectors import AnalyticsFilterSet, AnalyticsSelectors
 
 
-class AnalyticsView(HandleErrorsMixin, View):
+class AnalyticsView(NonAtomicReadMixin, SessionFreeMixin, HandleErrorsMixin, View):
     template_name = "promises/analytics/analytics.html"
 
     def get(self, request, *args, **kwargs):
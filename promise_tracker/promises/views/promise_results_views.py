@@ -6,6 +6,7 @@ from django.views import View
 
 from promise_tracker.common.mixins import (
     HandleErrorsMixin,
+    NonAtomicReadMixin,
     RoleBasedAccessMixin,
     VerifiedLoginRequiredMixin,
 )
@@ -72,7 +73,9 @@ class PromiseResultEditView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, Ba
         return redirect("promises:promises:details", id=kwargs["promise_id"])
 
 
-class PromiseResultListView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View):
+class PromiseResultListView(
+    NonAtomicReadMixin, VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View
+):
     template_name = "promises/results/list.html"
     required_roles = [Administrator]
 
@@ -95,7 +98,9 @@ class PromiseResultListView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, Ha
         return render(request, self.template_name, context)
 
 
-class PromiseResultMineListView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View):
+class PromiseResultMineListView(
+    NonAtomicReadMixin, VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View
+):
     template_name = "promises/results/list.html"
     required_roles = [RegisteredUser]
 
@@ -6,7 +6,9 @@ from django.views import View
 
 from promise_tracker.common.mixins import (
     HandleErrorsMixin,
+    NonAtomicReadMixin,
     RoleBasedAccessMixin,
+    SessionFreeMixin,
     VerifiedLoginRequiredMixin,
 )
 from promise_tracker.common.utils import bootstrapify_form, is_htmx_request, paginate_queryset, prepare_get_params
@@ -71,7 +73,7 @@ class PromiseEditView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, BaseForm
         return redirect("promises:promises:details", id=promise.id)
 
 
-class PromiseDetailView(RoleBasedAccessMixin, HandleErrorsMixin, View):
+class PromiseDetailView(NonAtomicReadMixin, SessionFreeMixin, RoleBasedAccessMixin, HandleErrorsMixin, View):
     template_name = "promises/promises/details.html"
     required_roles = [Administrator, RegisteredUser]
 
@@ -99,7 +101,7 @@ class PromiseDetailView(RoleBasedAccessMixin, HandleErrorsMixin, View):
         return render(request, self.template_name, context)
 
 
-class PromiseListView(HandleErrorsMixin, View):
+class PromiseListView(NonAtomicReadMixin, SessionFreeMixin, HandleErrorsMixin, View):
     template_name = "promises/promises/list.html"
 
     def get(self, request, *args, **kwargs):
@@ -0,0 +1,109 @@
+from django.contrib import messages
+from django.shortcuts import redirect, render
+from django.utils.translation import gettext_lazy as _
+from django.views import View
+
+from promise_tracker.common.mixins import (
+    HandleErrorsMixin,
+    NonAtomicReadMixin,
+    RoleBasedAccessMixin,
+    VerifiedLoginRequiredMixin,
+)
+from promise_tracker.core.roles import Administrator
+from promise_tracker.promises.models import Promise, PromiseResult
+from promise_tracker.promises.selectors.review_queue_selectors import ReviewQueueSelectors
+from promise_tracker.promises.services.review_queue_services import ReviewQueueService
+
+
+class ReviewQueueView(NonAtomicReadMixin, VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View):
+    template_name = "promises/reviews/queue.html"
+    required_roles = [Administrator]
+
+    def get(self, request, *args, **kwargs):
+        selectors = ReviewQueueSelectors(performed_by=request.user)
+
+        context = {
+            "promises": selectors.get_claimed_promises(),
+            "results": selectors.get_claimed_results(),
+            "pending_counts": selectors.get_pending_counts(),
+        }
+
+        return render(request, self.template_name, context)
+
+
+class ReviewQueueClaimView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View):
+    required_roles = [Administrator]
+    success_message = _("{count} items have been claimed for review!")
+
+    def post(self, request, *args, **kwargs):
+        service = ReviewQueueService(performed_by=request.user)
+        claimed = service.claim_next_batch()
+
+        messages.success(request, self.success_message.format(count=claimed))
+
+        return redirect("promises:review_queue:queue")
+
+
+class ReviewQueueReleaseView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View):
+    required_roles = [Administrator]
+    success_message = _("Review claims have been released!")
+
+    def post(self, request, *args, **kwargs):
+        service = ReviewQueueService(performed_by=request.user)
+        service.release_claims()
+
+        messages.success(request, self.success_message)
+
+        return redirect("promises:review_queue:queue")
+
+
+class ReviewQueuePromiseApproveView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View):
+    required_roles = [Administrator]
+    success_message = _("Promise has been successfully approved!")
+
+    def post(self, request, *args, **kwargs):
+        service = ReviewQueueService(performed_by=request.user)
+        service.evaluate_promise(id=kwargs["id"], new_status=Promise.ReviewStatus.APPROVED)
+
+        messages.success(request, self.success_message)
+
+        return redirect("promises:review_queue:queue")
+
+
+class ReviewQueuePromiseRejectView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View):
+    required_roles = [Administrator]
+    success_message = _("Promise has been successfully rejected!")
+
+    def post(self, request, *args, **kwargs):
+        service = ReviewQueueService(performed_by=request.user)
+        service.evaluate_promise(id=kwargs["id"], new_status=Promise.ReviewStatus.REJECTED)
+
+        messages.success(request, self.success_message)
+
+        return redirect("promises:review_queue:queue")
+
+
+class ReviewQueueResultApproveView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View):
+    required_roles = [Administrator]
+    success_message = _("Promise result has been successfully approved!")
+
+    def post(self, request, *args, **kwargs):
+        service = ReviewQueueService(performed_by=request.user)
+        service.evaluate_result(id=kwargs["id"], new_status=PromiseResult.ReviewStatus.APPROVED)
+
+        messages.success(request, self.success_message)
+
+        return redirect("promises:review_queue:queue")
+
+
+class ReviewQueueResultRejectView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View):
+    required_roles = [Administrator]
+    success_message = _("Promise result has been successfully rejected!")
+
+    def post(self, request, *args, **kwargs):
+        service = ReviewQueueService(performed_by=request.user)
+        service.evaluate_result(id=kwargs["id"], new_status=PromiseResult.ReviewStatus.REJECTED)
+
+        messages.success(request, self.success_message)
+
+        return redirect("promises:review_queue:queue")
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.7 on 2026-10-18 23:23
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxMessage',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, help_text='The unique identifier for the record.', primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True, help_text='The date and time when the record was created.', verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='The date and time when the record was last updated.', verbose_name='Updated At')),
+                ('task_name', models.CharField(help_text='The name of the Celery task to publish.', max_length=255, verbose_name='Task name')),
+                ('args', models.JSONField(blank=True, default=list, help_text='The positional arguments of the task.', verbose_name='Arguments')),
+                ('kwargs', models.JSONField(blank=True, default=dict, help_text='The keyword arguments of the task.', verbose_name='Keyword arguments')),
+                ('attempts', models.PositiveIntegerField(default=0, help_text='The number of failed attempts to publish the task.', verbose_name='Attempts')),
+                ('last_error', models.TextField(blank=True, help_text='The error raised by the last failed publish attempt.', null=True, verbose_name='Last error')),
+                ('processed_at', models.DateTimeField(blank=True, help_text='The date and time when the task was published to the broker.', null=True, verbose_name='Processed at')),
+                ('created_by', models.ForeignKey(blank=True, help_text='The user who created the record.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('updated_by', models.ForeignKey(blank=True, help_text='The user who last updated the record.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated', to=settings.AUTH_USER_MODEL, verbose_name='Updated By')),
+            ],
+            options={
+                'verbose_name': 'Outbox message',
+                'verbose_name_plural': 'Outbox messages',
+                'indexes': [models.Index(condition=models.Q(('processed_at__isnull', True)), fields=['created_at'], name='outbox_pending_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-19 00:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tasks', '0002_uuid7_ids'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='outboxmessage',
+            name='headers',
+            field=models.JSONField(blank=True, default=dict, help_text='The message headers of the task, such as the trace context of the request that enqueued it.', verbose_name='Headers'),
+        ),
+    ]
@@ -1,5 +1,11 @@
 from celery import Task
 from django.conf import settings
+from django.db import models
+from django.db.models import Q
+from django.db.models.fields import Field
+from django.utils.translation import gettext_lazy as _
+
+from promise_tracker.common.models import BaseModel
 
 
 class BaseTask(Task):
@@ -7,3 +13,63 @@ class BaseTask(Task):
     default_retry_delay = settings.CELERY_TASK_DEFAULT_RETRY_DELAY
     time_limit = settings.CELERY_TASK_TIME_LIMIT
     soft_time_limit = settings.CELERY_TASK_SOFT_TIME_LIMIT
+
+
+class OutboxMessage(BaseModel):
+    task_name: Field = models.CharField(
+        max_length=255,
+        null=False,
+        blank=False,
+        verbose_name=_("Task name"),
+        help_text=_("The name of the Celery task to publish."),
+    )
+    args: Field = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name=_("Arguments"),
+        help_text=_("The positional arguments of the task."),
+    )
+    kwargs: Field = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name=_("Keyword arguments"),
+        help_text=_("The keyword arguments of the task."),
+    )
+    headers: Field = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name=_("Headers"),
+        help_text=_("The message headers of the task, such as the trace context of the request that enqueued it."),
+    )
+    attempts: Field = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Attempts"),
+        help_text=_("The number of failed attempts to publish the task."),
+    )
+    last_error: Field = models.TextField(
+        null=True,
+        blank=True,
+        verbose_name=_("Last error"),
+        help_text=_("The error raised by the last failed publish attempt."),
+    )
+    processed_at: Field = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name=_("Processed at"),
+        help_text=_("The date and time when the task was published to the broker."),
+    )
+
+    def __str__(self) -> str:
+        return f"{self.task_name} ({self.id})"
+
+    class Meta:
+        verbose_name = _("Outbox message")
+        verbose_name_plural = _("Outbox messages")
+
+        indexes = [
+            models.Index(
+                fields=["created_at"],
+                condition=Q(processed_at__isnull=True),
+                name="outbox_pending_idx",
+            ),
+        ]
@@ -0,0 +1,111 @@
+import datetime
+from contextlib import nullcontext
+from typing import Any
+
+from celery import Task
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+from loguru import logger
+
+from promise_tracker.core.database import write_transaction
+from promise_tracker.core.tracing import TRACEPARENT_HEADER, get_current_traceparent, traced
+from promise_tracker.tasks.celery import app as celery_app
+from promise_tracker.tasks.models import OutboxMessage
+
+
+@traced
+class OutboxService:
+    def _get_headers(self) -> dict:
+        # The task is published later by the relay, so the trace context of the caller is stored with the message
+        traceparent = get_current_traceparent()
+
+        return {TRACEPARENT_HEADER: traceparent} if traceparent else {}
+
+    def enqueue(self, task: Task, *args: Any, **kwargs: Any) -> OutboxMessage:
+        message = OutboxMessage.objects.create(
+            task_name=task.name, args=list(args), kwargs=kwargs, headers=self._get_headers()
+        )
+
+        logger.debug(f"Enqueued outbox message {message.id} for task {task.name}")
+
+        return message
+
+
+@traced
+class OutboxRelayService:
+    def _get_producer(self):
+        # Eagerly executed tasks (tests) never reach the broker, so no connection is needed
+        if celery_app.conf.task_always_eager:
+            return nullcontext(None)
+
+        return celery_app.producer_or_acquire()
+
+    def _get_pending_messages(self, batch_size: int) -> list[OutboxMessage]:
+        qs = OutboxMessage.objects.filter(
+            processed_at__isnull=True,
+            attempts__lt=settings.OUTBOX_MAX_ATTEMPTS,
+        ).order_by("created_at")
+
+        if connection.features.has_select_for_update_skip_locked:
+            qs = qs.select_for_update(skip_locked=True)
+
+        return list(qs[:batch_size])
+
+    def _publish(self, message: OutboxMessage, producer) -> None:
+        task = celery_app.tasks[message.task_name]
+        task.apply_async(args=message.args, kwargs=message.kwargs, headers=message.headers, producer=producer)
+
+    @write_transaction()
+    def relay_batch(self, batch_size: int | None = None) -> int:
+        batch_size = batch_size or settings.OUTBOX_RELAY_BATCH_SIZE
+        messages = self._get_pending_messages(batch_size)
+
+        if not messages:
+            return 0
+
+        published = 0
+        now = timezone.now()
+
+        with self._get_producer() as producer:
+            for message in messages:
+                try:
+                    self._publish(message, producer)
+                except Exception as exc:
+                    logger.warning(f"Failed to publish outbox message {message.id}: {exc}")
+
+                    message.attempts += 1
+                    message.last_error = str(exc)
+                    continue
+
+                message.processed_at = now
+                published += 1
+
+        OutboxMessage.objects.bulk_update(messages, ["processed_at", "attempts", "last_error"])
+
+        logger.info(f"Relayed {published} of {len(messages)} outbox messages.")
+
+        return published
+
+    def relay_pending(self, batch_size: int | None = None) -> int:
+        batch_size = batch_size or settings.OUTBOX_RELAY_BATCH_SIZE
+        total = 0
+
+        # Keep draining only while full batches are published, a failing broker stops the run early
+        while (relayed := self.relay_batch(batch_size)) > 0:
+            total += relayed
+
+            if relayed < batch_size:
+                break
+
+        return total
+
+    def purge_processed(self, older_than_days: int | None = None) -> int:
+        older_than_days = older_than_days or settings.OUTBOX_RETENTION_DAYS
+        threshold = timezone.now() - datetime.timedelta(days=older_than_days)
+
+        deleted, _ = OutboxMessage.objects.filter(processed_at__lt=threshold).delete()
+
+        logger.info(f"Purged {deleted} processed outbox messages.")
+
+        return deleted
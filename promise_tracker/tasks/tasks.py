@@ -0,0 +1,23 @@
+from celery import shared_task
+from loguru import logger
+
+from promise_tracker.tasks.models import BaseTask
+from promise_tracker.tasks.services import OutboxRelayService
+
+
+@shared_task(bind=True, base=BaseTask, name="relay_outbox_task")
+def relay_outbox_task(self) -> None:
+    logger.info(f"Starting task {self.name} (id: {self.request.id})")
+
+    OutboxRelayService().relay_pending()
+
+    logger.info(f"Completed task {self.name} (id: {self.request.id})")
+
+
+@shared_task(bind=True, base=BaseTask, name="purge_outbox_task")
+def purge_outbox_task(self) -> None:
+    logger.info(f"Starting task {self.name} (id: {self.request.id})")
+
+    OutboxRelayService().purge_processed()
+
+    logger.info(f"Completed task {self.name} (id: {self.request.id})")
@@ -0,0 +1,74 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core import mail
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from promise_tracker.emails.models import QueuedEmail
+from promise_tracker.emails.services import EmailService
+from promise_tracker.emails.tasks import email_send_batch_task
+from promise_tracker.tasks.models import OutboxMessage
+from promise_tracker.tasks.services import OutboxRelayService, OutboxService
+from promise_tracker.users.tasks import process_user_moderation_job_task
+
+
+@override_settings(OUTBOX_MAX_ATTEMPTS=2)
+class OutboxServicesIntegrationTests(TestCase):
+    def setUp(self) -> None:
+        self.service = OutboxService()
+        self.relay_service = OutboxRelayService()
+
+    def test_enqueue_stores_task_name_and_arguments(self):
+        message = self.service.enqueue(process_user_moderation_job_task, "job-id")
+
+        self.assertEqual(message.task_name, process_user_moderation_job_task.name)
+        self.assertListEqual(message.args, ["job-id"])
+        self.assertIsNone(message.processed_at)
+
+    def test_relay_batch_publishes_and_marks_processed(self):
+        EmailService().queue_verification_email("user@example.com", "123456")
+        self.service.enqueue(email_send_batch_task)
+
+        relayed = self.relay_service.relay_batch()
+
+        self.assertEqual(relayed, 1)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertFalse(QueuedEmail.objects.exists())
+        self.assertFalse(OutboxMessage.objects.filter(processed_at__isnull=True).exists())
+
+    def test_relay_pending_drains_in_batches(self):
+        for _ in range(5):
+            self.service.enqueue(email_send_batch_task)
+
+        relayed = self.relay_service.relay_pending(batch_size=2)
+
+        self.assertEqual(relayed, 5)
+        self.assertFalse(OutboxMessage.objects.filter(processed_at__isnull=True).exists())
+
+    def test_relay_batch_records_failure_and_gives_up_after_max_attempts(self):
+        EmailService().queue_verification_email("user@example.com", "123456")
+        self.service.enqueue(email_send_batch_task)
+
+        with patch.object(OutboxRelayService, "_publish", side_effect=RuntimeError("broker down")):
+            self.assertEqual(self.relay_service.relay_batch(), 0)
+            self.assertEqual(self.relay_service.relay_batch(), 0)
+
+        message = OutboxMessage.objects.get()
+
+        self.assertEqual(message.attempts, 2)
+        self.assertEqual(message.last_error, "broker down")
+        self.assertEqual(self.relay_service.relay_batch(), 0)
+        self.assertTrue(QueuedEmail.objects.exists())
+
+    def test_purge_processed_deletes_old_messages(self):
+        old = self.service.enqueue(email_send_batch_task)
+        recent = self.service.enqueue(email_send_batch_task)
+
+        OutboxMessage.objects.filter(id=old.id).update(processed_at=timezone.now() - timedelta(days=30))
+        OutboxMessage.objects.filter(id=recent.id).update(processed_at=timezone.now())
+
+        deleted = self.relay_service.purge_processed(older_than_days=7)
+
+        self.assertEqual(deleted, 1)
+        self.assertTrue(OutboxMessage.objects.filter(id=recent.id).exists())
@@ -4,3 +4,4 @@ from enum import Enum
 class ModerationAction(Enum):
     BAN = "ban"
     UNBAN = "unban"
+    ANONYMIZE = "anonymize"
@@ -1,9 +1,11 @@
+from uuid import UUID
+
 from django import forms
 from django.utils.translation import gettext_lazy as _
 
 from promise_tracker.common.forms import FIELD_INVALID, FIELD_REQUIRED
 from promise_tracker.common.utils import generate_model_form_errors
-from promise_tracker.users.models import BaseUser
+from promise_tracker.users.models import BaseUser, UserModerationJob
 
 
 class UserCreateForm(forms.ModelForm):
@@ -63,3 +65,21 @@ class UserVerifyForm(forms.Form):
             "max_length": FIELD_INVALID.format(field=_("Verification code")),
         },
     )
+
+
+class UserBulkModerationForm(forms.Form):
+    action = forms.ChoiceField(
+        choices=UserModerationJob.Action.choices,
+        label=_("Action"),
+    )
+    # The checkboxes live in the users table, so the ids arrive as a plain list of values
+    user_ids = forms.Field(
+        widget=forms.MultipleHiddenInput,
+        error_messages={"required": _("No users have been selected.")},
+    )
+
+    def clean_user_ids(self) -> list[UUID]:
+        try:
+            return [UUID(str(value)) for value in self.cleaned_data["user_ids"]]
+        except ValueError:
+            raise forms.ValidationError(FIELD_INVALID.format(field=_("Users")))
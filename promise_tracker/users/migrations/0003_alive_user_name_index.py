@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-19 00:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0002_uuid7_ids'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='baseuser',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['name', 'surname'], name='user_alive_name_idx'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.7 on 2026-10-19 00:27
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0003_alive_user_name_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='baseuser',
+            name='search_email',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Lower('email'), output_field=models.CharField(max_length=255)),
+        ),
+        migrations.AddField(
+            model_name='baseuser',
+            name='search_name',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Lower(django.db.models.functions.text.Concat('name', models.Value(' '), 'surname')), output_field=models.CharField(max_length=511)),
+        ),
+        migrations.AddField(
+            model_name='baseuser',
+            name='search_surname',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Lower(django.db.models.functions.text.Concat('surname', models.Value(' '), 'name')), output_field=models.CharField(max_length=511)),
+        ),
+        migrations.AddField(
+            model_name='baseuser',
+            name='search_username',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Lower('username'), output_field=models.CharField(max_length=255)),
+        ),
+        migrations.AddIndex(
+            model_name='baseuser',
+            index=models.Index(fields=['search_name'], name='user_search_name_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='baseuser',
+            index=models.Index(fields=['search_surname'], name='user_search_surname_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='baseuser',
+            index=models.Index(fields=['search_email'], name='user_search_email_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='baseuser',
+            index=models.Index(fields=['search_username'], name='user_search_username_idx', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
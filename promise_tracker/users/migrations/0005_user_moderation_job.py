@@ -0,0 +1,37 @@
+# Generated by Django 5.2.7 on 2026-10-19 00:32
+
+import django.db.models.deletion
+import promise_tracker.common.uuids
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_user_search_columns'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserModerationJob',
+            fields=[
+                ('id', models.UUIDField(default=promise_tracker.common.uuids.uuid7, editable=False, help_text='The unique identifier for the record.', primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, db_index=True, help_text='The date and time when the record was created.', verbose_name='Created At')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='The date and time when the record was last updated.', verbose_name='Updated At')),
+                ('action', models.CharField(choices=[('ban', 'Block'), ('unban', 'Unblock'), ('anonymize', 'Delete')], help_text='The moderation action applied to the users.', max_length=20, verbose_name='Action')),
+                ('status', models.CharField(choices=[('PENDING', 'Queued'), ('RUNNING', 'Running'), ('COMPLETED', 'Finished'), ('FAILED', 'Failed')], default='PENDING', help_text='The processing status of the job.', max_length=20, verbose_name='Status')),
+                ('user_ids', models.JSONField(default=list, help_text='The identifiers of the users to moderate.', verbose_name='User IDs')),
+                ('processed_count', models.PositiveIntegerField(default=0, help_text='The number of users processed so far.', verbose_name='Processed')),
+                ('changed_count', models.PositiveIntegerField(default=0, help_text='The number of users changed by the job, the rest were skipped.', verbose_name='Changed')),
+                ('last_error', models.TextField(blank=True, help_text='The error raised by the last failed attempt.', null=True, verbose_name='Last error')),
+                ('finished_at', models.DateTimeField(blank=True, help_text='The date and time when the job finished.', null=True, verbose_name='Finished at')),
+                ('created_by', models.ForeignKey(blank=True, help_text='The user who created the record.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('updated_by', models.ForeignKey(blank=True, help_text='The user who last updated the record.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated', to=settings.AUTH_USER_MODEL, verbose_name='Updated By')),
+            ],
+            options={
+                'verbose_name': 'User moderation job',
+                'verbose_name_plural': 'User moderation jobs',
+            },
+        ),
+    ]
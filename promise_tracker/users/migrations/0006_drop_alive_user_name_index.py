@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-19 02:35
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0005_user_moderation_job'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='baseuser',
+            name='user_alive_name_idx',
+        ),
+    ]
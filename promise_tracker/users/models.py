@@ -5,11 +5,14 @@ from datetime import datetime
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
 from django.contrib.auth.models import BaseUserManager as BUM
 from django.db import models
+from django.db.models import Value
 from django.db.models.fields import Field
+from django.db.models.functions import Concat, Lower
 from django.utils.translation import gettext_lazy as _
 
 from promise_tracker.common.models import BaseModel, SoftDeleteModel
 from promise_tracker.common.validators import CustomEmailValidator
+from promise_tracker.users.enums import ModerationAction
 
 
 class BaseUserManager(BUM):
@@ -62,6 +65,13 @@ class BaseUserManager(BUM):
         return user
 
 
+# Soft-deleted users are anonymized and only kept for the records they authored, so they are left out unless
+# explicitly requested through BaseUser.all_with_deleted
+class AliveUserManager(BaseUserManager):
+    def get_queryset(self):
+        return super().get_queryset().filter(is_deleted=False)
+
+
 class BaseUser(SoftDeleteModel, BaseModel, AbstractBaseUser, PermissionsMixin):
     name: Field = models.CharField(
         max_length=255, null=False, blank=False, verbose_name=_("Name"), help_text=_("The name of the user.")
@@ -136,11 +146,34 @@ class BaseUser(SoftDeleteModel, BaseModel, AbstractBaseUser, PermissionsMixin):
         blank=False,
     )
 
+    # Lowercase copies kept by the database, so the admin user search can run indexed prefix lookups
+    search_name: Field = models.GeneratedField(
+        expression=Lower(Concat("name", Value(" "), "surname")),
+        output_field=models.CharField(max_length=511),
+        db_persist=True,
+    )
+    search_surname: Field = models.GeneratedField(
+        expression=Lower(Concat("surname", Value(" "), "name")),
+        output_field=models.CharField(max_length=511),
+        db_persist=True,
+    )
+    search_email: Field = models.GeneratedField(
+        expression=Lower("email"),
+        output_field=models.CharField(max_length=255),
+        db_persist=True,
+    )
+    search_username: Field = models.GeneratedField(
+        expression=Lower("username"),
+        output_field=models.CharField(max_length=255),
+        db_persist=True,
+    )
+
     USERNAME_FIELD = "email"
     EMAIL_FIELD = "email"
     REQUIRED_FIELDS = ["username", "name", "surname", "password"]
 
-    objects = BaseUserManager()
+    objects = AliveUserManager()
+    all_with_deleted = BaseUserManager()
 
     def set_verification_code(self, code: str, expires_at: datetime) -> None:
         self.verification_code = code
@@ -155,3 +188,88 @@ class BaseUser(SoftDeleteModel, BaseModel, AbstractBaseUser, PermissionsMixin):
     class Meta:
         verbose_name = _("User")
         verbose_name_plural = _("Users")
+        indexes = [
+            # The pattern operator classes let PostgreSQL serve LIKE prefix lookups, other backends ignore them
+            models.Index(fields=["search_name"], opclasses=["varchar_pattern_ops"], name="user_search_name_idx"),
+            models.Index(fields=["search_surname"], opclasses=["varchar_pattern_ops"], name="user_search_surname_idx"),
+            models.Index(fields=["search_email"], opclasses=["varchar_pattern_ops"], name="user_search_email_idx"),
+            models.Index(
+                fields=["search_username"], opclasses=["varchar_pattern_ops"], name="user_search_username_idx"
+            ),
+        ]
+
+
+class UserModerationJob(BaseModel):
+    class Action(models.TextChoices):
+        BAN = ModerationAction.BAN.value, _("Block")
+        UNBAN = ModerationAction.UNBAN.value, _("Unblock")
+        ANONYMIZE = ModerationAction.ANONYMIZE.value, _("Delete")
+
+    class Status(models.TextChoices):
+        PENDING = "PENDING", _("Queued")
+        RUNNING = "RUNNING", _("Running")
+        COMPLETED = "COMPLETED", _("Finished")
+        FAILED = "FAILED", _("Failed")
+
+    action: Field = models.CharField(
+        max_length=20,
+        choices=Action.choices,
+        verbose_name=_("Action"),
+        help_text=_("The moderation action applied to the users."),
+    )
+    status: Field = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name=_("Status"),
+        help_text=_("The processing status of the job."),
+    )
+    user_ids: Field = models.JSONField(
+        default=list,
+        verbose_name=_("User IDs"),
+        help_text=_("The identifiers of the users to moderate."),
+    )
+    processed_count: Field = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Processed"),
+        help_text=_("The number of users processed so far."),
+    )
+    changed_count: Field = models.PositiveIntegerField(
+        default=0,
+        verbose_name=_("Changed"),
+        help_text=_("The number of users changed by the job, the rest were skipped."),
+    )
+    last_error: Field = models.TextField(
+        null=True,
+        blank=True,
+        verbose_name=_("Last error"),
+        help_text=_("The error raised by the last failed attempt."),
+    )
+    finished_at: Field = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name=_("Finished at"),
+        help_text=_("The date and time when the job finished."),
+    )
+
+    @property
+    def total_count(self) -> int:
+        return len(self.user_ids)
+
+    @property
+    def progress_percent(self) -> int:
+        if not self.user_ids:
+            return 100
+
+        return self.processed_count * 100 // self.total_count
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (self.Status.COMPLETED, self.Status.FAILED)
+
+    def __str__(self) -> str:
+        return f"{self.action} ({self.id})"
+
+    class Meta:
+        verbose_name = _("User moderation job")
+        verbose_name_plural = _("User moderation jobs")
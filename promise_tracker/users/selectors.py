@@ -1,6 +1,10 @@
+import operator
+from functools import reduce
 from uuid import UUID
 
-from django.db.models import QuerySet
+import django_filters
+from django.db.models import Case, IntegerField, Q, QuerySet, Value, When
+from django.db.models.functions import Concat, Lower
 from django.utils.translation import gettext_lazy as _
 from django_filters import FilterSet
 from rolepermissions.checkers import has_role
@@ -8,17 +12,59 @@ from rolepermissions.checkers import has_role
 from promise_tracker.common.utils import get_object_or_none
 from promise_tracker.core.exceptions import NotFoundError, PermissionViolationError
 from promise_tracker.core.roles import Administrator
-from promise_tracker.users.models import BaseUser
+from promise_tracker.core.tracing import traced
+from promise_tracker.users.models import BaseUser, UserModerationJob
+
+# Sorts after every other character, so "column >= term AND column < term + PREFIX_UPPER_BOUND" selects the values
+# starting with term through an index range scan
+PREFIX_UPPER_BOUND = chr(0x10FFFF)
+
+# Ranked from the best match, searched columns are listed in BaseUser
+SEARCH_PREFIX_COLUMNS = ("search_email", "search_name", "search_surname", "search_username")
 
 
 class UserFilterSet(FilterSet):
+    search = django_filters.CharFilter(
+        label=_("Search"),
+        help_text=_("Start of the email, name, surname or username"),
+        method="filter_search",
+    )
+
+    def _starts_with(self, column: str, term: Lower) -> Q:
+        # The range keeps the lookup on the index on SQLite, the prefix match does the same on PostgreSQL
+        return Q(
+            **{
+                f"{column}__gte": term,
+                f"{column}__lt": Concat(term, Value(PREFIX_UPPER_BOUND)),
+                f"{column}__startswith": term,
+            }
+        )
+
+    def filter_search(self, queryset: QuerySet[BaseUser], name: str, value: str) -> QuerySet[BaseUser]:
+        value = value.strip()
+
+        if not value:
+            return queryset
+
+        # Lowered by the database, so the term is normalized the same way as the search columns
+        term = Lower(Value(value))
+        matches = [self._starts_with(column, term) for column in SEARCH_PREFIX_COLUMNS]
+
+        rank = Case(
+            When(search_email=term, then=Value(0)),
+            *[When(match, then=Value(rank)) for rank, match in enumerate(matches, start=1)],
+            output_field=IntegerField(),
+        )
+
+        return (
+            queryset.filter(reduce(operator.or_, matches))
+            .annotate(search_rank=rank)
+            .order_by("search_rank", "search_name")
+        )
+
     class Meta:
         model = BaseUser
         fields = {
-            "name": ["icontains"],
-            "surname": ["icontains"],
-            "email": ["icontains"],
-            "username": ["icontains"],
             "is_verified": ["exact"],
             "is_active": ["exact"],
             "is_deleted": ["exact"],
@@ -26,6 +72,7 @@ class UserFilterSet(FilterSet):
         }
 
 
+@traced
 class UserSelectors:
     def __init__(self, performed_by: BaseUser):
         self.performed_by = performed_by
@@ -33,7 +80,11 @@ class UserSelectors:
     NOT_FOUND_ERROR = _("User not found.")
 
     def get_user_by_id(self, id: UUID) -> BaseUser:
-        user = get_object_or_none(BaseUser, id=id)
+        # Administrators can still open deleted users, everyone else only sees live accounts
+        if has_role(self.performed_by, Administrator):
+            user = BaseUser.all_with_deleted.filter(id=id).first()
+        else:
+            user = get_object_or_none(BaseUser, id=id)
 
         if user is None:
             raise NotFoundError(self.NOT_FOUND_ERROR)
@@ -42,14 +93,34 @@ class UserSelectors:
             if self.performed_by.id != user.id or not user.is_active:
                 raise PermissionViolationError()
 
-            if user.is_deleted:
-                raise NotFoundError(self.NOT_FOUND_ERROR)
-
         return user
 
     def get_users(self, filters: dict | None = None) -> QuerySet[BaseUser]:
         filters = filters or {}
 
-        qs = BaseUser.objects.all()
+        # Deleted users are only listed when they are filtered for explicitly
+        if UserFilterSet.base_filters["is_deleted"].field.to_python(filters.get("is_deleted")):
+            qs = BaseUser.all_with_deleted.all()
+        else:
+            qs = BaseUser.objects.all()
+
+        qs = UserFilterSet(data=filters, queryset=qs).qs
+
+        # Searches are ordered by match quality
+        if not qs.ordered:
+            qs = qs.order_by("-created_at")
+
+        return qs
+
+    MODERATION_JOB_NOT_FOUND_ERROR = _("Moderation job not found.")
+
+    def get_moderation_job_by_id(self, id: UUID) -> UserModerationJob:
+        if not has_role(self.performed_by, Administrator):
+            raise PermissionViolationError()
+
+        job = get_object_or_none(UserModerationJob, id=id)
+
+        if job is None:
+            raise NotFoundError(self.MODERATION_JOB_NOT_FOUND_ERROR)
 
-        return UserFilterSet(data=filters, queryset=qs).qs.order_by("-created_at")
+        return job
@@ -5,7 +5,6 @@ from uuid import UUID
 from django.conf import settings
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
-from django.db import transaction
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from loguru import logger
@@ -19,27 +18,32 @@ from promise_tracker.common.utils import (
     get_object_or_raise,
 )
 from promise_tracker.common.wrappers import handle_unique_error
-from promise_tracker.core.exceptions import ApplicationError, EmailDelayError, NotFoundError, PermissionViolationError
+from promise_tracker.core.database import write_transaction
+from promise_tracker.core.exceptions import ApplicationError, EmailDelayError, PermissionViolationError
 from promise_tracker.core.roles import Administrator, RegisteredUser
-from promise_tracker.emails.tasks import email_send_task
+from promise_tracker.core.tracing import traced
+from promise_tracker.emails.services import EmailService
+from promise_tracker.tasks.services import OutboxService
 
 from .enums import ModerationAction
-from .models import BaseUser
+from .models import BaseUser, UserModerationJob
 
 
+@traced
 class UserService:
     def __init__(
         self,
         performed_by: BaseUser,
         base_service: BaseService[BaseUser] | None = None,
+        email_service: EmailService | None = None,
     ) -> None:
         self.performed_by = performed_by
         self.base_service: BaseService[BaseUser] = base_service or BaseService()
+        self.email_service = email_service or EmailService()
 
     NOT_FOUND_MESSAGE = _("User not found.")
     UNIQUE_CONSTRAINT_MESSAGE = _("A user with this email already exists.")
     PASSWORDS_DONT_MATCH = _("Passwords do not match.")
-    USER_NOT_FOUND = _("User not found.")
     USER_IS_ALREADY_VERIFIED = _("User is already verified.")
     VERIFICATION_FAILED = _("Verification failed! Invalid code!")
     USER_IS_ALREADY_BANNED = _("User is already banned.")
@@ -67,7 +71,8 @@ class UserService:
 
         user.verification_email_sent_at = timezone.now()
 
-        email_send_task.delay(user.email, verification_code)
+        # Queued in the surrounding transaction, so a rolled back user leaves no email behind
+        self.email_service.queue_verification_email(user.email, verification_code)
 
     def _assign_role(self, user: BaseUser, is_admin: bool) -> None:
         if is_admin:
@@ -88,11 +93,6 @@ class UserService:
                 logger.error(f"User {self.performed_by.id} attempted to edit user {user.id} without permission.")
                 raise PermissionViolationError()
 
-    def _check_user_is_not_deleted(self, user: BaseUser) -> None:
-        if user.is_deleted:
-            logger.error(f"Attempted operation on deleted user ID {user.id}.")
-            raise NotFoundError(self.USER_NOT_FOUND)
-
     def _check_can_edit_inactive(self, user: BaseUser) -> None:
         if not has_role(self.performed_by, Administrator):
             if not user.is_active:
@@ -115,12 +115,6 @@ class UserService:
             logger.error("Password and confirmation password do not match.")
             raise ApplicationError(self.PASSWORDS_DONT_MATCH)
 
-    def _anonymize_user_data(self, user: BaseUser) -> None:
-        user.name = generate_randon_string(10)
-        user.surname = generate_randon_string(10)
-        user.username = generate_randon_string(10)
-        user.email = generate_random_email()
-
     def _check_email_sending_delay(self, user) -> None:
         last_email_time = user.verification_email_sent_at
 
@@ -138,7 +132,7 @@ class UserService:
             raise ApplicationError(self.USER_IS_ALREADY_VERIFIED)
 
     @handle_unique_error(str(UNIQUE_CONSTRAINT_MESSAGE))
-    @transaction.atomic
+    @write_transaction()
     def create_user(
         self, name: str, surname: str, email: str, username: str, password: str, another_password: str, is_admin: bool
     ) -> BaseUser:
@@ -161,7 +155,7 @@ class UserService:
         return user
 
     @handle_unique_error(str(UNIQUE_CONSTRAINT_MESSAGE))
-    @transaction.atomic
+    @write_transaction()
     def edit_user(
         self,
         id: UUID,
@@ -179,7 +173,6 @@ class UserService:
         user = get_object_or_raise(BaseUser, self.NOT_FOUND_MESSAGE, id=id)
 
         self._check_is_owner_or_admin(user)
-        self._check_user_is_not_deleted(user)
         self._check_can_edit_inactive(user)
 
         logger.debug(f"Editing user ID {user.id} with email: {email}, username: {username}, is_admin: {is_admin}")
@@ -205,18 +198,24 @@ class UserService:
 
         return user
 
+    # Only replaces the personal data on the instance, saving it is left to the caller
+    def anonymize_user_data(self, user: BaseUser) -> None:
+        user.name = generate_randon_string(10)
+        user.surname = generate_randon_string(10)
+        user.username = generate_randon_string(10)
+        user.email = generate_random_email()
+
     @handle_unique_error(str(UNIQUE_CONSTRAINT_MESSAGE))
-    @transaction.atomic
+    @write_transaction()
     def delete_user(self, id: UUID) -> None:
         user = get_object_or_raise(BaseUser, self.NOT_FOUND_MESSAGE, id=id)
 
         self._check_is_owner_or_admin(user)
-        self._check_user_is_not_deleted(user)
         self._check_can_edit_inactive(user)
 
         logger.debug(f"Soft-deleting user: {user.id}")
 
-        self._anonymize_user_data(user)
+        self.anonymize_user_data(user)
 
         user.is_deleted = True
 
@@ -225,12 +224,11 @@ class UserService:
         logger.info(f"Soft-deleted user: {user.id}")
 
     @handle_unique_error(str(UNIQUE_CONSTRAINT_MESSAGE))
-    @transaction.atomic
+    @write_transaction()
     def send_verification_email(self, id: UUID) -> None:
         user = get_object_or_raise(BaseUser, self.NOT_FOUND_MESSAGE, id=id)
 
         self._check_is_owner_or_admin(user)
-        self._check_user_is_not_deleted(user)
         self._check_can_edit_inactive(user)
         self._check_email_sending_delay(user)
         self._check_is_already_verified(user)
@@ -244,12 +242,11 @@ class UserService:
         logger.info(f"Resent verification email to user ID {user.id}")
 
     @handle_unique_error(str(UNIQUE_CONSTRAINT_MESSAGE))
-    @transaction.atomic
+    @write_transaction()
     def verify_user_email(self, id: UUID, verification_code: str) -> None:
         user = get_object_or_raise(BaseUser, self.NOT_FOUND_MESSAGE, id=id)
 
         self._check_is_owner_or_admin(user)
-        self._check_user_is_not_deleted(user)
         self._check_can_edit_inactive(user)
         self._check_is_already_verified(user)
 
@@ -271,12 +268,10 @@ class UserService:
         logger.info(f"Verified user: {user.id}")
 
     @handle_unique_error(str(UNIQUE_CONSTRAINT_MESSAGE))
-    @transaction.atomic
+    @write_transaction()
     def moderate_user(self, id: UUID, action: ModerationAction) -> None:
         user = get_object_or_raise(BaseUser, self.NOT_FOUND_MESSAGE, id=id)
 
-        self._check_user_is_not_deleted(user)
-
         if action == ModerationAction.BAN and not user.is_active:
             logger.error(f"Attempted to ban already inactive user ID {user.id}.")
             raise ApplicationError(self.USER_IS_ALREADY_BANNED)
@@ -295,3 +290,150 @@ class UserService:
         self.base_service.edit_base(user, self.performed_by)
 
         logger.info(f"Moderation action '{action.value}' performed on user: {user.id}.")
+
+
+@traced
+class UserBulkModerationService:
+    def __init__(
+        self,
+        performed_by: BaseUser,
+        user_service: UserService | None = None,
+        outbox_service: OutboxService | None = None,
+    ) -> None:
+        self.performed_by = performed_by
+        self.user_service = user_service or UserService(performed_by=performed_by)
+        self.outbox_service = outbox_service or OutboxService()
+
+    NO_USERS_SELECTED = _("No users have been selected.")
+    TOO_MANY_USERS_SELECTED = _("At most {max_users} users can be moderated at once.")
+    JOB_CREATOR_MISSING = _("The administrator who started the job no longer exists.")
+
+    def _check_is_admin(self) -> None:
+        if not has_role(self.performed_by, Administrator):
+            logger.error(f"User {self.performed_by.id} attempted bulk moderation without permission.")
+            raise PermissionViolationError()
+
+    def _get_users(self, ids: list[UUID], **filters) -> list[BaseUser]:
+        # Deleted users are left out by the default manager, administrators never moderate themselves in bulk
+        return list(BaseUser.objects.filter(id__in=ids, **filters).exclude(id=self.performed_by.id))
+
+    def _bulk_update(self, users: list[BaseUser], fields: list[str]) -> int:
+        now = timezone.now()
+
+        for user in users:
+            user.updated_by = self.performed_by
+            user.updated_at = now
+
+        BaseUser.objects.bulk_update(users, fields=[*fields, "updated_by", "updated_at"])
+
+        return len(users)
+
+    @write_transaction()
+    def bulk_ban(self, ids: list[UUID]) -> int:
+        self._check_is_admin()
+
+        users = self._get_users(ids, is_active=True)
+
+        for user in users:
+            user.is_active = False
+
+        return self._bulk_update(users, fields=["is_active"])
+
+    @write_transaction()
+    def bulk_unban(self, ids: list[UUID]) -> int:
+        self._check_is_admin()
+
+        users = self._get_users(ids, is_active=False)
+
+        for user in users:
+            user.is_active = True
+
+        return self._bulk_update(users, fields=["is_active"])
+
+    @handle_unique_error(str(UserService.UNIQUE_CONSTRAINT_MESSAGE))
+    @write_transaction()
+    def bulk_anonymize(self, ids: list[UUID]) -> int:
+        self._check_is_admin()
+
+        users = self._get_users(ids)
+
+        for user in users:
+            self.user_service.anonymize_user_data(user)
+            user.is_deleted = True
+
+        return self._bulk_update(users, fields=["name", "surname", "username", "email", "is_deleted"])
+
+    def _apply(self, action: ModerationAction, ids: list[UUID]) -> int:
+        match action:
+            case ModerationAction.BAN:
+                return self.bulk_ban(ids)
+
+            case ModerationAction.UNBAN:
+                return self.bulk_unban(ids)
+
+            case ModerationAction.ANONYMIZE:
+                return self.bulk_anonymize(ids)
+
+    @write_transaction()
+    def start_job(self, ids: list[UUID], action: ModerationAction) -> UserModerationJob:
+        from promise_tracker.users.tasks import process_user_moderation_job_task
+
+        self._check_is_admin()
+
+        user_ids = list(dict.fromkeys(str(id) for id in ids))
+
+        if not user_ids:
+            raise ApplicationError(str(self.NO_USERS_SELECTED))
+
+        if len(user_ids) > settings.USER_MODERATION_JOB_MAX_USERS:
+            raise ApplicationError(
+                self.TOO_MANY_USERS_SELECTED.format(max_users=settings.USER_MODERATION_JOB_MAX_USERS)
+            )
+
+        job = UserModerationJob.objects.create(
+            action=action.value,
+            user_ids=user_ids,
+            created_by=self.performed_by,
+            updated_by=self.performed_by,
+        )
+
+        self.outbox_service.enqueue(process_user_moderation_job_task, str(job.id))
+
+        logger.info(f"User {self.performed_by.id} started moderation job {job.id} for {len(user_ids)} users.")
+
+        return job
+
+    def process_job(self, job: UserModerationJob) -> UserModerationJob:
+        self._check_is_admin()
+
+        action = ModerationAction(job.action)
+        chunk_size = settings.USER_MODERATION_CHUNK_SIZE
+
+        job.status = UserModerationJob.Status.RUNNING
+        job.save(update_fields=["status", "updated_at"])
+
+        # Every chunk is committed with its progress, so a retried job resumes after the last finished chunk
+        while job.processed_count < job.total_count:
+            chunk = job.user_ids[job.processed_count : job.processed_count + chunk_size]
+
+            with write_transaction():
+                job.changed_count += self._apply(action, chunk)
+                job.processed_count += len(chunk)
+                job.save(update_fields=["processed_count", "changed_count", "updated_at"])
+
+            logger.debug(f"Moderation job {job.id} processed {job.processed_count}/{job.total_count} users.")
+
+        job.status = UserModerationJob.Status.COMPLETED
+        job.finished_at = timezone.now()
+        job.save(update_fields=["status", "finished_at", "updated_at"])
+
+        logger.info(f"Moderation job {job.id} changed {job.changed_count} of {job.total_count} users.")
+
+        return job
+
+    @staticmethod
+    def mark_job_failed(job: UserModerationJob, error: Exception | str) -> None:
+        job.status = UserModerationJob.Status.FAILED
+        job.last_error = str(error)
+        job.finished_at = timezone.now()
+        job.save(update_fields=["status", "last_error", "finished_at", "updated_at"])
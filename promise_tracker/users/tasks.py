@@ -0,0 +1,45 @@
+from celery import shared_task
+from django.conf import settings
+from loguru import logger
+
+from promise_tracker.tasks.models import BaseTask
+from promise_tracker.users.models import UserModerationJob
+from promise_tracker.users.services import UserBulkModerationService
+
+
+# Hitting the soft limit retries the job, which resumes after the last committed chunk
+@shared_task(
+    bind=True,
+    base=BaseTask,
+    name="process_user_moderation_job_task",
+    soft_time_limit=settings.USER_MODERATION_JOB_SOFT_TIME_LIMIT,
+    time_limit=settings.USER_MODERATION_JOB_TIME_LIMIT,
+)
+def process_user_moderation_job_task(self, job_id: str) -> None:
+    logger.info(f"Starting task {self.name} (id: {self.request.id})")
+
+    job = UserModerationJob.objects.select_related("created_by").get(id=job_id)
+
+    if job.is_finished:
+        logger.info(f"Moderation job {job.id} has already finished, skipping")
+        return
+
+    if job.created_by is None:
+        logger.error(f"Moderation job {job.id} has no creator, marking it failed")
+        UserBulkModerationService.mark_job_failed(job, str(UserBulkModerationService.JOB_CREATOR_MISSING))
+        return
+
+    bulk_moderation_service = UserBulkModerationService(performed_by=job.created_by)
+
+    try:
+        bulk_moderation_service.process_job(job)
+    except Exception as exc:
+        logger.warning(f"Exception occurred while processing moderation job {job.id}: {exc}")
+
+        if self.request.retries >= self.max_retries:
+            bulk_moderation_service.mark_job_failed(job, exc)
+            raise
+
+        self.retry(exc=exc)
+
+    logger.info(f"Completed task {self.name} (id: {self.request.id})")
@@ -0,0 +1,150 @@
+from django.test import TestCase, override_settings
+
+from promise_tracker.core.exceptions import ApplicationError, PermissionViolationError
+from promise_tracker.tasks.models import OutboxMessage
+from promise_tracker.users.enums import ModerationAction
+from promise_tracker.users.models import BaseUser, UserModerationJob
+from promise_tracker.users.services import UserBulkModerationService
+from promise_tracker.users.tasks import process_user_moderation_job_task
+from promise_tracker.users.tests.factories import AdminUserFactory, VerifiedUserFactory
+
+
+class UserBulkModerationServicesIntegrationTests(TestCase):
+    def setUp(self):
+        self.admin = AdminUserFactory.create()
+        self.service = UserBulkModerationService(performed_by=self.admin)
+
+    def test_bulk_ban_only_changes_active_users(self):
+        active_user = VerifiedUserFactory.create()
+        inactive_user = VerifiedUserFactory.create(is_active=False)
+        deleted_user = VerifiedUserFactory.create(is_deleted=True)
+
+        changed_count = self.service.bulk_ban([active_user.id, inactive_user.id, deleted_user.id, self.admin.id])
+
+        self.assertEqual(changed_count, 1)
+        active_user.refresh_from_db()
+        self.assertFalse(active_user.is_active)
+        self.assertEqual(active_user.updated_by, self.admin)
+        self.admin.refresh_from_db()
+        self.assertTrue(self.admin.is_active)
+
+    def test_bulk_unban_only_changes_inactive_users(self):
+        active_user = VerifiedUserFactory.create()
+        inactive_user = VerifiedUserFactory.create(is_active=False)
+
+        changed_count = self.service.bulk_unban([active_user.id, inactive_user.id])
+
+        self.assertEqual(changed_count, 1)
+        inactive_user.refresh_from_db()
+        self.assertTrue(inactive_user.is_active)
+
+    def test_bulk_anonymize_soft_deletes_users(self):
+        user = VerifiedUserFactory.create()
+
+        changed_count = self.service.bulk_anonymize([user.id])
+
+        self.assertEqual(changed_count, 1)
+        anonymized_user = BaseUser.all_with_deleted.get(id=user.id)
+        self.assertTrue(anonymized_user.is_deleted)
+        self.assertNotEqual(anonymized_user.email, user.email)
+        self.assertNotEqual(anonymized_user.name, user.name)
+
+    def test_bulk_moderation_requires_admin(self):
+        user = VerifiedUserFactory.create()
+        service = UserBulkModerationService(performed_by=VerifiedUserFactory.create())
+
+        with self.assertRaises(PermissionViolationError):
+            service.bulk_ban([user.id])
+
+        with self.assertRaises(PermissionViolationError):
+            service.start_job([user.id], ModerationAction.BAN)
+
+    def test_start_job_deduplicates_users_and_enqueues_task(self):
+        user = VerifiedUserFactory.create()
+
+        job = self.service.start_job([user.id, user.id], ModerationAction.BAN)
+
+        self.assertListEqual(job.user_ids, [str(user.id)])
+        self.assertEqual(job.status, UserModerationJob.Status.PENDING)
+        self.assertEqual(job.created_by, self.admin)
+
+        message = OutboxMessage.objects.get()
+        self.assertEqual(message.task_name, process_user_moderation_job_task.name)
+        self.assertListEqual(message.args, [str(job.id)])
+
+    def test_start_job_rejects_empty_selection(self):
+        with self.assertRaisesMessage(ApplicationError, str(self.service.NO_USERS_SELECTED)):
+            self.service.start_job([], ModerationAction.BAN)
+
+    @override_settings(USER_MODERATION_JOB_MAX_USERS=1)
+    def test_start_job_rejects_too_many_users(self):
+        users = VerifiedUserFactory.create_batch(2)
+
+        with self.assertRaises(ApplicationError):
+            self.service.start_job([user.id for user in users], ModerationAction.BAN)
+
+        self.assertFalse(UserModerationJob.objects.exists())
+
+    @override_settings(USER_MODERATION_CHUNK_SIZE=2)
+    def test_process_job_moderates_users_in_chunks(self):
+        users = VerifiedUserFactory.create_batch(5)
+        users[0].is_active = False
+        users[0].save()
+        job = self.service.start_job([user.id for user in users], ModerationAction.BAN)
+
+        # Every chunk loads and updates its users with one statement each, whatever the chunk size
+        with self.assertNumQueries(27):
+            self.service.process_job(job)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, UserModerationJob.Status.COMPLETED)
+        self.assertEqual(job.processed_count, 5)
+        self.assertEqual(job.changed_count, 4)
+        self.assertEqual(job.progress_percent, 100)
+        self.assertIsNotNone(job.finished_at)
+        self.assertFalse(BaseUser.objects.filter(id__in=[user.id for user in users], is_active=True).exists())
+
+    @override_settings(USER_MODERATION_CHUNK_SIZE=2)
+    def test_process_job_resumes_after_processed_users(self):
+        users = VerifiedUserFactory.create_batch(3)
+        job = self.service.start_job([user.id for user in users], ModerationAction.BAN)
+        job.processed_count = 2
+        job.save()
+
+        self.service.process_job(job)
+
+        self.assertEqual(job.changed_count, 1)
+        self.assertEqual(BaseUser.objects.filter(id__in=[users[0].id, users[1].id], is_active=True).count(), 2)
+        self.assertFalse(BaseUser.objects.get(id=users[2].id).is_active)
+
+    def test_task_processes_pending_job(self):
+        user = VerifiedUserFactory.create()
+        job = self.service.start_job([user.id], ModerationAction.UNBAN)
+
+        process_user_moderation_job_task(str(job.id))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, UserModerationJob.Status.COMPLETED)
+        self.assertEqual(job.changed_count, 0)
+
+    def test_task_fails_job_without_creator(self):
+        user = VerifiedUserFactory.create()
+        job = self.service.start_job([user.id], ModerationAction.BAN)
+        UserModerationJob.objects.filter(id=job.id).update(created_by=None)
+
+        process_user_moderation_job_task(str(job.id))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, UserModerationJob.Status.FAILED)
+        self.assertEqual(job.last_error, str(UserBulkModerationService.JOB_CREATOR_MISSING))
+        self.assertTrue(BaseUser.objects.get(id=user.id).is_active)
+
+    def test_mark_job_failed_records_error(self):
+        job = self.service.start_job([VerifiedUserFactory.create().id], ModerationAction.BAN)
+
+        self.service.mark_job_failed(job, RuntimeError("boom"))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, UserModerationJob.Status.FAILED)
+        self.assertEqual(job.last_error, "boom")
+        self.assertTrue(job.is_finished)
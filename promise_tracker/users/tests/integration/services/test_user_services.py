@@ -4,6 +4,8 @@ from django.test import TestCase
 from django.utils import timezone
 from faker import Faker
 
+from promise_tracker.core.exceptions import ApplicationError
+from promise_tracker.emails.models import QueuedEmail
 from promise_tracker.users.enums import ModerationAction
 from promise_tracker.users.models import BaseUser
 from promise_tracker.users.services import UserService
@@ -25,8 +27,8 @@ class UserServicesIntegrationTests(TestCase):
             performed_by=AdminUserFactory.create(),
         )
 
-    @patch("promise_tracker.users.services.email_send_task.delay")
-    def test_create_calls_email_send_task(self, mock_email_send_task):
+    @patch("promise_tracker.users.services.EmailService.queue_verification_email")
+    def test_create_queues_verification_email(self, mock_queue_verification_email):
         new_user = UnverifiedUserFactory.build()
 
         self.mocked_service.create_user(
@@ -39,7 +41,24 @@ class UserServicesIntegrationTests(TestCase):
             is_admin=new_user.is_admin,
         )
 
-        mock_email_send_task.assert_called_once()
+        mock_queue_verification_email.assert_called_once()
+
+    def test_create_discards_verification_email_when_transaction_rolls_back(self):
+        existing_user = UnverifiedUserFactory.create()
+        new_user = UnverifiedUserFactory.build()
+
+        with self.assertRaisesMessage(ApplicationError, str(self.service.UNIQUE_CONSTRAINT_MESSAGE)):
+            self.service.create_user(
+                name=new_user.name,
+                surname=new_user.surname,
+                email=existing_user.email,
+                username=new_user.username,
+                password=new_user.password,
+                another_password=new_user.password,
+                is_admin=new_user.is_admin,
+            )
+
+        self.assertFalse(QueuedEmail.objects.exists())
 
     def test_create_calls_base_service_create(self):
         new_user = UnverifiedUserFactory.build()
@@ -56,8 +75,8 @@ class UserServicesIntegrationTests(TestCase):
 
         self.mock_base_service.create_base.assert_called_once()
 
-    @patch("promise_tracker.users.services.email_send_task.delay")
-    def test_update_calls_email_send_task_on_email_change(self, mock_email_send_task):
+    @patch("promise_tracker.users.services.EmailService.queue_verification_email")
+    def test_update_queues_verification_email_on_email_change(self, mock_queue_verification_email):
         user = UnverifiedUserFactory.create()
         new_email = faker.unique.email()
 
@@ -70,7 +89,7 @@ class UserServicesIntegrationTests(TestCase):
             is_admin=user.is_admin,
         )
 
-        mock_email_send_task.assert_called_once()
+        mock_queue_verification_email.assert_called_once()
 
     def test_update_calls_base_service_update(self):
         user = UnverifiedUserFactory.create()
@@ -87,13 +106,13 @@ class UserServicesIntegrationTests(TestCase):
 
         self.mock_base_service.edit_base.assert_called_once()
 
-    @patch("promise_tracker.users.services.email_send_task.delay")
-    def test_send_verification_email_sends_email(self, mock_email_send_task):
+    @patch("promise_tracker.users.services.EmailService.queue_verification_email")
+    def test_send_verification_email_queues_email(self, mock_queue_verification_email):
         user = UnverifiedUserFactory.create()
 
         self.service.send_verification_email(id=user.id)
 
-        mock_email_send_task.assert_called_once()
+        mock_queue_verification_email.assert_called_once()
 
     def test_send_verification_email_calls_base_service(self):
         user = UnverifiedUserFactory.create()
@@ -73,7 +73,7 @@ class UserSelectorsUnitTests(TestCase):
 
         service = UserSelectors(performed_by=u1)
 
-        qs = service.get_users(filters={"name__icontains": "Alice"})
+        qs = service.get_users(filters={"search": "Alice"})
 
         ids = list(qs.values_list("id", flat=True))
         self.assertIn(u1.id, ids)
@@ -86,6 +86,57 @@ class UserSelectorsUnitTests(TestCase):
 
         service = UserSelectors(performed_by=u1)
 
-        qs = service.get_users(filters={"name__icontains": "Charlie"})
+        qs = service.get_users(filters={"search": "Charlie"})
 
         self.assertEqual(qs.count(), 0)
+
+    def test_get_user_by_id_returns_deleted_user_for_admin(self):
+        user = VerifiedUserFactory.create(is_deleted=True)
+
+        fetched = self.service.get_user_by_id(id=user.id)
+
+        self.assertEqual(fetched.id, user.id)
+
+    def test_get_users_excludes_deleted_users(self):
+        deleted_user = VerifiedUserFactory.create(is_deleted=True)
+
+        ids = list(self.service.get_users(filters={}).values_list("id", flat=True))
+
+        self.assertNotIn(deleted_user.id, ids)
+
+    def test_get_users_returns_deleted_users_when_filtered(self):
+        deleted_user = VerifiedUserFactory.create(is_deleted=True)
+
+        ids = list(self.service.get_users(filters={"is_deleted": "true"}).values_list("id", flat=True))
+
+        self.assertListEqual(ids, [deleted_user.id])
+
+    def test_get_users_search_matches_prefixes_case_insensitively(self):
+        user = VerifiedUserFactory.create(name="Karlis", surname="Ozols", email="Karlis.Ozols@example.com")
+        VerifiedUserFactory.create(name="Janis", surname="Kalnins", email="janis.kalnins@example.com")
+
+        for term in ("karlis.oz", "KARLIS OZ", "ozols k"):
+            ids = list(self.service.get_users(filters={"search": term}).values_list("id", flat=True))
+
+            self.assertListEqual(ids, [user.id], term)
+
+    def test_get_users_search_does_not_match_inside_words(self):
+        VerifiedUserFactory.create(name="Karlis", surname="Ozols", email="karlis@example.com")
+
+        self.assertFalse(self.service.get_users(filters={"search": "arlis"}).exists())
+
+    def test_get_users_search_ranks_email_matches_before_name_matches(self):
+        by_name = VerifiedUserFactory.create(name="Anna", surname="Berzina", email="berzina@example.com")
+        by_email = VerifiedUserFactory.create(name="Zane", surname="Liepa", email="anna.liepa@example.com")
+
+        ids = list(self.service.get_users(filters={"search": "anna"}).values_list("id", flat=True))
+
+        self.assertListEqual(ids, [by_email.id, by_name.id])
+
+    def test_get_users_search_ranks_exact_email_first(self):
+        by_prefix = VerifiedUserFactory.create(name="Aiga", surname="Liepa", email="anna@example.com.lv")
+        exact = VerifiedUserFactory.create(name="Zane", surname="Kalna", email="anna@example.com")
+
+        ids = list(self.service.get_users(filters={"search": "anna@example.com"}).values_list("id", flat=True))
+
+        self.assertListEqual(ids, [exact.id, by_prefix.id])
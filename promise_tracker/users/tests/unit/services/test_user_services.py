@@ -136,23 +136,6 @@ class UserServicesUnitTests(TestCase):
         except PermissionViolationError:
             self.fail("_check_is_owner_or_admin() raised PermissionViolationError unexpectedly for admin user!")
 
-    def test_check_user_is_not_deleted_raises_error_when_user_is_deleted(self):
-        user = VerifiedUserFactory.create(is_deleted=True)
-
-        with self.assertRaisesMessage(
-            NotFoundError,
-            str(self.service.NOT_FOUND_MESSAGE),
-        ):
-            self.service._check_user_is_not_deleted(user)
-
-    def test_check_user_is_not_deleted_allows_when_user_is_not_deleted(self):
-        user = VerifiedUserFactory.create(is_deleted=False)
-
-        try:
-            self.service._check_user_is_not_deleted(user)
-        except NotFoundError:
-            self.fail("_check_user_is_not_deleted() raised NotFoundError unexpectedly for non-deleted user!")
-
     def test_check_can_edit_inactive_raises_error_when_performed_by_not_admin(self):
         user = VerifiedUserFactory.create(is_active=False)
 
@@ -283,12 +266,10 @@ class UserServicesUnitTests(TestCase):
     @patch("promise_tracker.users.services.UserService._check_permission_to_create_admin")
     @patch("promise_tracker.users.services.UserService._validate_passwords")
     @patch("promise_tracker.users.services.UserService._check_is_owner_or_admin")
-    @patch("promise_tracker.users.services.UserService._check_user_is_not_deleted")
     @patch("promise_tracker.users.services.UserService._check_can_edit_inactive")
     def test_update_ensures_validations_called(
         self,
         mock_check_can_edit_inactive,
-        mock_check_user_not_deleted,
         mock_check_is_owner_or_admin,
         mock_validate_passwords,
         mock_check_permission_to_create_admin,
@@ -307,7 +288,6 @@ class UserServicesUnitTests(TestCase):
         )
 
         mock_check_is_owner_or_admin.assert_called_once()
-        mock_check_user_not_deleted.assert_called_once()
         mock_check_can_edit_inactive.assert_called_once()
         mock_validate_passwords.assert_called_once_with(
             "short",
@@ -397,12 +377,10 @@ class UserServicesUnitTests(TestCase):
             )
 
     @patch("promise_tracker.users.services.UserService._check_is_owner_or_admin")
-    @patch("promise_tracker.users.services.UserService._check_user_is_not_deleted")
     @patch("promise_tracker.users.services.UserService._check_can_edit_inactive")
     def test_delete_ensures_validations_called(
         self,
         mock_check_can_edit_inactive,
-        mock_check_user_not_deleted,
         mock_check_is_owner_or_admin,
     ):
         user = VerifiedUserFactory.create()
@@ -412,7 +390,6 @@ class UserServicesUnitTests(TestCase):
         )
 
         mock_check_is_owner_or_admin.assert_called_once()
-        mock_check_user_not_deleted.assert_called_once()
         mock_check_can_edit_inactive.assert_called_once()
 
     def test_delete_anonymize_user(self):
@@ -422,7 +399,7 @@ class UserServicesUnitTests(TestCase):
             id=old_user.id,
         )
 
-        user = BaseUser.objects.get(id=old_user.id)
+        user = BaseUser.all_with_deleted.get(id=old_user.id)
 
         self.assertTrue(user.is_deleted)
         self.assertNotEqual(user.name, old_user.name)
@@ -442,7 +419,6 @@ class UserServicesUnitTests(TestCase):
             )
 
     @patch("promise_tracker.users.services.UserService._check_is_owner_or_admin")
-    @patch("promise_tracker.users.services.UserService._check_user_is_not_deleted")
     @patch("promise_tracker.users.services.UserService._check_can_edit_inactive")
     @patch("promise_tracker.users.services.UserService._check_email_sending_delay")
     @patch("promise_tracker.users.services.UserService._check_is_already_verified")
@@ -453,7 +429,6 @@ class UserServicesUnitTests(TestCase):
         mock_check_is_already_verified,
         mock_check_email_sending_delay,
         mock_check_can_edit_inactive,
-        mock_check_user_not_deleted,
         mock_check_is_owner_or_admin,
     ):
         user = UnverifiedUserFactory.create()
@@ -463,7 +438,6 @@ class UserServicesUnitTests(TestCase):
         )
 
         mock_check_is_owner_or_admin.assert_called_once()
-        mock_check_user_not_deleted.assert_called_once()
         mock_check_can_edit_inactive.assert_called_once()
         mock_check_email_sending_delay.assert_called_once()
         mock_check_is_already_verified.assert_called_once()
@@ -483,14 +457,12 @@ class UserServicesUnitTests(TestCase):
             )
 
     @patch("promise_tracker.users.services.UserService._check_is_owner_or_admin")
-    @patch("promise_tracker.users.services.UserService._check_user_is_not_deleted")
     @patch("promise_tracker.users.services.UserService._check_can_edit_inactive")
     @patch("promise_tracker.users.services.UserService._check_is_already_verified")
     def test_verify_ensures_validations_called(
         self,
         mock_check_is_already_verified,
         mock_check_can_edit_inactive,
-        mock_check_user_not_deleted,
         mock_check_is_owner_or_admin,
     ):
         user = UnverifiedUserFactory.create()
@@ -503,7 +475,6 @@ class UserServicesUnitTests(TestCase):
             )
 
         mock_check_is_owner_or_admin.assert_called_once()
-        mock_check_user_not_deleted.assert_called_once()
         mock_check_can_edit_inactive.assert_called_once()
         mock_check_is_already_verified.assert_called_once()
 
@@ -567,19 +538,17 @@ class UserServicesUnitTests(TestCase):
                 action=ModerationAction.BAN,
             )
 
-    @patch("promise_tracker.users.services.UserService._check_user_is_not_deleted")
-    def test_moderate_user_ensures_validations_called(
-        self,
-        mock_check_user_not_deleted,
-    ):
-        user = VerifiedUserFactory.create()
-
-        self.service.moderate_user(
-            id=user.id,
-            action=ModerationAction.BAN,
-        )
+    def test_moderate_user_raises_error_when_user_is_deleted(self):
+        user = VerifiedUserFactory.create(is_deleted=True)
 
-        mock_check_user_not_deleted.assert_called_once()
+        with self.assertRaisesMessage(
+            NotFoundError,
+            str(self.service.NOT_FOUND_MESSAGE),
+        ):
+            self.service.moderate_user(
+                id=user.id,
+                action=ModerationAction.BAN,
+            )
 
     def test_moderate_user_raises_error_when_ban_and_user_is_not_active(self):
         user = VerifiedUserFactory.create(is_active=False)
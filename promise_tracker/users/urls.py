@@ -2,11 +2,13 @@ from django.urls import path
 
 from .views import (
     UserBlockView,
+    UserBulkModerationView,
     UserCreateView,
     UserDeleteView,
     UserDetailView,
     UserEditView,
     UserListView,
+    UserModerationJobDetailView,
     UserResendVerificationView,
     UserUnblockView,
     UserVerifyView,
@@ -24,4 +26,6 @@ urlpatterns = [
     path("resend-verification/", UserResendVerificationView.as_view(), name="resend_verification"),
     path("<uuid:id>/block/", UserBlockView.as_view(), name="block"),
     path("<uuid:id>/unblock/", UserUnblockView.as_view(), name="unblock"),
+    path("moderate/", UserBulkModerationView.as_view(), name="moderate"),
+    path("moderation-jobs/<uuid:id>/", UserModerationJobDetailView.as_view(), name="moderation_job"),
 ]
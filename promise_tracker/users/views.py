@@ -13,6 +13,7 @@ from rolepermissions.checkers import has_role
 from promise_tracker.authentication.services import AuthService
 from promise_tracker.common.mixins import (
     HandleErrorsMixin,
+    NonAtomicReadMixin,
     RoleBasedAccessMixin,
     VerifiedLoginRequiredMixin,
 )
@@ -22,14 +23,16 @@ from promise_tracker.core.exceptions import ApplicationError
 from promise_tracker.core.roles import Administrator, RegisteredUser
 from promise_tracker.users.enums import ModerationAction
 from promise_tracker.users.forms import (
+    UserBulkModerationForm,
     UserCreateAdminForm,
     UserCreateForm,
     UserEditAdminForm,
     UserEditForm,
     UserVerifyForm,
 )
+from promise_tracker.users.models import UserModerationJob
 from promise_tracker.users.selectors import UserFilterSet, UserSelectors
-from promise_tracker.users.services import UserService
+from promise_tracker.users.services import UserBulkModerationService, UserService
 
 
 def _get_create_form(request) -> Type[BaseForm]:
@@ -126,7 +129,7 @@ class UserEditView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, BaseFormVie
         return redirect("users:detail", id=kwargs.get("id"))
 
 
-class UserDetailView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View):
+class UserDetailView(NonAtomicReadMixin, VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View):
     template_name = "users/user_detail.html"
     required_roles = [Administrator, RegisteredUser]
 
@@ -139,7 +142,7 @@ class UserDetailView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErr
         return render(request, self.template_name, {"user": user})
 
 
-class UserListView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View):
+class UserListView(NonAtomicReadMixin, VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View):
     template_name = "users/user_list.html"
     required_roles = [Administrator]
 
@@ -156,7 +159,7 @@ class UserListView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleError
         if is_htmx_request(request):
             return render(request, "users/_users_table.html", context)
 
-        context.update({"filter_form": filter_form})
+        context.update({"filter_form": filter_form, "moderation_actions": UserModerationJob.Action.choices})
         return render(request, self.template_name, context)
 
 
@@ -262,3 +265,43 @@ class UserUnblockView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleEr
         messages.success(request, _("User has been successfully unblocked."))
 
         return redirect("users:detail", id=requested_user_id)
+
+
+class UserBulkModerationView(VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View):
+    required_roles = [Administrator]
+
+    def post(self, request, *args, **kwargs):
+        form = UserBulkModerationForm(request.POST)
+
+        if not form.is_valid():
+            for errors in form.errors.values():
+                for error in errors:
+                    messages.error(request, error)
+
+            return redirect("users:list")
+
+        bulk_moderation_service = UserBulkModerationService(performed_by=request.user)
+        job = bulk_moderation_service.start_job(
+            form.cleaned_data["user_ids"], ModerationAction(form.cleaned_data["action"])
+        )
+
+        messages.success(request, _("Moderation job has been started."))
+
+        return redirect("users:moderation_job", id=job.id)
+
+
+class UserModerationJobDetailView(
+    NonAtomicReadMixin, VerifiedLoginRequiredMixin, RoleBasedAccessMixin, HandleErrorsMixin, View
+):
+    template_name = "users/moderation_job_detail.html"
+    required_roles = [Administrator]
+
+    def get(self, request, *args, **kwargs):
+        user_selectors = UserSelectors(performed_by=request.user)
+        job = user_selectors.get_moderation_job_by_id(kwargs.get("id"))
+
+        # The progress card polls itself until the job has finished
+        if is_htmx_request(request):
+            return render(request, "users/_moderation_job_progress.html", {"job": job})
+
+        return render(request, self.template_name, {"job": job})